@@ -0,0 +1,105 @@
+"""Profile training run for PGO builds of the _core extension"""
+
+import importlib.util
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+CORPUS_SIZE = 4 * 1024 * 1024
+
+
+def load_core(path: Path):
+    """Load the instrumented extension straight from its build location
+
+    Args:
+        path: Path to the built _core shared library
+
+    Returns:
+        The loaded extension module
+    """
+    spec = importlib.util.spec_from_file_location("compresso._core", path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"Cannot load extension from {path}")
+
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def build_corpus() -> list[bytes]:
+    """Build the training inputs
+
+    Files listed in COMPRESSO_PGO_CORPUS (os.pathsep separated) are used when
+    set; otherwise a mix of text-like, repetitive and random data is generated.
+
+    Returns:
+        List of training inputs
+    """
+    paths = os.environ.get("COMPRESSO_PGO_CORPUS")
+    if paths:
+        return [Path(p).read_bytes() for p in paths.split(os.pathsep) if p]
+
+    rng = random.Random(0)
+    words = [b"compress", b"stream", b"buffer", b"level", b"frame", b"block"]
+    text = b" ".join(rng.choice(words) for _ in range(CORPUS_SIZE // 7))
+    pattern = bytes(range(256)) * (CORPUS_SIZE // 256)
+    noise = rng.randbytes(CORPUS_SIZE // 4)
+    return [text[:CORPUS_SIZE], pattern, noise]
+
+
+def train(core, corpus: list[bytes]) -> None:
+    """Exercise every compiled backend through the buffer and file paths
+
+    Args:
+        core: The loaded _core extension
+        corpus: Training inputs
+    """
+    with tempfile.TemporaryDirectory(prefix="compresso-pgo-") as tmp:
+        tmp_dir = Path(tmp)
+
+        for caps in core.get_capabilities():
+            levels = (
+                [caps.min_level]
+                if caps.level_ignored
+                else sorted({caps.min_level, 3, caps.max_level})
+            )
+            levels = [lvl for lvl in levels if caps.min_level <= lvl <= caps.max_level]
+
+            for index, data in enumerate(corpus):
+                for level in levels:
+                    frame = core.compress_bytes(
+                        data, algo=caps.name, strategy="balanced", level=level
+                    )
+                    core.decompress_bytes(frame, algo=caps.name)
+
+                src = tmp_dir / f"input{index}"
+                packed = tmp_dir / f"input{index}.{caps.name}"
+                unpacked = tmp_dir / f"output{index}"
+                src.write_bytes(data)
+                core.compress_file(
+                    str(src), str(packed), caps.name, "balanced", levels[0]
+                )
+                core.decompress_file(str(packed), str(unpacked), caps.name)
+
+        core.release_thread_contexts()
+
+
+def main() -> int:
+    """Run the training workload against the extension given on the command line
+
+    Returns:
+        Process exit code
+    """
+    if len(sys.argv) != 2:
+        print("usage: pgo_train.py <path to built _core>", file=sys.stderr)
+        return 2
+
+    core = load_core(Path(sys.argv[1]))
+    train(core, build_corpus())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,313 @@
 """Setup script for the Compresso package."""
 
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import NamedTuple
+
 from setuptools import Extension, find_packages, setup
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CompileError, LinkError
+
+CSRC = "src/compresso/csrc"
+CODEC_CACHE = Path("build") / "codec_set.json"
+
+
+class Codec(NamedTuple):
+    """An optional codec and how to find and build it"""
+
+    pkg_config: str  # pkg-config module name
+    library: str  # library to link against
+    header: str  # header used by the compile/link probe
+    probe: str  # function used by the compile/link probe
+    sources: list[str]
+
+
+# zlib, libzip and libarchive are always required: gzip, crc32 and the
+# archive formats depend on them. The codecs below are only built when their
+# library is found; the rest are compiled out via COMPRESSO_NO_<CODEC>.
+OPTIONAL_CODECS = {
+    "bzip2": Codec(
+        "bzip2",
+        "bz2",
+        "bzlib.h",
+        "BZ2_bzBuffToBuffCompress",
+        [f"{CSRC}/compression/py_bzip2.c", f"{CSRC}/standalone/bzip2.c"],
+    ),
+    "lzma": Codec(
+        "liblzma",
+        "lzma",
+        "lzma.h",
+        "lzma_easy_buffer_encode",
+        [f"{CSRC}/compression/py_lzma.c", f"{CSRC}/standalone/xz.c"],
+    ),
+    "zstd": Codec(
+        "libzstd",
+        "zstd",
+        "zstd.h",
+        "ZSTD_compress",
+        [f"{CSRC}/compression/py_zstd.c", f"{CSRC}/standalone/zstd.c"],
+    ),
+    "lz4": Codec(
+        "liblz4",
+        "lz4",
+        "lz4frame.h",
+        "LZ4F_compressFrame",
+        [f"{CSRC}/compression/py_lz4.c", f"{CSRC}/standalone/lz4.c"],
+    ),
+    "snappy": Codec(
+        "snappy",
+        "snappy",
+        "snappy-c.h",
+        "snappy_compress",
+        [f"{CSRC}/compression/py_snappy.c"],
+    ),
+}
+
+
+def _pkg_config_exists(module: str) -> bool:
+    """Check whether pkg-config knows about a module
+
+    Args:
+        module: pkg-config module name
+
+    Returns:
+        True if pkg-config can find the module, False otherwise
+    """
+    if shutil.which("pkg-config") is None:
+        return False
+
+    result = subprocess.run(
+        ["pkg-config", "--exists", module], check=False, capture_output=True
+    )
+    return result.returncode == 0
+
+
+def _env_flag(name: str) -> bool:
+    """Check whether a build toggle is switched on in the environment
+
+    Args:
+        name: Environment variable to check
+
+    Returns:
+        True if the variable is set to 1, true or yes
+    """
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes")
+
+
+def _optimisation_flags() -> tuple[list[str], list[str]]:
+    """Compile and link flags for GCC/Clang style compilers
+
+    -O3 lets the compiler auto-vectorise the per-byte loops in the codec glue
+    and -flto inlines across compilation units. Architecture flags change the
+    minimum CPU the build runs on, so they are only added for local builds
+    that opt in with COMPRESSO_NATIVE=1.
+
+    Returns:
+        Tuple of (extra_compile_args, extra_link_args)
+    """
+    compile_args = ["-O3", "-flto"]
+    link_args = ["-flto"]
+
+    if sys.platform.startswith("linux"):
+        compile_args.append("-fno-plt")
+
+    if _env_flag("COMPRESSO_NATIVE"):
+        machine = platform.machine().lower()
+        if machine in ("x86_64", "amd64"):
+            compile_args += ["-march=x86-64-v3", "-mpclmul"]
+        elif machine in ("aarch64", "arm64"):
+            compile_args.append("-march=armv8-a+crc+crypto")
+
+    return compile_args, link_args
+
+
+class BuildExt(build_ext):
+    """build_ext with optimisation flags and an optional two-phase PGO build
+
+    Setting COMPRESSO_PGO=1 builds an instrumented extension, runs
+    scripts/pgo_train.py against it, then rebuilds using the collected
+    profile. Only GCC is supported; other compilers get a normal build.
+    """
+
+    def build_extensions(self) -> None:
+        codecs = self._detect_codecs()
+        for ext in self.extensions:
+            self._configure_codecs(ext, codecs)
+
+        if self.compiler.compiler_type != "unix":
+            super().build_extensions()
+            return
+
+        compile_args, link_args = _optimisation_flags()
+        for ext in self.extensions:
+            ext.extra_compile_args = list(ext.extra_compile_args) + compile_args
+            ext.extra_link_args = list(ext.extra_link_args) + link_args
+
+        if not _env_flag("COMPRESSO_PGO"):
+            super().build_extensions()
+            return
+
+        if self._is_clang():
+            print("COMPRESSO_PGO is only supported with GCC, skipping PGO")
+            super().build_extensions()
+            return
+
+        profile_dir = Path(self.build_temp).resolve() / "pgo"
+        shutil.rmtree(profile_dir, ignore_errors=True)
+
+        self._build_with([f"-fprofile-generate={profile_dir}"])
+        for ext in self.extensions:
+            subprocess.run(
+                [
+                    sys.executable,
+                    "scripts/pgo_train.py",
+                    self.get_ext_fullpath(ext.name),
+                ],
+                check=True,
+            )
+        self._build_with([f"-fprofile-use={profile_dir}", "-fprofile-correction"])
+
+    def _detect_codecs(self) -> list[str]:
+        """Find which optional codecs can be built
+
+        The result is cached in build/codec_set.json, keyed by the mtime of
+        setup.py and the environment that affects detection, so incremental
+        builds skip the probes. Delete the file to force a fresh detection.
+
+        Returns:
+            Names of the optional codecs whose libraries are available
+        """
+        key = {
+            "setup_mtime": os.stat(__file__).st_mtime_ns,
+            "pkg_config_path": os.environ.get("PKG_CONFIG_PATH", ""),
+            "cc": os.environ.get("CC", ""),
+        }
+
+        try:
+            cached = json.loads(CODEC_CACHE.read_text())
+            if cached.get("key") == key:
+                return list(cached["codecs"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        codecs = [
+            name
+            for name, codec in OPTIONAL_CODECS.items()
+            if _pkg_config_exists(codec.pkg_config) or self._probe(codec)
+        ]
+
+        try:
+            CODEC_CACHE.parent.mkdir(parents=True, exist_ok=True)
+            CODEC_CACHE.write_text(json.dumps({"key": key, "codecs": codecs}))
+        except OSError:
+            pass
+
+        return codecs
+
+    def _probe(self, codec: Codec) -> bool:
+        """Check that a codec's header compiles and its library links
+
+        Used when pkg-config is missing or the library ships no .pc file
+        (common for bzip2 and snappy).
+
+        Args:
+            codec: Codec to probe
+
+        Returns:
+            True if the probe program builds, False otherwise
+        """
+        ext = self.extensions[0]
+        with tempfile.TemporaryDirectory(prefix="compresso-probe-") as tmp:
+            source = Path(tmp) / "probe.c"
+            source.write_text(
+                f"#include <{codec.header}>\n"
+                f"int main(void) {{ return {codec.probe} == 0; }}\n"
+            )
+            try:
+                objects = self.compiler.compile(
+                    [str(source)], output_dir=tmp, include_dirs=ext.include_dirs
+                )
+                self.compiler.link_executable(
+                    objects,
+                    "probe",
+                    output_dir=tmp,
+                    libraries=[codec.library],
+                    library_dirs=ext.library_dirs,
+                )
+            except (CompileError, LinkError):
+                return False
+
+        return True
+
+    @staticmethod
+    def _configure_codecs(ext: Extension, codecs: list[str]) -> None:
+        """Add the sources and libraries of the detected codecs to an extension
+
+        Args:
+            ext: Extension to configure
+            codecs: Names of the optional codecs to build
+        """
+        for name, codec in OPTIONAL_CODECS.items():
+            if name in codecs:
+                ext.sources += codec.sources
+                ext.libraries.append(codec.library)
+            else:
+                ext.define_macros.append((f"COMPRESSO_NO_{name.upper()}", "1"))
+
+        print(f"compresso: building codecs zlib, {', '.join(codecs)}")
+
+    def _build_with(self, flags: list[str]) -> None:
+        """Rebuild every extension from scratch with extra compile/link flags
+
+        Args:
+            flags: Flags added to both the compile and link steps
+        """
+        saved = [
+            (ext.extra_compile_args, ext.extra_link_args) for ext in self.extensions
+        ]
+        for ext in self.extensions:
+            ext.extra_compile_args = ext.extra_compile_args + flags
+            ext.extra_link_args = ext.extra_link_args + flags
+
+        self.force = True
+        try:
+            super().build_extensions()
+        finally:
+            for ext, (compile_args, link_args) in zip(self.extensions, saved):
+                ext.extra_compile_args = compile_args
+                ext.extra_link_args = link_args
+
+    def _is_clang(self) -> bool:
+        """Check whether the configured C compiler is Clang
+
+        Returns:
+            True if the compiler identifies itself as Clang
+        """
+        try:
+            result = subprocess.run(
+                [self.compiler.compiler_so[0], "--version"],
+                check=False,
+                capture_output=True,
+                text=True,
+            )
+        except OSError:
+            return False
+        return "clang" in result.stdout.lower()
+
+
+define_macros = []
+libraries = ["z", "zip", "archive"]
+
+# Batched io_uring reads for large inputs, enabled at runtime by COMPRESSO_URING=1
+if _pkg_config_exists("liburing"):
+    define_macros.append(("COMPRESSO_HAVE_LIBURING", "1"))
+    libraries.append("uring")
 
 setup(
     name="compresso",
@@ -9,31 +316,26 @@ setup(
     ext_modules=[
         Extension(
             name="compresso._core",
+            # Optional codec sources are added by BuildExt once detected
             sources=[
-                "src/compresso/csrc/_core.c",
-                "src/compresso/csrc/compress.c",
-                "src/compresso/csrc/format.c",
-                "src/compresso/csrc/registry.c",
-                "src/compresso/csrc/strategy.c",
-                "src/compresso/csrc/archives.c",
-                "src/compresso/csrc/validate.c",
-                # Compression algorithms
-                "src/compresso/csrc/compression/py_zlib.c",
-                "src/compresso/csrc/compression/py_bzip2.c",
-                "src/compresso/csrc/compression/py_lzma.c",
-                "src/compresso/csrc/compression/py_zstd.c",
-                "src/compresso/csrc/compression/py_lz4.c",
-                "src/compresso/csrc/compression/py_snappy.c",
+                f"{CSRC}/_core.c",
+                f"{CSRC}/compress.c",
+                f"{CSRC}/format.c",
+                f"{CSRC}/registry.c",
+                f"{CSRC}/strategy.c",
+                f"{CSRC}/archives.c",
+                f"{CSRC}/validate.c",
+                f"{CSRC}/fileio.c",
+                f"{CSRC}/crc32_hw.c",
+                f"{CSRC}/parallel.c",
+                f"{CSRC}/unavailable.c",
+                f"{CSRC}/compression/py_zlib.c",
                 # Archive backends
-                "src/compresso/csrc/archives/tar.c",
-                "src/compresso/csrc/archives/zip.c",
+                f"{CSRC}/archives/tar.c",
+                f"{CSRC}/archives/zip.c",
                 # Standalone formats
-                "src/compresso/csrc/standalone/gzip.c",
-                "src/compresso/csrc/standalone/bzip2.c",
-                "src/compresso/csrc/standalone/xz.c",
-                "src/compresso/csrc/standalone/zstd.c",
-                "src/compresso/csrc/standalone/lz4.c",
-                "src/compresso/csrc/standalone/registry.c",
+                f"{CSRC}/standalone/gzip.c",
+                f"{CSRC}/standalone/registry.c",
             ],
             include_dirs=[
                 "/usr/local/opt/libarchive/include",
@@ -42,8 +344,10 @@ setup(
             library_dirs=[
                 "/usr/local/opt/libarchive/lib",
             ],
-            libraries=["z", "bz2", "lzma", "zstd", "lz4", "snappy", "zip", "archive"],
+            define_macros=define_macros,
+            libraries=libraries,
         )
     ],
+    cmdclass={"build_ext": BuildExt},
     python_requires=">=3.9",
 )
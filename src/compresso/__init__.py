@@ -1,29 +1,12 @@
 """Initialise the compressor package."""
 
-from ._core import BackendError, Error, HeaderError, compress_file, decompress_file
-from .backend.benchmark import benchmark_file, print_results
-from .backend.capabilities import list_capabilities
-from .backend.file_inspect import InspectResult, inspect
-from .backend.speeds import get_estimated_speeds
-from .frontend.api import (
-    CompressionJob,
-    CompressionOptions,
-    CompressionPlan,
-    DecompressionJob,
-    DecompressionPlan,
-)
-from .frontend.archive_api import (
-    ArchiveEntry,
-    ArchiveJob,
-    ArchiveOptions,
-    ArchivePlan,
-    ExtractJob,
-    ExtractPlan,
-)
+from typing import TYPE_CHECKING
 
 __all__: list[str] = [
     "compress_file",
     "decompress_file",
+    "compress_bytes",
+    "decompress_bytes",
     "Error",
     "HeaderError",
     "BackendError",
@@ -31,6 +14,7 @@ __all__: list[str] = [
     "print_results",
     "list_capabilities",
     "inspect",
+    "inspect_many",
     "InspectResult",
     "get_estimated_speeds",
     "CompressionOptions",
@@ -45,3 +29,92 @@ __all__: list[str] = [
     "ArchiveJob",
     "ExtractJob",
 ]
+
+# Submodule providing each export; resolved on first access (PEP 562) so that
+# importing the package, or a subpackage such as compresso.frontend, does not
+# load the C extension or every API module up front
+_EXPORTS: dict[str, str] = {
+    "compress_file": "._core",
+    "decompress_file": "._core",
+    "compress_bytes": "._core",
+    "decompress_bytes": "._core",
+    "Error": "._core",
+    "HeaderError": "._core",
+    "BackendError": "._core",
+    "benchmark_file": ".backend.benchmark",
+    "print_results": ".backend.benchmark",
+    "list_capabilities": ".backend.capabilities",
+    "inspect": ".backend.file_inspect",
+    "inspect_many": ".backend.file_inspect",
+    "InspectResult": ".backend.file_inspect",
+    "get_estimated_speeds": ".backend.speeds",
+    "CompressionOptions": ".frontend.api",
+    "CompressionPlan": ".frontend.api",
+    "DecompressionPlan": ".frontend.api",
+    "CompressionJob": ".frontend.api",
+    "DecompressionJob": ".frontend.api",
+    "ArchiveOptions": ".frontend.archive_api",
+    "ArchivePlan": ".frontend.archive_api",
+    "ExtractPlan": ".frontend.archive_api",
+    "ArchiveEntry": ".frontend.archive_api",
+    "ArchiveJob": ".frontend.archive_api",
+    "ExtractJob": ".frontend.archive_api",
+}
+
+if TYPE_CHECKING:
+    from ._core import (
+        BackendError,
+        Error,
+        HeaderError,
+        compress_bytes,
+        compress_file,
+        decompress_bytes,
+        decompress_file,
+    )
+    from .backend.benchmark import benchmark_file, print_results
+    from .backend.capabilities import list_capabilities
+    from .backend.file_inspect import InspectResult, inspect, inspect_many
+    from .backend.speeds import get_estimated_speeds
+    from .frontend.api import (
+        CompressionJob,
+        CompressionOptions,
+        CompressionPlan,
+        DecompressionJob,
+        DecompressionPlan,
+    )
+    from .frontend.archive_api import (
+        ArchiveEntry,
+        ArchiveJob,
+        ArchiveOptions,
+        ArchivePlan,
+        ExtractJob,
+        ExtractPlan,
+    )
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported name from its submodule on first use
+
+    Args:
+        name: Attribute being looked up on the package.
+
+    Returns:
+        The exported object, cached on the package for later lookups.
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package attributes, including exports not yet imported"""
+    return sorted(set(globals()) | set(__all__))
@@ -15,6 +15,24 @@ class BackendError(Error):
 
     pass
 
+class BackendCapabilities(tuple[str, int, bool, bool, int, int, bool]):
+    """Capability information for a compiled compression backend."""
+
+    @property
+    def name(self) -> str: ...
+    @property
+    def id(self) -> int: ...
+    @property
+    def has_buffer(self) -> bool: ...
+    @property
+    def has_stream(self) -> bool: ...
+    @property
+    def min_level(self) -> int: ...
+    @property
+    def max_level(self) -> int: ...
+    @property
+    def level_ignored(self) -> bool: ...
+
 def compress_file(
     src_path: str,
     dst_path: str,
@@ -33,8 +51,36 @@ def decompress_file(
     """Decompress a file."""
     ...
 
-def get_capabilities() -> list[tuple[str, int, bool, bool]]:
-    """Get list of available compression backends."""
+def compress_bytes(
+    data: bytes | bytearray | memoryview,
+    algo: str = ...,
+    strategy: str = ...,
+    level: int = ...,
+) -> bytes:
+    """Compress an in-memory buffer into a Compresso frame."""
+    ...
+
+def decompress_bytes(
+    data: bytes | bytearray | memoryview,
+    algo: str = ...,
+) -> bytes:
+    """Decompress a Compresso frame produced by compress_bytes."""
+    ...
+
+def release_thread_contexts() -> None:
+    """Free the codec contexts cached for the calling thread."""
+    ...
+
+def set_max_threads(n: int) -> None:
+    """Cap the threads a codec may use per call; values below 1 restore the CPU count."""
+    ...
+
+def get_max_threads() -> int:
+    """Get the current cap on threads a codec may use per call."""
+    ...
+
+def get_capabilities() -> tuple[BackendCapabilities, ...]:
+    """Get the capabilities of all compiled compression backends."""
     ...
 
 def get_default_backend_for_strategy(strategy: str) -> str:
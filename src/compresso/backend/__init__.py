@@ -1,15 +1,36 @@
 """Compresso Backend API"""
 
-from .benchmark import benchmark_file, print_results
+from typing import TYPE_CHECKING
+
 from .capabilities import list_capabilities
-from .file_inspect import InspectResult, inspect
+from .file_inspect import InspectResult, inspect, inspect_many
 from .speeds import get_estimated_speeds
 
+if TYPE_CHECKING:
+    from .benchmark import benchmark_file, print_results
+
 __all__: list[str] = [
     "benchmark_file",
     "print_results",
     "list_capabilities",
     "inspect",
+    "inspect_many",
     "InspectResult",
     "get_estimated_speeds",
 ]
+
+_BENCHMARK_EXPORTS: frozenset[str] = frozenset({"benchmark_file", "print_results"})
+
+
+def __getattr__(name: str) -> object:
+    """Import the benchmark helpers on first use (PEP 562)
+
+    The benchmark module pulls in multiprocessing and concurrent.futures, which
+    most callers never need.
+    """
+    if name in _BENCHMARK_EXPORTS:
+        from . import benchmark
+
+        return getattr(benchmark, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
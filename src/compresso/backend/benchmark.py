@@ -2,18 +2,69 @@
 
 from __future__ import annotations
 
+import multiprocessing
 import os
 import tempfile
 import time
-from dataclasses import dataclass
+from collections.abc import Iterable
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, replace
+from multiprocessing.queues import Queue
 from pathlib import Path
-from typing import Iterable
-
-from tabulate import tabulate
-
-from .._core import compress_file, decompress_file
+from queue import Empty
+from stat import S_ISREG
+
+from .._core import (
+    compress_bytes,
+    compress_file,
+    decompress_bytes,
+    decompress_file,
+    release_thread_contexts,
+    set_max_threads,
+)
+from .capabilities import get_by_name
 from .speeds import update_from_benchmarks
 
+_MODES: tuple[str, ...] = ("memory", "file")
+
+# Sweep used when the caller does not narrow it down
+_DEFAULT_ALGOS: tuple[str, ...] = ("zlib", "bzip2", "lzma", "zstd", "lz4", "snappy")
+_DEFAULT_STRATEGIES: tuple[str, ...] = ("fast", "balanced", "max_ratio")
+_DEFAULT_LEVELS: tuple[int | None, ...] = (None, 1, 3, 6, 9)
+
+# Fixed-width results table: text columns sized for the known codec and
+# strategy names, numeric columns at least 12 wide
+_TABLE_HEADERS: tuple[str, ...] = (
+    "Algo",
+    "Strategy",
+    "Level",
+    "Comp Time (s)",
+    "Decomp Time (s)",
+    "MB/s (Comp)",
+    "MB/s (Decomp)",
+    "Ratio (comp/orig)",
+)
+_TABLE_SPECS: tuple[str, ...] = ("<", "<", ">", ">.4f", ">.4f", ">.2f", ">.2f", ">.3f")
+_TABLE_WIDTHS: tuple[int, ...] = (8, 10, 5) + tuple(
+    max(len(header), 12) for header in _TABLE_HEADERS[3:]
+)
+_TABLE_ROW: str = (
+    "| "
+    + " | ".join(
+        f"{{:{spec[0]}{width}{spec[1:]}}}"
+        for spec, width in zip(_TABLE_SPECS, _TABLE_WIDTHS)
+    )
+    + " |"
+)
+_TABLE_HEADER: str = (
+    "| "
+    + " | ".join(
+        f"{header:<{width}}" for header, width in zip(_TABLE_HEADERS, _TABLE_WIDTHS)
+    )
+    + " |"
+)
+_TABLE_RULE: str = "+" + "+".join("-" * (width + 2) for width in _TABLE_WIDTHS) + "+"
+
 
 # C extension wrappers for compression and decompression
 def compress(
@@ -131,6 +182,275 @@ def _safe_unlink(path: Path) -> None:
         pass
 
 
+def _pin_worker(cpu_queue: Queue) -> None:
+    """Pin the current worker process to a single CPU
+
+    Each worker takes one CPU id from the shared queue so that timings are not
+    disturbed by the scheduler migrating the process between cores. Codecs are
+    limited to one thread as well, so workers do not oversubscribe the machine
+    with codec threads stacked on their pinned CPUs.
+
+    Args:
+        cpu_queue: Queue of CPU ids to hand out, one per worker
+    """
+    set_max_threads(1)
+
+    if not hasattr(os, "sched_setaffinity"):
+        return
+
+    try:
+        cpu: int = cpu_queue.get_nowait()
+        os.sched_setaffinity(0, {cpu})
+
+    except (Empty, OSError):
+        pass
+
+
+def _available_cpus() -> list[int]:
+    """List the CPUs this process is allowed to run on
+
+    Returns:
+        Sorted list of CPU ids
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+
+    return list(range(os.cpu_count() or 1))
+
+
+def _run_one_memory(
+    data: bytes,
+    algo: str,
+    strategy: str,
+    level: int | None,
+    repeats: int,
+) -> tuple[list[int], list[int], int]:
+    """Time an in-memory compress/decompress round-trip
+
+    Args:
+        data: Contents of the source file
+        algo: Compression algorithm to use
+        strategy: Compression strategy to use
+        level: Compression level to use
+        repeats: Number of times to repeat the round-trip
+
+    Returns:
+        Compression times and decompression times (in nanoseconds), and the
+        compressed size
+    """
+    lvl: int = -1 if level is None else int(level)
+    comp_times: list[int] = []
+    decomp_times: list[int] = []
+    compressed_size: int | None = None
+
+    for _ in range(repeats):
+        start_ns: int = time.perf_counter_ns()
+        comp: bytes = compress_bytes(
+            data, algo=algo or "", strategy=strategy or "", level=lvl
+        )
+        comp_times.append(time.perf_counter_ns() - start_ns)
+
+        sz: int = len(comp)
+        if compressed_size is not None and sz != compressed_size:
+            print(
+                f"Warning: Compressed size changed between runs: {compressed_size} vs {sz}"
+            )
+        compressed_size = sz
+
+        start_ns: int = time.perf_counter_ns()
+        decomp: bytes = decompress_bytes(comp)
+        decomp_times.append(time.perf_counter_ns() - start_ns)
+
+        if len(decomp) != len(data):
+            print(
+                f"Warning: Decompressed size mismatch for {algo}/{strategy}/{level}: "
+                f"{len(decomp)} vs {len(data)}"
+            )
+
+    return comp_times, decomp_times, compressed_size or 0
+
+
+def _run_one_file(
+    src: Path,
+    algo: str,
+    strategy: str,
+    level: int | None,
+    repeats: int,
+    temp_base: Path,
+    input_size: int,
+) -> tuple[list[int], list[int], int]:
+    """Time an end-to-end compress/decompress round-trip through temp files
+
+    Args:
+        src: Path to the source file to benchmark
+        algo: Compression algorithm to use
+        strategy: Compression strategy to use
+        level: Compression level to use
+        repeats: Number of times to repeat the round-trip
+        temp_base: Directory to use for temporary files
+        input_size: Size of the source file (in bytes)
+
+    Returns:
+        Compression times and decompression times (in nanoseconds), and the
+        compressed size
+    """
+    comp_times: list[int] = []
+    decomp_times: list[int] = []
+    compressed_size: int | None = None
+
+    # One pair of scratch files per combination, reused across repeats; the
+    # C writers open their output with "wb", which truncates it each time
+    comp_fd, comp_name = tempfile.mkstemp(suffix=".comp", dir=temp_base)
+    os.close(comp_fd)
+    decomp_fd, decomp_name = tempfile.mkstemp(suffix=".decomp", dir=temp_base)
+    os.close(decomp_fd)
+
+    comp_path = Path(comp_name)
+    decomp_path = Path(decomp_name)
+    src_name: str = str(object=src)
+
+    try:
+        for _ in range(repeats):
+            # Compression
+            start_ns: int = time.perf_counter_ns()
+            compress(
+                src_path=src_name,
+                dest_path=comp_name,
+                algo=algo,
+                strategy=strategy,
+                level=level,
+            )
+            comp_times.append(time.perf_counter_ns() - start_ns)
+
+            sz: int = comp_path.stat().st_size
+            if compressed_size is not None and sz != compressed_size:
+                print(
+                    f"Warning: Compressed size changed between runs: {compressed_size} vs {sz}"
+                )
+            compressed_size = sz
+
+            # Decompression
+            start_ns: int = time.perf_counter_ns()
+            decompress(src_path=comp_name, dest_path=decomp_name)
+            decomp_times.append(time.perf_counter_ns() - start_ns)
+
+            # Verify
+            if decomp_path.stat().st_size != input_size:
+                print(f"Warning: Decompressed file size mismatch for {decomp_path}")
+
+    finally:
+        _safe_unlink(path=comp_path)
+        _safe_unlink(path=decomp_path)
+
+    return comp_times, decomp_times, compressed_size or 0
+
+
+def _run_one(
+    src: Path,
+    algo: str,
+    strategy: str,
+    level: int | None,
+    repeats: int,
+    temp_base: Path,
+    input_size: int,
+    mode: str = "memory",
+    data: bytes | None = None,
+) -> BenchmarkResult:
+    """Benchmark a single (algo, strategy, level) combination
+
+    Args:
+        src: Path to the source file to benchmark
+        algo: Compression algorithm to use
+        strategy: Compression strategy to use
+        level: Compression level to use
+        repeats: Number of times to repeat the benchmark for averaging
+        temp_base: Directory to use for temporary files
+        input_size: Size of the source file (in bytes)
+        mode: "memory" to time the codec on in-memory buffers, "file" to time
+            the full file round-trip
+        data: Contents of the source file already read by the caller; in
+            memory mode the file is read here when None
+
+    Returns:
+        BenchmarkResult with the averaged timings
+    """
+    if mode == "memory":
+        comp_times, decomp_times, compressed_size = _run_one_memory(
+            src.read_bytes() if data is None else data,
+            algo,
+            strategy,
+            level,
+            repeats,
+        )
+
+    else:
+        comp_times, decomp_times, compressed_size = _run_one_file(
+            src, algo, strategy, level, repeats, temp_base, input_size
+        )
+
+    # Timings are summed as exact integer nanoseconds and converted to
+    # seconds once per combination
+    scale: float = repeats * 1e9
+    avg_comp_time: float = sum(comp_times) / scale
+    avg_decomp_time: float = sum(decomp_times) / scale
+
+    return BenchmarkResult(
+        algo=algo,
+        strategy=strategy,
+        level=level,
+        compress_time=avg_comp_time,
+        decompress_time=avg_decomp_time,
+        input_size=input_size,
+        compressed_size=compressed_size,
+    )
+
+
+def _plan_runs(
+    algos: Iterable[str],
+    strategies: Iterable[str],
+    levels: Iterable[int | None],
+) -> tuple[list[tuple[str, str, int | None]], list[int]]:
+    """Plan the sweep, dropping combinations that cannot differ
+
+    Levels a backend does not accept are skipped, and backends that ignore the
+    level only run with the default. With an explicit algorithm the strategy
+    does not reach the codec, so strategies that share an (algo, level) pair
+    share a single run. Unknown algorithms are left as-is so they fail loudly.
+
+    Args:
+        algos: Algorithms to benchmark
+        strategies: Strategies to benchmark
+        levels: Compression levels to benchmark
+
+    Returns:
+        The (algo, strategy, level) combinations in sweep order, and for each
+        one the index of the unique run that measures it
+    """
+    strategy_list: list[str] = list(strategies)
+    level_list: list[int | None] = list(levels)
+
+    combos: list[tuple[str, str, int | None]] = []
+    run_index: list[int] = []
+    runs: dict[tuple[str, int | None], int] = {}
+
+    for algo in algos:
+        cap = get_by_name(algo)
+        algo_levels: list[int | None] = level_list
+        if cap is not None:
+            algo_levels = (
+                [None]
+                if cap.level_ignored
+                else [level for level in level_list if cap.accepts_level(level)]
+            )
+
+        for strategy in strategy_list:
+            for level in algo_levels:
+                combos.append((algo, strategy, level))
+                run_index.append(runs.setdefault((algo, level), len(runs)))
+
+    return combos, run_index
+
+
 def benchmark_file(
     src: str | Path,
     *,
@@ -140,9 +460,26 @@ def benchmark_file(
     repeats: int = 1,
     temp_dir: str | Path | None = None,
     update_cache: bool = False,
+    max_workers: int | None = 1,
+    mode: str = "memory",
 ) -> list[BenchmarkResult]:
     """Benchmark compression and decompression on a single file
 
+    Combinations run serially by default so that each timing has the machine
+    to itself. Every (algo, strategy, level) combination is independent, so
+    they can instead be dispatched to a process pool of pinned workers, one
+    per CPU when ``max_workers`` is None or exactly ``max_workers``
+    otherwise; this finishes sooner but concurrent runs compete for memory
+    bandwidth and shared caches. Levels a backend does not accept are
+    skipped, and strategies that map to the same codec setting are measured
+    once and reported for each strategy.
+
+    By default the source is read into memory (once per sweep when serial,
+    once per combination in a pool worker) and only the in-memory codec
+    round-trip is timed, so results reflect codec throughput rather than
+    filesystem overhead. Use ``mode="file"`` to time the end-to-end file
+    round-trip instead.
+
     Args:
         src: Path to the source file to benchmark
         algos: List of algorithms to benchmark. If None, all available algorithms are used.
@@ -150,137 +487,154 @@ def benchmark_file(
         levels: List of compression levels to benchmark. If None, default levels are used.
         repeats: Number of times to repeat each benchmark for averaging
         temp_dir: Directory to use for temporary files. If None, system temp directory is used.
+        update_cache: Whether to update the speed estimates cache with the results.
+            With more than one worker the cached speeds were measured under
+            contention and may understate single-run throughput.
+        max_workers: Number of worker processes. Defaults to 1, running the
+            sweep serially in-process; None uses one worker per available CPU.
+        mode: "memory" (default) to time in-memory buffers, or "file" to time
+            compression through temporary files
 
     Returns:
-        List of BenchmarkResult objects with the results
+        List of BenchmarkResult objects with the results, in sweep order
     """
     src = Path(src)
-    if not src.is_file():
+    try:
+        st: os.stat_result | None = os.stat(src)
+
+    except OSError:
+        st = None
+
+    if st is None or not S_ISREG(st.st_mode):
         raise FileNotFoundError(f"Source file {src} does not exist or is not a file")
 
+    if max_workers is not None and max_workers < 1:
+        raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+    if mode not in _MODES:
+        raise ValueError(
+            f"Unknown benchmark mode: {mode}. Expected one of: {', '.join(_MODES)}"
+        )
+
     if temp_dir is None:
         temp_dir = Path(os.getenv(key="TMPDIR", default="/tmp"))
 
     if algos is None:
-        algos: list[str] = ["zlib", "bzip2", "lzma", "zstd", "lz4", "snappy"]
+        # Codecs left out of this build would only fail every run
+        algos = tuple(a for a in _DEFAULT_ALGOS if get_by_name(a) is not None)
 
     if strategies is None:
-        strategies: list[str] = ["fast", "balanced", "max_ratio"]
+        strategies = _DEFAULT_STRATEGIES
 
     if levels is None:
-        levels: list[int | None] = [None, 1, 3, 6, 9]
+        levels = _DEFAULT_LEVELS
 
     temp_base: Path = Path(temp_dir) if temp_dir else src.parent
-    input_size: int = src.stat().st_size
-
-    results: list[BenchmarkResult] = []
-
-    for algo in algos:
-        for strategy in strategies:
-            for level in levels:
-                comp_times: list[float] = []
-                decomp_times: list[float] = []
-                compressed_size: int | None = None
-
-                for _ in range(repeats):
-                    with (
-                        tempfile.NamedTemporaryFile(
-                            suffix=".comp", dir=temp_base, delete=False
-                        ) as comp_file,
-                        tempfile.NamedTemporaryFile(
-                            suffix=".decomp", dir=temp_base, delete=False
-                        ) as decomp_file,
-                    ):
-                        comp_path = Path(comp_file.name)
-                        decomp_path = Path(decomp_file.name)
-
-                        # Compression
-                        start_time: float = time.perf_counter()
-                        compress(
-                            src_path=str(object=src),
-                            dest_path=str(object=comp_path),
-                            algo=algo,
-                            strategy=strategy,
-                            level=level,
-                        )
-                        comp_times.append(time.perf_counter() - start_time)
-
-                        if compressed_size is None:
-                            compressed_size: int = comp_path.stat().st_size
-
-                        else:
-                            sz: int = comp_path.stat().st_size
-                            if sz != compressed_size:
-                                print(
-                                    f"Warning: Compressed size changed between runs: {compressed_size} vs {sz}"
-                                )
-                                compressed_size: int = sz
-
-                        # Decompression
-                        start_time: float = time.perf_counter()
-                        decompress(
-                            src_path=str(object=comp_path),
-                            dest_path=str(object=decomp_path),
-                        )
-                        decomp_times.append(time.perf_counter() - start_time)
-
-                        # Verify
-                        if (
-                            not decomp_path.is_file()
-                            or decomp_path.stat().st_size != input_size
-                        ):
-                            print(
-                                f"Warning: Decompressed file size mismatch for {decomp_path}"
-                            )
-
-                        _safe_unlink(path=comp_path)
-                        _safe_unlink(path=decomp_path)
-
-                avg_comp_time: float = sum(comp_times) / repeats
-                avg_decomp_time: float = sum(decomp_times) / repeats
-
-                results.append(
-                    BenchmarkResult(
-                        algo=algo,
-                        strategy=strategy,
-                        level=level,
-                        compress_time=avg_comp_time,
-                        decompress_time=avg_decomp_time,
-                        input_size=input_size,
-                        compressed_size=compressed_size or 0,
-                    )
+    input_size: int = st.st_size
+
+    combos, run_index = _plan_runs(algos, strategies, levels)
+
+    # One representative combination per unique run, in first-seen order
+    runs: list[tuple[str, str, int | None]] = []
+    for combo, index in zip(combos, run_index):
+        if index == len(runs):
+            runs.append(combo)
+
+    cpus: list[int] = _available_cpus()
+    workers: int = min(max_workers or len(cpus), len(runs)) or 1
+
+    run_results: list[BenchmarkResult | None] = [None] * len(runs)
+
+    if workers == 1:
+        data: bytes | None = src.read_bytes() if mode == "memory" else None
+        try:
+            for i, (algo, strategy, level) in enumerate(runs):
+                run_results[i] = _run_one(
+                    src,
+                    algo,
+                    strategy,
+                    level,
+                    repeats,
+                    temp_base,
+                    input_size,
+                    mode,
+                    data,
                 )
 
+        finally:
+            # Codec contexts are cached per thread for reuse across runs;
+            # pool workers free theirs on exit, the serial path does it here
+            release_thread_contexts()
+
+    else:
+        ctx = multiprocessing.get_context()
+        cpu_queue: Queue = ctx.Queue()
+        for cpu in cpus:
+            cpu_queue.put(cpu)
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=ctx,
+            initializer=_pin_worker,
+            initargs=(cpu_queue,),
+        ) as executor:
+            futures: dict[Future[BenchmarkResult], int] = {
+                executor.submit(
+                    _run_one,
+                    src,
+                    algo,
+                    strategy,
+                    level,
+                    repeats,
+                    temp_base,
+                    input_size,
+                    mode,
+                ): i
+                for i, (algo, strategy, level) in enumerate(runs)
+            }
+
+            for future in as_completed(futures):
+                run_results[futures[future]] = future.result()
+
+    # Fan shared runs back out to every strategy that aliases them
+    ordered: list[BenchmarkResult] = []
+    for (_, strategy, _), index in zip(combos, run_index):
+        result: BenchmarkResult | None = run_results[index]
+        if result is None:
+            continue
+
+        ordered.append(
+            result
+            if result.strategy == strategy
+            else replace(result, strategy=strategy)
+        )
+
     if update_cache:
-        update_from_benchmarks(results)
+        # Pool timings are recorded as measured, contention included; the
+        # serial default is what keeps cached speeds representative.
+        # Each measurement counts once, however many strategies it stands for
+        update_from_benchmarks(r for r in run_results if r is not None)
 
-    return results
+    return ordered
 
 
-def print_results(results: list[BenchmarkResult]) -> None:
-    """Print benchmark results in a tabular format
+def _print_pretty(results: list[BenchmarkResult]) -> bool:
+    """Print benchmark results as a tabulate grid
 
     Args:
         results: List of BenchmarkResult objects to print
+
+    Returns:
+        False if tabulate is not installed, True otherwise
     """
-    if not results:
-        print("No results to display.")
-        return
+    try:
+        from tabulate import tabulate
 
-    headers: list[str] = [
-        "Algo",
-        "Strategy",
-        "Level",
-        "Comp Time (s)",
-        "Decomp Time (s)",
-        "MB/s (Comp)",
-        "MB/s (Decomp)",
-        "Ratio (comp/orig)",
-    ]
+    except ImportError:
+        return False
 
-    table_data: list[list[str | int]] = []
-    for r in results:
-        row: list[str | int] = [
+    table_data: list[list[str | int]] = [
+        [
             r.algo,
             r.strategy,
             r.level if r.level is not None else "auto",
@@ -290,6 +644,43 @@ def print_results(results: list[BenchmarkResult]) -> None:
             f"{r.decomp_mb_s:.2f}",
             f"{r.ratio:.3f}",
         ]
-        table_data.append(row)
+        for r in results
+    ]
+
+    print(
+        tabulate(tabular_data=table_data, headers=list(_TABLE_HEADERS), tablefmt="grid")
+    )
+    return True
+
+
+def print_results(results: list[BenchmarkResult], *, pretty: bool = False) -> None:
+    """Print benchmark results in a tabular format
+
+    Args:
+        results: List of BenchmarkResult objects to print
+        pretty: Render a tabulate grid instead of the fixed-width table, when
+            tabulate is installed
+    """
+    if not results:
+        print("No results to display.")
+        return
+
+    if pretty and _print_pretty(results=results):
+        return
+
+    row: str = _TABLE_ROW
+    body: str = "\n".join(
+        row.format(
+            r.algo,
+            r.strategy,
+            r.level if r.level is not None else "auto",
+            r.compress_time,
+            r.decompress_time,
+            r.comp_mb_s,
+            r.decomp_mb_s,
+            r.ratio,
+        )
+        for r in results
+    )
 
-    print(tabulate(tabular_data=table_data, headers=headers, tablefmt="grid"))
+    print(f"{_TABLE_RULE}\n{_TABLE_HEADER}\n{_TABLE_RULE}\n{body}\n{_TABLE_RULE}")
@@ -7,7 +7,11 @@ from dataclasses import dataclass
 from .. import _core
 
 
-@dataclass(frozen=True)
+# Kept as a dataclass rather than re-exporting _core.BackendCapabilities: the
+# struct sequence cannot carry accepts_level()/is_available() or keyword
+# defaults, and conversion happens once per process when the cache is filled.
+# Field order must match capability_fields in csrc/registry.c.
+@dataclass(frozen=True, slots=True)
 class BackendCapabilities:
     """Holds the capability information for a compression backend
 
@@ -16,12 +20,29 @@ class BackendCapabilities:
         id: Algorithm ID.
         has_buffer: Whether the backend has a buffer.
         has_stream: Whether the backend supports streaming compression/decompression.
+        min_level: Lowest compression level the backend accepts.
+        max_level: Highest compression level the backend accepts.
+        level_ignored: Whether the backend ignores the compression level.
     """
 
     name: str
     id: int
     has_buffer: bool
     has_stream: bool
+    min_level: int = 0
+    max_level: int = 9
+    level_ignored: bool = False
+
+    def accepts_level(self, level: int | None) -> bool:
+        """Check whether a compression level means something to this backend
+
+        Args:
+            level: Compression level, or None for the backend default.
+
+        Returns:
+            bool: True if the level is None or within the backend's range.
+        """
+        return level is None or self.min_level <= level <= self.max_level
 
     def is_available(self) -> bool:
         """Check if the backend is available for use
@@ -41,34 +62,14 @@ _cap_by_id: dict[int, BackendCapabilities] | None = None
 def _load_capabilities() -> None:
     """Load capabilities from the compressor module"""
     global _cap_list, _cap_by_name, _cap_by_id
-    raw: list[tuple[str, int, bool, bool]] = _core.get_capabilities()
-    caps: list[BackendCapabilities] = []
-    by_name: dict[str, BackendCapabilities] = {}
-    by_id: dict[int, BackendCapabilities] = {}
-
-    for item in raw:
-        if not isinstance(item, dict):
-            continue
-
-        name = str(object=item.get("name", ""))
-        cid = int(item.get("id", -1))
-        has_buffer = bool(item.get("has_buffer", False))
-        has_stream = bool(item.get("has_stream", False))
-
-        cap = BackendCapabilities(
-            name=name,
-            id=cid,
-            has_buffer=has_buffer,
-            has_stream=has_stream,
-        )
-
-        caps.append(cap)
-        by_name[name] = cap
-        by_id[cid] = cap
+    # Fields arrive typed and in declaration order from the C struct sequence
+    caps: list[BackendCapabilities] = [
+        BackendCapabilities(*item) for item in _core.get_capabilities()
+    ]
 
     _cap_list = caps
-    _cap_by_name = by_name
-    _cap_by_id = by_id
+    _cap_by_name = {cap.name: cap for cap in caps}
+    _cap_by_id = {cap.id: cap for cap in caps}
 
 
 def list_capabilities() -> list[BackendCapabilities]:
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 import struct
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -15,6 +17,21 @@ COMP_HEADER_STRUCT = struct.Struct(
 
 _LEVEL_AUTO = 255  # Special value indicating 'auto' or 'unspecified' level
 
+# Fixed header layout, parsed by slicing rather than COMP_HEADER_STRUCT.unpack
+_MAGIC = b"COMP"
+_HEADER_SIZE: int = COMP_HEADER_STRUCT.size
+_VERSION_OFFSET = 4
+_ALGO_OFFSET = 5
+_LEVEL_OFFSET = 6
+_FLAGS_OFFSET = 7
+_ORIG_SIZE_OFFSET = 8
+_MAX_ORIG_SIZE = (1 << 63) - 1
+
+# Reading a header should not dirty the inode; O_NONBLOCK keeps a stray FIFO
+# from hanging the open
+_O_NOATIME: int = getattr(os, "O_NOATIME", 0)
+_O_READ: int = os.O_RDONLY | getattr(os, "O_NONBLOCK", 0)
+
 
 @dataclass
 class InspectResult:
@@ -92,42 +109,82 @@ def _failed_inspection(
     )
 
 
-def inspect(path: str | Path) -> InspectResult:
-    """Inspect a compressed file and extract metadata
+def _open_for_header(path: str | Path) -> int:
+    """Open a file read-only without updating its access time where possible
 
     Args:
-        path: The path to the compressed file.
+        path: The path to the file.
 
     Returns:
-        InspectResult: The result of the inspection.
+        The raw file descriptor.
+
+    Raises:
+        OSError: If the file cannot be opened.
     """
-    path = Path(path)
-    if not path.is_file():
-        return _failed_inspection(path, reason="Not a file")
+    if _O_NOATIME:
+        try:
+            return os.open(path, _O_READ | _O_NOATIME)
+
+        except PermissionError:
+            # O_NOATIME is only permitted for the file's owner
+            pass
+
+    return os.open(path, _O_READ)
+
+
+def _read_header(path: str | Path) -> bytes:
+    """Read the raw header bytes from the start of a file
+
+    Uses a raw file descriptor to avoid the buffered file object machinery.
+
+    Args:
+        path: The path to the file.
 
+    Returns:
+        Up to the header size in bytes, fewer if the file is shorter.
+
+    Raises:
+        OSError: If the file cannot be opened or read.
+    """
+    fd: int = _open_for_header(path)
     try:
-        with path.open(mode="rb") as f:
-            data: bytes = f.read(COMP_HEADER_STRUCT.size)
+        if hasattr(os, "pread"):
+            return os.pread(fd, _HEADER_SIZE, 0)
 
-    except OSError as e:
-        return _failed_inspection(path, reason=f"Failed to read file: {e}")
+        return os.read(fd, _HEADER_SIZE)
+
+    finally:
+        os.close(fd)
+
+
+def _inspect_header(path: Path, data: bytes) -> InspectResult:
+    """Parse raw header bytes into an inspection result
+
+    Args:
+        path: The path the header was read from.
+        data: The bytes read from the start of the file.
 
-    if len(data) < COMP_HEADER_STRUCT.size:
+    Returns:
+        InspectResult: The result of the inspection.
+    """
+    if len(data) < _HEADER_SIZE:
         return _failed_inspection(
             path, reason="File too small to be a valid Compresso file"
         )
 
-    magic, version, algo_id, level, flags, orig_size = COMP_HEADER_STRUCT.unpack(data)
-
-    if magic != b"COMP":
+    if not data.startswith(_MAGIC):
         return _failed_inspection(
             path, reason="Invalid magic number", is_compresso=False
         )
 
+    version: int = data[_VERSION_OFFSET]
     if version != 1:
         return _failed_inspection(path, reason=f"Unsupported header version: {version}")
 
-    _MAX_ORIG_SIZE = (1 << 63) - 1
+    algo_id: int = data[_ALGO_OFFSET]
+    level: int = data[_LEVEL_OFFSET]
+    flags: int = data[_FLAGS_OFFSET]
+    orig_size: int = int.from_bytes(data[_ORIG_SIZE_OFFSET:_HEADER_SIZE], "little")
 
     if orig_size > _MAX_ORIG_SIZE:
         return _failed_inspection(
@@ -173,3 +230,86 @@ def inspect(path: str | Path) -> InspectResult:
         can_decompress=can_decompress,
         estimated_decomp_s=est_time,
     )
+
+
+def inspect(path: str | Path) -> InspectResult:
+    """Inspect a compressed file and extract metadata
+
+    Args:
+        path: The path to the compressed file.
+
+    Returns:
+        InspectResult: The result of the inspection.
+    """
+    path = Path(path)
+    if not path.is_file():
+        return _failed_inspection(path, reason="Not a file")
+
+    try:
+        data: bytes = _read_header(path)
+
+    except OSError as e:
+        return _failed_inspection(path, reason=f"Failed to read file: {e}")
+
+    return _inspect_header(path, data)
+
+
+def _inspect_path(path: str) -> InspectResult:
+    """Inspect a single file without a separate stat call
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        InspectResult: The result of the inspection.
+    """
+    try:
+        data: bytes = _read_header(path)
+
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return _failed_inspection(Path(path), reason="Not a file")
+
+    except OSError as e:
+        return _failed_inspection(Path(path), reason=f"Failed to read file: {e}")
+
+    return _inspect_header(Path(path), data)
+
+
+def inspect_many(paths: str | Path | Iterable[str | Path]) -> list[InspectResult]:
+    """Inspect a batch of files and extract metadata
+
+    Given a directory, every regular file directly inside it is inspected,
+    using the file type from the directory listing instead of a stat per
+    file; symlinks are skipped rather than followed, and a directory that
+    cannot be listed yields a single failed result. Any other single path
+    is inspected on its own. Given an iterable, each path is inspected in
+    order.
+
+    Args:
+        paths: A directory to scan, a single file path, or an iterable of
+            file paths.
+
+    Returns:
+        list[InspectResult]: One result per file, sorted by path for a
+            directory and in input order otherwise.
+    """
+    if isinstance(paths, (str, os.PathLike)):
+        try:
+            with os.scandir(paths) as it:
+                targets: list[str] = sorted(
+                    entry.path for entry in it if entry.is_file(follow_symlinks=False)
+                )
+
+        except (FileNotFoundError, NotADirectoryError):
+            targets = [os.fspath(paths)]
+
+        except OSError as e:
+            # An unreadable directory is reported like any other failed read
+            return [
+                _failed_inspection(Path(paths), reason=f"Failed to read directory: {e}")
+            ]
+
+    else:
+        targets = [os.fspath(p) for p in paths]
+
+    return [_inspect_path(p) for p in targets]
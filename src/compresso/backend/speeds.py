@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 import json
+import sys
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # optional, parsing falls back to the stdlib
+    orjson = None
 
 _DEFAULT_COMP_MB_S = {
     "zlib": 200.0,
@@ -25,9 +32,27 @@ _DEFAULT_DECOMP_MB_S = {
     "snappy": 700.0,
 }
 
+_COMPRESS: str = sys.intern("compress")
+_DECOMPRESS: str = sys.intern("decompress")
+_FALLBACK_MB_S = 200.0
+
+# Built-in estimates keyed by (algo, operation)
+_DEFAULT_TABLE: dict[tuple[str, str], float] = {
+    (algo, _COMPRESS): mb_s for algo, mb_s in _DEFAULT_COMP_MB_S.items()
+} | {(algo, _DECOMPRESS): mb_s for algo, mb_s in _DEFAULT_DECOMP_MB_S.items()}
+
 _CONFIG_DIR = Path.home() / ".compresso"
 _SPEEDS_FILE = _CONFIG_DIR / "speeds.json"
 
+# Parsed speeds file, invalidated when the file's path, mtime or size changes
+_cache: dict[str, AlgoSpeeds] | None = None
+_cache_key: tuple[Path, int, int] | None = None
+_NO_SPEEDS: dict[str, AlgoSpeeds] = {}
+
+# Defaults overlaid with learned speeds, rebuilt when the parsed file changes
+_table: dict[tuple[str, str], float] = _DEFAULT_TABLE
+_table_source: dict[str, AlgoSpeeds] | None = None
+
 
 @dataclass
 class AlgoSpeeds:
@@ -46,34 +71,68 @@ class AlgoSpeeds:
     samples: int
 
 
+def _parse(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed
+
+    Args:
+        raw: The raw file contents.
+
+    Returns:
+        The decoded JSON value.
+
+    Raises:
+        ValueError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+
+    return json.loads(raw)
+
+
 def _load_raw() -> dict[str, AlgoSpeeds]:
     """Load raw speed data from the speeds file.
 
+    The parsed data is cached and only re-read when the file changes, so
+    repeated lookups cost a single stat. The returned mapping is shared and
+    must not be modified.
+
     Returns:
         A dictionary mapping algorithm names to their speed data.
     """
-    if not _SPEEDS_FILE.is_file():
-        return {}
+    global _cache, _cache_key
 
     try:
-        data = json.loads(s=_SPEEDS_FILE.read_text(encoding="utf-8"))
+        st = _SPEEDS_FILE.stat()
 
-    except (OSError, json.JSONDecodeError):
-        return {}
+    except OSError:
+        return _NO_SPEEDS
 
-    result: dict[str, AlgoSpeeds] = {}
-    for algo, entry in data.items():
-        try:
-            result[algo] = AlgoSpeeds(
-                algo=algo,
-                comp_mb_s=float(entry.get("comp_mb_s", 0.0)),
-                decomp_mb_s=float(entry.get("decomp_mb_s", 0.0)),
-                samples=int(entry.get("samples", 0)),
-            )
+    key: tuple[Path, int, int] = (_SPEEDS_FILE, st.st_mtime_ns, st.st_size)
+    if _cache is not None and key == _cache_key:
+        return _cache
 
-        except (TypeError, ValueError):
-            continue
+    try:
+        data = _parse(raw=_SPEEDS_FILE.read_bytes())
+
+    except (OSError, ValueError):
+        return _NO_SPEEDS
 
+    result: dict[str, AlgoSpeeds] = {}
+    if isinstance(data, dict):
+        for algo, entry in data.items():
+            try:
+                result[algo] = AlgoSpeeds(
+                    algo=algo,
+                    comp_mb_s=float(entry.get("comp_mb_s", 0.0)),
+                    decomp_mb_s=float(entry.get("decomp_mb_s", 0.0)),
+                    samples=int(entry.get("samples", 0)),
+                )
+
+            except (AttributeError, TypeError, ValueError):
+                continue
+
+    _cache = result
+    _cache_key = key
     return result
 
 
@@ -83,6 +142,8 @@ def _save_raw(entries: dict[str, AlgoSpeeds]) -> None:
     Args:
         entries: A dictionary mapping algorithm names to their speed data.
     """
+    global _cache, _cache_key
+
     if not _CONFIG_DIR.exists():
         _CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -97,6 +158,32 @@ def _save_raw(entries: dict[str, AlgoSpeeds]) -> None:
 
     _SPEEDS_FILE.write_text(data=json.dumps(obj=data, indent=4), encoding="utf-8")
 
+    # Write through to the cache so the next lookup does not re-read and
+    # re-parse the file we just produced
+    try:
+        st = _SPEEDS_FILE.stat()
+
+    except OSError:
+        _refresh()
+        return
+
+    _cache = dict(entries)
+    _cache_key = (_SPEEDS_FILE, st.st_mtime_ns, st.st_size)
+
+
+def _refresh() -> None:
+    """Drop the cached speeds so the next lookup re-reads the speeds file.
+
+    Only needed when the file may have been rewritten without its mtime or
+    size changing; normal updates are picked up automatically.
+    """
+    global _cache, _cache_key, _table, _table_source
+
+    _cache = None
+    _cache_key = None
+    _table = _DEFAULT_TABLE
+    _table_source = None
+
 
 def update_from_benchmarks(results: Iterable[object]) -> None:
     """Update speed estimates based on benchmark results.
@@ -104,9 +191,12 @@ def update_from_benchmarks(results: Iterable[object]) -> None:
     Args:
         results: An iterable of benchmark result objects. Each object should have 'algo', 'comp_mb_s', and 'decomp_mb_s' attributes.
     """
-    existing: dict[str, AlgoSpeeds] = _load_raw()
+    existing: dict[str, AlgoSpeeds] = dict(_load_raw())
 
-    accumulated: dict[str, dict[str, float | int]] = {}
+    # Group samples per algorithm in one pass, then reduce each group with the
+    # C-level sum() rather than updating running totals per result
+    comp_samples: dict[str, list[float]] = {}
+    decomp_samples: dict[str, list[float]] = {}
     for result in results:
         algo: str | None = getattr(result, "algo", None)
         if not algo:
@@ -118,20 +208,22 @@ def update_from_benchmarks(results: Iterable[object]) -> None:
         if comp <= 0.0 or decomp <= 0.0:
             continue
 
-        agg: dict[str, float | int] = accumulated.setdefault(
-            algo, {"comp_sum": 0.0, "decomp_sum": 0.0, "count": 0}
-        )
-        agg["comp_sum"] += comp
-        agg["decomp_sum"] += decomp
-        agg["count"] += 1
+        comps: list[float] | None = comp_samples.get(algo)
+        if comps is None:
+            comp_samples[algo] = [comp]
+            decomp_samples[algo] = [decomp]
+
+        else:
+            comps.append(comp)
+            decomp_samples[algo].append(decomp)
 
-    if not accumulated:
+    if not comp_samples:
         return
 
-    for algo, stats in accumulated.items():
-        new_count: int = int(stats["count"])
-        new_comp_avg: float = stats["comp_sum"] / new_count
-        new_decomp_avg: float = stats["decomp_sum"] / new_count
+    for algo, comps in comp_samples.items():
+        new_count: int = len(comps)
+        new_comp_avg: float = sum(comps) / new_count
+        new_decomp_avg: float = sum(decomp_samples[algo]) / new_count
 
         old: AlgoSpeeds | None = existing.get(algo)
         if old is None or old.samples <= 0:
@@ -160,6 +252,31 @@ def update_from_benchmarks(results: Iterable[object]) -> None:
     _save_raw(entries=existing)
 
 
+def _speed_table() -> dict[tuple[str, str], float]:
+    """Get the speed lookup table, merging in learned speeds when they change
+
+    Returns:
+        A dictionary mapping (algo, operation) to speed in MB/s.
+    """
+    global _table, _table_source
+
+    raw: dict[str, AlgoSpeeds] = _load_raw()
+    if raw is _table_source:
+        return _table
+
+    table: dict[tuple[str, str], float] = dict(_DEFAULT_TABLE)
+    for algo, entry in raw.items():
+        if entry.comp_mb_s > 0.0:
+            table[(algo, _COMPRESS)] = entry.comp_mb_s
+
+        if entry.decomp_mb_s > 0.0:
+            table[(algo, _DECOMPRESS)] = entry.decomp_mb_s
+
+    _table = table
+    _table_source = raw
+    return table
+
+
 def get_estimated_speeds(algo: str, *, operation: str = "decompress") -> float:
     """Get estimated speed for a given algorithm and operation.
 
@@ -170,21 +287,5 @@ def get_estimated_speeds(algo: str, *, operation: str = "decompress") -> float:
     Returns:
         The estimated speed in MB/s for the specified algorithm and operation.
     """
-    algo: str = algo.lower()
-    db: dict[str, AlgoSpeeds] = _load_raw()
-
-    if algo in db:
-        entry: AlgoSpeeds = db[algo]
-        if operation == "compress":
-            if entry.comp_mb_s > 0.0:
-                return entry.comp_mb_s
-
-        else:
-            if entry.decomp_mb_s > 0.0:
-                return entry.decomp_mb_s
-
-    if operation == "compress":
-        return _DEFAULT_COMP_MB_S.get(algo, 200.0)
-
-    else:
-        return _DEFAULT_DECOMP_MB_S.get(algo, 200.0)
+    op: str = _COMPRESS if operation == _COMPRESS else _DECOMPRESS
+    return _speed_table().get((algo.lower(), op), _FALLBACK_MB_S)
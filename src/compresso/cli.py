@@ -13,7 +13,6 @@ from ._core import (
     Error,
     HeaderError,
 )
-from .backend.benchmark import benchmark_file, print_results
 from .backend.capabilities import list_capabilities
 from .backend.file_inspect import inspect as inspect_file
 from .frontend.api import (
@@ -27,6 +26,9 @@ from .frontend.archive_api import (
     ExtractJob,
 )
 
+# Level entries that select the strategy's default level
+_AUTO_LEVELS: frozenset[str] = frozenset(("auto", "default"))
+
 app = ExtendedTyper(help="Compresso - Fast file compression and decompression tool")
 
 
@@ -70,6 +72,59 @@ def format_time(seconds: float) -> str:
         return f"{mins}m {secs:.1f}s"
 
 
+def parse_csv(value: str | None) -> list[str]:
+    """Split a comma-separated option value into its non-empty items.
+
+    Args:
+        value: Raw option value; None or 'all' selects everything
+
+    Returns:
+        List of stripped items, or an empty list for 'all'
+    """
+    if not value or value.lower() == "all":
+        return []
+
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def parse_levels(value: str | None) -> list[int | None]:
+    """Parse a comma-separated list of compression levels.
+
+    Args:
+        value: Raw option value; 'auto' or 'default' entries map to None
+
+    Returns:
+        List of levels, with None meaning the strategy's default level
+
+    Raises:
+        ValueError: If an entry is neither an integer nor 'auto'/'default'
+    """
+    level_list: list[int | None] = []
+    if not value:
+        return level_list
+
+    for level in value.split(","):
+        level = level.strip()
+        if not level:
+            continue
+
+        digits: str = level[1:] if level[0] == "-" else level
+        if digits.isdecimal():
+            level_list.append(int(level))
+
+        elif level.lower() in _AUTO_LEVELS:
+            level_list.append(None)
+
+        else:
+            # Anything isdecimal() misses that int() still takes, e.g. "+3"
+            try:
+                level_list.append(int(level))
+            except ValueError:
+                raise ValueError(level) from None
+
+    return level_list
+
+
 @app.command(aliases=["c", "comp"])
 def compress(
     file: Path = app.Argument(default=..., help="File to compress"),
@@ -618,6 +673,23 @@ def benchmark(
         "--update-cache",
         help="Update speed estimates cache with benchmark results",
     ),
+    workers: int = app.Option(
+        1,
+        "--workers",
+        "-j",
+        min=0,
+        help="Number of parallel benchmark workers (default: 1, serial; 0 for one per CPU)",
+    ),
+    mode: str = app.Option(
+        "memory",
+        "--mode",
+        help="Benchmark mode: 'memory' for codec throughput, 'file' for end-to-end",
+    ),
+    pretty: bool = app.Option(
+        False,
+        "--pretty",
+        help="Render results as a tabulate grid (requires tabulate)",
+    ),
 ) -> None:
     """Run compression benchmarks on a file.
 
@@ -629,39 +701,56 @@ def benchmark(
         repeats: Number of times to repeat each benchmark (default: 1).
         temp_dir: Temporary directory for benchmark files (default: None).
         update_cache: If True, update the speed estimates cache with benchmark results (default: False).
+        workers: Number of parallel benchmark workers, 0 for one per CPU (default: 1, serial).
+        mode: 'memory' to time in-memory buffers, 'file' to time temp files (default: memory).
+        pretty: If True, render results with tabulate (default: False).
     """
     try:
-        algo_list: list[str] = []
-        if algos and algos.lower() != "all":
-            algo_list = [a.strip() for a in algos.split(",") if a.strip()]
-
-        strategy_list: list[str] = []
-        if strategies and strategies.lower() != "all":
-            strategy_list = [s.strip() for s in strategies.split(",") if s.strip()]
-
-        level_list: list[int | None] = []
-        if levels:
-            for level in levels.split(sep=","):
-                level: str = level.strip()
-                if not level:
-                    continue
-
-                if level.lower() in ("auto", "default"):
-                    level_list.append(None)
-
-                else:
-                    try:
-                        level_list.append(int(level))
-
-                    except ValueError:
-                        app.echo(
-                            message=app.style(
-                                text=f"✗ Invalid level: {level}. Use integers 0-9 or 'auto'",
-                                fg="red",
-                            ),
-                            err=True,
-                        )
-                        sys.exit(1)
+        algo_list: list[str] = parse_csv(value=algos)
+        strategy_list: list[str] = parse_csv(value=strategies)
+
+        # Only sweep backends compiled into this build; an unknown name would
+        # otherwise cost a failed run per strategy and level
+        available: list[str] = [cap.name for cap in list_capabilities()]
+        if algo_list:
+            skipped: list[str] = [a for a in algo_list if a not in available]
+            if skipped:
+                app.echo(
+                    message=app.style(
+                        text=f"⚠ Skipping unavailable algorithms: {', '.join(skipped)}",
+                        fg="yellow",
+                    ),
+                    err=True,
+                )
+            algo_list = [a for a in algo_list if a in available]
+
+        else:
+            algo_list = available
+
+        if not algo_list:
+            app.echo(
+                message=app.style(
+                    text="✗ No available algorithms to benchmark", fg="red"
+                ),
+                err=True,
+            )
+            sys.exit(1)
+
+        try:
+            level_list: list[int | None] = parse_levels(value=levels)
+
+        except ValueError as e:
+            app.echo(
+                message=app.style(
+                    text=f"✗ Invalid level: {e}. Use integers 0-9 or 'auto'",
+                    fg="red",
+                ),
+                err=True,
+            )
+            sys.exit(1)
+
+        # Deferred so other commands and --help skip multiprocessing et al.
+        from .backend.benchmark import benchmark_file, print_results
 
         app.echo(message=f"Running benchmarks on: {file}")
         app.echo(message=f"Repeats: {repeats}")
@@ -687,6 +776,8 @@ def benchmark(
             repeats=repeats,
             temp_dir=temp_dir,
             update_cache=update_cache,
+            max_workers=workers or None,
+            mode=mode,
         )
 
         if not results:
@@ -696,7 +787,7 @@ def benchmark(
             )
             sys.exit(1)
 
-        print_results(results)
+        print_results(results, pretty=pretty)
 
         if update_cache:
             app.echo()
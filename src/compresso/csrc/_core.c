@@ -1,5 +1,6 @@
 #define PY_SSIZE_T_CLEAN
 #include "common.h"
+#include "parallel.h"
 #include "validate.h"
 #include <Python.h>
 
@@ -111,6 +112,68 @@ static PyObject *py_decompress_file(PyObject *self __attribute__((unused)),
   return PyLong_FromLong(0);
 }
 
+static PyObject *py_compress_bytes(PyObject *self __attribute__((unused)),
+                                   PyObject *args, PyObject *kwargs) {
+  static char *kwlist[] = {"data", "algo", "strategy", "level", NULL};
+
+  Py_buffer data;
+  const char *algo_name = NULL;
+  const char *strategy_name = NULL;
+  int level = -1;
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*|ssi", kwlist, &data,
+                                   &algo_name, &strategy_name, &level)) {
+    return NULL; // Error already set
+  }
+
+  AlgoID algo = algo_from_string(algo_name);
+  Strategy strat = strategy_from_string(strategy_name);
+
+  if (algo_name && algo_name[0] != '\0' && algo == ALGO_NONE) {
+    PyErr_Format(PyExc_ValueError, "Unknown compression algorithm: %s",
+                 algo_name);
+    PyBuffer_Release(&data);
+    return NULL;
+  }
+
+  if (validate_compression_request(algo, strat, level, NULL) != 0) {
+    PyBuffer_Release(&data);
+    return NULL;
+  }
+
+  PyObject *result = compress_bytes((const unsigned char *)data.buf,
+                                    (size_t)data.len, algo, strat, level);
+  PyBuffer_Release(&data);
+  return result;
+}
+
+static PyObject *py_decompress_bytes(PyObject *self __attribute__((unused)),
+                                     PyObject *args, PyObject *kwargs) {
+  static char *kwlist[] = {"data", "algo", NULL};
+
+  Py_buffer data;
+  const char *algo_name = NULL;
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y*|s", kwlist, &data,
+                                   &algo_name)) {
+    return NULL; // Error already set
+  }
+
+  AlgoID algo = algo_from_string(algo_name);
+
+  if (algo_name && algo_name[0] != '\0' && algo == ALGO_NONE) {
+    PyErr_Format(PyExc_ValueError, "Unknown decompression algorithm: %s",
+                 algo_name);
+    PyBuffer_Release(&data);
+    return NULL;
+  }
+
+  PyObject *result =
+      decompress_bytes((const unsigned char *)data.buf, (size_t)data.len, algo);
+  PyBuffer_Release(&data);
+  return result;
+}
+
 // ---- Archive Operations ----
 
 static PyObject *py_create_archive(PyObject *self __attribute__((unused)),
@@ -348,6 +411,32 @@ static PyObject *py_format_is_archive(PyObject *self __attribute__((unused)),
   Py_RETURN_FALSE;
 }
 
+// ---- Thread Context Methods ----
+
+static PyObject *py_release_thread_contexts(PyObject *self
+                                            __attribute__((unused)),
+                                            PyObject *Py_UNUSED(ignored)) {
+  release_thread_contexts();
+  Py_RETURN_NONE;
+}
+
+static PyObject *py_set_max_threads(PyObject *self __attribute__((unused)),
+                                    PyObject *args) {
+  int n = 0;
+
+  if (!PyArg_ParseTuple(args, "i", &n)) {
+    return NULL; // Error already set
+  }
+
+  parallel_set_max_threads(n);
+  Py_RETURN_NONE;
+}
+
+static PyObject *py_get_max_threads(PyObject *self __attribute__((unused)),
+                                    PyObject *Py_UNUSED(ignored)) {
+  return PyLong_FromLong(parallel_workers());
+}
+
 // ---- Capabilities Methods ----
 
 static PyObject *py_get_capabilities(PyObject *self __attribute__((unused)),
@@ -392,6 +481,12 @@ static PyMethodDef CoreMethods[] = {
     {"decompress_file", (PyCFunction)py_decompress_file,
      METH_VARARGS | METH_KEYWORDS,
      "Decompress a file using the specified algorithm."},
+    {"compress_bytes", (PyCFunction)py_compress_bytes,
+     METH_VARARGS | METH_KEYWORDS,
+     "Compress an in-memory buffer into a Compresso frame."},
+    {"decompress_bytes", (PyCFunction)py_decompress_bytes,
+     METH_VARARGS | METH_KEYWORDS,
+     "Decompress a Compresso frame produced by compress_bytes."},
 
     {"create_archive", (PyCFunction)py_create_archive,
      METH_VARARGS | METH_KEYWORDS,
@@ -421,6 +516,14 @@ static PyMethodDef CoreMethods[] = {
      (PyCFunction)py_get_default_backend_for_strategy, METH_VARARGS,
      "Get the default backend for a given strategy, None if no backend is "
      "available."},
+    {"release_thread_contexts", (PyCFunction)py_release_thread_contexts,
+     METH_NOARGS,
+     "Free the codec contexts cached for the calling thread."},
+    {"set_max_threads", (PyCFunction)py_set_max_threads, METH_VARARGS,
+     "Cap the threads a codec may use per call; values below 1 restore the "
+     "CPU count."},
+    {"get_max_threads", (PyCFunction)py_get_max_threads, METH_NOARGS,
+     "Get the current cap on threads a codec may use per call."},
 
     {NULL, NULL, 0, NULL} // Sentinel
 };
@@ -497,5 +600,19 @@ PyMODINIT_FUNC PyInit__core(void) {
     return NULL;
   }
 
+  PyTypeObject *caps_type = get_capabilities_type();
+  if (!caps_type) {
+    Py_DECREF(module);
+    return NULL;
+  }
+
+  Py_INCREF(caps_type);
+  if (PyModule_AddObject(module, "BackendCapabilities", (PyObject *)caps_type) <
+      0) {
+    Py_DECREF(caps_type);
+    Py_DECREF(module);
+    return NULL;
+  }
+
   return module;
 }
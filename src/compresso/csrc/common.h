@@ -28,6 +28,42 @@ _Static_assert(sizeof(CHeader) == 16,
                "CHeader must be exactly 16 bytes with no padding");
 #endif
 
+// Header flags
+#define C_FLAG_BUFFER 0x01 // payload written by the one-shot buffer codec
+#define C_FLAG_PARALLEL 0x02 // payload is a sequence of independent blocks
+
+#define C_LEVEL_AUTO 255 // level byte when no explicit level was requested
+
+// orig_size is stored little-endian on disk (the "<4sBBBBQ" layout)
+static inline uint64_t c_le64(uint64_t v) {
+#if defined(__BYTE_ORDER__) && __BYTE_ORDER__ == __ORDER_BIG_ENDIAN__
+  return __builtin_bswap64(v);
+#else
+  return v;
+#endif
+}
+
+// Build a complete header in one initialiser so the compiler can emit it as
+// a single 16-byte store
+static inline CHeader make_header(uint8_t algo, int level, uint8_t flags,
+                                  uint64_t orig_size) {
+  CHeader header = {
+      .magic = {'C', 'O', 'M', 'P'},
+      .version = 1,
+      .algo = algo,
+      .level = (uint8_t)((level >= 0 && level < C_LEVEL_AUTO) ? level
+                                                               : C_LEVEL_AUTO),
+      .flags = flags,
+      .orig_size = c_le64(orig_size),
+  };
+  return header;
+}
+
+// Original size from a header read off disk, in host byte order
+static inline uint64_t header_orig_size(const CHeader *header) {
+  return c_le64(header->orig_size);
+}
+
 // ---- Algorithms ----
 
 typedef enum {
@@ -47,6 +83,17 @@ typedef struct CBackend {
   const char *name;
   uint8_t id;
 
+  // Accepted compression levels; anything outside is clamped or replaced by
+  // the codec default. level_ignored backends have no levels at all
+  int min_level;
+  int max_level;
+  int level_ignored;
+
+  // Set when the one-shot buffer codec is cheap enough to run on a whole
+  // file: large inputs and outputs are then memory-mapped instead of streamed.
+  // Left unset for codecs whose buffer path stages large internal copies
+  int map_io;
+
   int (*is_available)(void);
   size_t (*max_compressed_size)(size_t input_size);
 
@@ -60,8 +107,27 @@ typedef struct CBackend {
 
   int (*compress_stream)(FILE *src, FILE *dst, int level);
   int (*decompress_stream)(FILE *src, FILE *dst, uint64_t orig_size);
+
+  // Optional one-shot codec that never touches the GIL, so it can run on
+  // worker threads; backends that set these get parallel block compression
+  int (*compress_block)(const unsigned char *input, size_t input_size,
+                        unsigned char *output, size_t *output_capacity,
+                        int level, size_t *output_size);
+  int (*decompress_block)(const unsigned char *input, size_t input_size,
+                          unsigned char *output, size_t *output_capacity,
+                          size_t *output_size);
+
+  // Optional: free codec contexts cached for the calling thread
+  void (*release_thread_contexts)(void);
 } CBackend;
 
+// Storage for per-thread codec contexts
+#if defined(_MSC_VER)
+#define COMPRESSO_THREAD_LOCAL __declspec(thread)
+#else
+#define COMPRESSO_THREAD_LOCAL _Thread_local
+#endif
+
 // ---- Strategy ----
 
 typedef enum {
@@ -75,6 +141,13 @@ typedef enum {
 void init_backends(void);
 const CBackend *choose_backend(Strategy strat);
 
+// Free every backend's cached contexts for the calling thread
+void release_thread_contexts(void);
+
+// Called by a backend when it first caches a context on the calling thread,
+// so the contexts are released when the thread exits
+void track_thread_contexts(void);
+
 // ---- Backend Getters ----
 
 const CBackend *get_zlib_backend(void);
@@ -107,6 +180,7 @@ const CBackend *find_backend_by_name(const char *name);
 const CBackend *find_backend_by_id(uint8_t id);
 
 PyObject *get_capabilities(void);
+PyTypeObject *get_capabilities_type(void);
 
 #define MAX_FILE_SIZE (10ULL * 1024 * 1024 * 1024)         // 10 GB
 #define MAX_DECOMPRESSED_SIZE (10ULL * 1024 * 1024 * 1024) // 10 GB
@@ -149,6 +223,9 @@ static inline void *safe_malloc(size_t size) {
 
 static inline void set_backend_error(const CBackend *backend, const char *op,
                                      const char *context) {
+  if (PyErr_Occurred()) {
+    return; // keep the more specific error raised by the backend
+  }
   PyErr_Format(comp_BackendError, "Backend '%s' %s failed (%s)",
                backend && backend->name ? backend->name : "unknown", op,
                context);
@@ -161,6 +238,12 @@ int compress_file(const char *src_path, const char *dst_path, AlgoID algo,
 
 int decompress_file(const char *src_path, const char *dst_path, AlgoID algo);
 
+PyObject *compress_bytes(const unsigned char *input, size_t input_size,
+                         AlgoID algo, Strategy strategy, int level);
+
+PyObject *decompress_bytes(const unsigned char *input, size_t input_size,
+                           AlgoID algo);
+
 const char *get_default_backend_for_strategy(Strategy strat);
 
 #endif // COMMON_H
@@ -1,6 +1,8 @@
 #define PY_SSIZE_T_CLEAN
 #include "archives.h"
 #include "common.h"
+#include "fileio.h"
+#include "parallel.h"
 #include <Python.h>
 #include <string.h>
 
@@ -117,35 +119,95 @@ write_memory_to_file(const char *path, const unsigned char *data, size_t size) {
   return 0;
 }
 
-// ---- Public API ----
+static int read_region(FILE *f, const char *path, uint64_t offset,
+                       unsigned char *buf, size_t len, const char *what) {
+  int rc;
 
-int compress_file(const char *src_path, const char *dst_path, AlgoID algo,
-                  Strategy strategy, int level) {
-  init_backends();
+  Py_BEGIN_ALLOW_THREADS rc = fileio_read_at(fileno(f), offset, buf, len);
+  Py_END_ALLOW_THREADS
 
-  const CBackend *backend = NULL;
+      if (rc != 0) {
+    if (errno != 0) {
+      PyErr_SetFromErrnoWithFilename(PyExc_OSError, path);
+    } else {
+      PyErr_Format(PyExc_IOError, "Failed to read %s", what);
+    }
+    return -1;
+  }
 
-  int return_code = 0;
-  FILE *src = NULL;
-  FILE *dst = NULL;
+  return 0;
+}
+
+// ---- Backend Helpers ----
+
+static const CBackend *select_compress_backend(AlgoID algo, Strategy strategy) {
+  const CBackend *backend = NULL;
 
   if (algo != ALGO_NONE) {
     backend = find_backend_by_id(algo);
     if (!backend) {
       PyErr_SetString(PyExc_ValueError,
                       "Specified compression algorithm not available");
-      return_code = -1;
-      goto done;
     }
   } else {
     backend = choose_backend(strategy);
     if (!backend) {
       PyErr_SetString(comp_Error, "No available compression backend found");
-      return_code = -1;
-      goto done;
     }
   }
 
+  return backend;
+}
+
+static const CBackend *backend_from_header(const CHeader *header,
+                                           AlgoID algo) {
+  if (memcmp(header->magic, C_MAGIC, C_MAGIC_LEN) != 0) {
+    PyErr_SetString(comp_HeaderError, "Invalid file magic number");
+    return NULL;
+  }
+
+  if (header->version != 1) {
+    PyErr_SetString(comp_HeaderError, "Unsupported file version");
+    return NULL;
+  }
+
+  const CBackend *backend = NULL;
+
+  if (algo != ALGO_NONE) {
+    backend = find_backend_by_id(algo);
+    if (!backend) {
+      PyErr_SetString(comp_BackendError,
+                      "Specified compression algorithm not available");
+    }
+  } else {
+    backend = find_backend_by_id(header->algo);
+    if (!backend) {
+      PyErr_SetString(comp_HeaderError,
+                      "Compression algorithm from file not available");
+    }
+  }
+
+  return backend;
+}
+
+// ---- Public API ----
+
+int compress_file(const char *src_path, const char *dst_path, AlgoID algo,
+                  Strategy strategy, int level) {
+  init_backends();
+
+  int return_code = 0;
+  FILE *src = NULL;
+  FILE *dst = NULL;
+  const unsigned char *mapped = NULL;
+  size_t mapped_len = 0;
+
+  const CBackend *backend = select_compress_backend(algo, strategy);
+  if (!backend) {
+    return_code = -1;
+    goto done;
+  }
+
   src = fopen(src_path, "rb");
   if (!src) {
     PyErr_SetFromErrnoWithFilename(PyExc_OSError, src_path);
@@ -214,13 +276,37 @@ int compress_file(const char *src_path, const char *dst_path, AlgoID algo,
 
 #endif
 
-  CHeader header;
-  memcpy(header.magic, C_MAGIC, C_MAGIC_LEN);
-  header.version = 1;
-  header.algo = backend->id;
-  header.level = (uint8_t)((level >= 0 && level <= 254) ? level : 255);
-  header.flags = 0;
-  header.orig_size = (uint64_t)len;
+  // Large inputs are pulled in through the batched io_uring reader and
+  // compressed in one shot. The whole file is read before the codec starts,
+  // so this is held to map_io codecs and the same ceiling as the mapped path
+  // to bound the input plus worst-case output buffers
+  int use_buffer = !backend->compress_stream ||
+                   (backend->map_io && fileio_use_uring((size_t)len) &&
+                    (uint64_t)len <= FILEIO_MMAP_MAX_SIZE);
+
+  // Otherwise large inputs are mapped and handed to the one-shot codec as a
+  // pointer into the page cache, skipping the copy through a read buffer.
+  // Only for map_io codecs: the rest keep streaming in fixed-size chunks
+  // rather than holding a whole-file output buffer
+  if (!use_buffer && backend->map_io && backend->compress_buffer &&
+      (uint64_t)len > FILEIO_MMAP_MIN_SIZE &&
+      (uint64_t)len <= FILEIO_MMAP_MAX_SIZE) {
+    // MAP_POPULATE faults the whole file in, so do it without the GIL
+    Py_BEGIN_ALLOW_THREADS mapped = fileio_map_input(fileno(src), (size_t)len);
+    Py_END_ALLOW_THREADS
+    if (mapped) {
+      mapped_len = (size_t)len;
+      use_buffer = 1;
+    }
+  }
+
+  // Block-parallel codecs spread large in-memory inputs across all cores
+  int use_parallel = use_buffer && parallel_use_blocks(backend, (uint64_t)len);
+
+  uint8_t flags = use_parallel ? C_FLAG_PARALLEL
+                  : use_buffer ? C_FLAG_BUFFER
+                               : 0;
+  CHeader header = make_header(backend->id, level, flags, (uint64_t)len);
 
   if (fwrite(&header, 1, sizeof(header), dst) != sizeof(header) ||
       ferror(dst)) {
@@ -229,7 +315,7 @@ int compress_file(const char *src_path, const char *dst_path, AlgoID algo,
     goto done;
   }
 
-  if (backend->compress_stream) {
+  if (!use_buffer) {
     return_code = backend->compress_stream(src, dst, level);
     if (return_code != 0) {
       set_backend_error(backend, "compression", "streaming compression");
@@ -237,17 +323,37 @@ int compress_file(const char *src_path, const char *dst_path, AlgoID algo,
     }
   } else {
     size_t input_size = (size_t)len;
-    unsigned char *input_buffer = (unsigned char *)safe_malloc(input_size);
-    if (!input_buffer) {
-      return_code = -1;
-      goto done;
+    unsigned char *input_buffer = NULL;
+    const unsigned char *input = mapped;
+
+    if (!input) {
+      input_buffer = (unsigned char *)safe_malloc(input_size);
+      if (!input_buffer) {
+        return_code = -1;
+        goto done;
+      }
+
+      if (read_region(src, src_path, 0, input_buffer, input_size,
+                      "input file") != 0) {
+        free(input_buffer);
+        return_code = -1;
+        goto done;
+      }
+      input = input_buffer;
     }
 
-    size_t read = fread(input_buffer, 1, input_size, src);
-    if (read != input_size || ferror(src)) {
-      free(input_buffer);
-      PyErr_SetString(PyExc_IOError, "Failed to read input file");
-      return_code = -1;
+    if (use_parallel) {
+      int ret;
+      Py_BEGIN_ALLOW_THREADS ret =
+          parallel_compress(backend, input, input_size, level, dst);
+      Py_END_ALLOW_THREADS
+
+          free(input_buffer);
+      if (ret != 0) {
+        set_backend_error(backend, "compression",
+                          "parallel block compression");
+        return_code = -1;
+      }
       goto done;
     }
 
@@ -268,7 +374,7 @@ int compress_file(const char *src_path, const char *dst_path, AlgoID algo,
     }
 
     size_t output_size = 0;
-    if (backend->compress_buffer(input_buffer, input_size, output_buffer,
+    if (backend->compress_buffer(input, input_size, output_buffer,
                                  &max_payload, level, &output_size) != 0) {
       free(input_buffer);
       free(output_buffer);
@@ -279,8 +385,11 @@ int compress_file(const char *src_path, const char *dst_path, AlgoID algo,
 
     free(input_buffer);
 
-    if (fwrite(output_buffer, 1, output_size, dst) != output_size ||
-        ferror(dst)) {
+    size_t written;
+    Py_BEGIN_ALLOW_THREADS written = fwrite(output_buffer, 1, output_size, dst);
+    Py_END_ALLOW_THREADS
+
+        if (written != output_size || ferror(dst)) {
       free(output_buffer);
       PyErr_SetString(PyExc_IOError,
                       "Failed to write compressed data to output file");
@@ -292,6 +401,7 @@ int compress_file(const char *src_path, const char *dst_path, AlgoID algo,
   }
 
 done:
+  fileio_unmap(mapped, mapped_len);
   if (src)
     fclose(src);
   if (dst)
@@ -362,6 +472,8 @@ static int decompress_compresso_file(const char *src_path, const char *dst_path,
   int return_code = 0;
   FILE *src = NULL;
   FILE *dst = NULL;
+  unsigned char *mapped = NULL;
+  size_t mapped_len = 0;
 
   src = fopen(src_path, "rb");
   if (!src) {
@@ -384,45 +496,25 @@ static int decompress_compresso_file(const char *src_path, const char *dst_path,
     goto done;
   }
 
-  if (memcmp(header.magic, C_MAGIC, C_MAGIC_LEN) != 0) {
-    PyErr_SetString(comp_HeaderError, "Invalid file magic number");
+  const CBackend *backend = backend_from_header(&header, algo);
+  if (!backend) {
     return_code = -1;
     goto done;
   }
 
-  if (header.version != 1) {
-    PyErr_SetString(comp_HeaderError, "Unsupported file version");
-    return_code = -1;
-    goto done;
-  }
-
-  const CBackend *backend = NULL;
-
-  if (algo != ALGO_NONE) {
-    backend = find_backend_by_id(algo);
-    if (!backend) {
-      PyErr_SetString(comp_BackendError,
-                      "Specified compression algorithm not available");
-      return_code = -1;
-      goto done;
-    }
-  } else {
-    backend = find_backend_by_id(header.algo);
-    if (!backend) {
-      PyErr_SetString(comp_HeaderError,
-                      "Compression algorithm from file not available");
-      return_code = -1;
-      goto done;
-    }
-  }
-  uint64_t orig_size = header.orig_size;
+  uint64_t orig_size = header_orig_size(&header);
   if (validate_size(orig_size, MAX_DECOMPRESSED_SIZE,
                     "Original file size in header") != 0) {
     return_code = -1;
     goto done;
   }
 
-  if (backend->decompress_stream) {
+  // Buffer-mode payloads are only guaranteed to round-trip through the
+  // buffer decoder (e.g. snappy frames its stream output differently)
+  int parallel = (header.flags & C_FLAG_PARALLEL) != 0;
+
+  if (backend->decompress_stream &&
+      !(header.flags & (C_FLAG_BUFFER | C_FLAG_PARALLEL))) {
     return_code = backend->decompress_stream(src, dst, orig_size);
     if (return_code != 0) {
       set_backend_error(backend, "decompression", "streaming decompression");
@@ -515,17 +607,15 @@ static int decompress_compresso_file(const char *src_path, const char *dst_path,
       return_code = -1;
       goto done;
     }
-    size_t read = fread(comp_buffer, 1, comp_size, src);
-    if (read != comp_size || ferror(src)) {
+    if (read_region(src, src_path, (uint64_t)payload_start, comp_buffer,
+                    comp_size, "compressed data from input file") != 0) {
       free(comp_buffer);
-      PyErr_SetString(PyExc_IOError,
-                      "Failed to read compressed data from input file");
       return_code = -1;
       goto done;
     }
 
     size_t output_capacity;
-    if (backend->id == ALGO_SNAPPY) {
+    if (backend->id == ALGO_SNAPPY && !parallel) {
       output_capacity = snappy_decompressed_size(comp_buffer, comp_size);
       if (output_capacity == 0) {
         free(comp_buffer);
@@ -542,18 +632,48 @@ static int decompress_compresso_file(const char *src_path, const char *dst_path,
       }
       output_capacity = (size_t)orig_size;
     }
-    unsigned char *output_buffer =
-        (unsigned char *)safe_malloc(output_capacity);
-    if (!output_buffer) {
-      free(comp_buffer);
-      return_code = -1;
-      goto done;
+    // Large outputs are decoded straight into a shared mapping of the
+    // destination, so the page cache is filled without a second copy
+    if (backend->map_io && output_capacity == (size_t)orig_size &&
+        orig_size > FILEIO_MMAP_MIN_SIZE && orig_size <= FILEIO_MMAP_MAX_SIZE) {
+      mapped = fileio_map_output(fileno(dst), output_capacity);
+      if (mapped) {
+        mapped_len = output_capacity;
+      }
+    }
+
+    unsigned char *output_buffer = NULL;
+    unsigned char *output = mapped;
+    if (!output) {
+      output_buffer = (unsigned char *)safe_malloc(output_capacity);
+      if (!output_buffer) {
+        free(comp_buffer);
+        return_code = -1;
+        goto done;
+      }
+      output = output_buffer;
     }
 
     size_t output_size = 0;
-    if (backend->decompress_buffer(comp_buffer, comp_size, output_buffer,
-                                   &output_capacity, &output_size) != 0 ||
-        output_size != (size_t)orig_size) {
+    if (parallel) {
+      int ret;
+      Py_BEGIN_ALLOW_THREADS ret = parallel_decompress(
+          backend, comp_buffer, comp_size, output, output_capacity);
+      Py_END_ALLOW_THREADS
+
+          if (ret != 0) {
+        free(comp_buffer);
+        free(output_buffer);
+        set_backend_error(backend, "decompression",
+                          "parallel block decompression");
+        return_code = -1;
+        goto done;
+      }
+      output_size = output_capacity;
+    } else if (backend->decompress_buffer(comp_buffer, comp_size, output,
+                                          &output_capacity,
+                                          &output_size) != 0 ||
+               output_size != (size_t)orig_size) {
       free(comp_buffer);
       free(output_buffer);
       set_backend_error(backend, "decompression", "buffer decompression");
@@ -563,8 +683,14 @@ static int decompress_compresso_file(const char *src_path, const char *dst_path,
 
     free(comp_buffer);
 
-    if (fwrite(output_buffer, 1, output_size, dst) != output_size ||
-        ferror(dst)) {
+    size_t written = output_size;
+    if (output_buffer) {
+      Py_BEGIN_ALLOW_THREADS written =
+          fwrite(output_buffer, 1, output_size, dst);
+      Py_END_ALLOW_THREADS
+    }
+
+    if (written != output_size || ferror(dst)) {
       free(output_buffer);
       PyErr_SetString(PyExc_IOError,
                       "Failed to write decompressed data to output file");
@@ -576,9 +702,138 @@ static int decompress_compresso_file(const char *src_path, const char *dst_path,
   }
 
 done:
+  fileio_unmap(mapped, mapped_len);
+  // The mapping sized the destination up front; on failure leave it empty, as
+  // the buffered path does, rather than full-size with partial output
+  if (mapped && return_code != 0)
+    fileio_discard(fileno(dst));
   if (src)
     fclose(src);
   if (dst)
     fclose(dst);
   return return_code;
 }
+
+// ---- In-Memory API ----
+
+PyObject *compress_bytes(const unsigned char *input, size_t input_size,
+                         AlgoID algo, Strategy strategy, int level) {
+  init_backends();
+
+  const CBackend *backend = select_compress_backend(algo, strategy);
+  if (!backend) {
+    return NULL;
+  }
+
+  if (validate_size((uint64_t)input_size, MAX_FILE_SIZE, "Input size") != 0) {
+    return NULL;
+  }
+
+  size_t max_payload = backend->max_compressed_size(input_size);
+  if (max_payload == SIZE_MAX) {
+    PyErr_SetString(PyExc_OverflowError, "Compressed size calculation overflow");
+    return NULL;
+  }
+
+  if (max_payload > (size_t)PY_SSIZE_T_MAX - sizeof(CHeader)) {
+    PyErr_SetString(PyExc_OverflowError, "Compressed size calculation overflow");
+    return NULL;
+  }
+
+  // The codec writes straight into the bytes object, which is then shrunk to
+  // the actual payload size, so no intermediate buffer or copy is needed
+  PyObject *result = PyBytes_FromStringAndSize(
+      NULL, (Py_ssize_t)(sizeof(CHeader) + max_payload));
+  if (!result) {
+    return NULL;
+  }
+
+  unsigned char *dst = (unsigned char *)PyBytes_AS_STRING(result);
+  size_t output_size = 0;
+  if (backend->compress_buffer(input, input_size, dst + sizeof(CHeader),
+                               &max_payload, level, &output_size) != 0) {
+    Py_DECREF(result);
+    set_backend_error(backend, "compression", "buffer compression");
+    return NULL;
+  }
+
+  CHeader header = make_header(backend->id, level, C_FLAG_BUFFER,
+                               (uint64_t)input_size);
+  memcpy(dst, &header, sizeof(header));
+
+  if (_PyBytes_Resize(&result, (Py_ssize_t)(sizeof(CHeader) + output_size)) <
+      0) {
+    return NULL; // result already released
+  }
+
+  return result;
+}
+
+PyObject *decompress_bytes(const unsigned char *input, size_t input_size,
+                           AlgoID algo) {
+  init_backends();
+
+  CHeader header;
+  if (input_size < sizeof(header)) {
+    PyErr_SetString(comp_HeaderError, "Input too small to contain a header");
+    return NULL;
+  }
+  memcpy(&header, input, sizeof(header));
+
+  const CBackend *backend = backend_from_header(&header, algo);
+  if (!backend) {
+    return NULL;
+  }
+
+  if (!(header.flags & C_FLAG_BUFFER)) {
+    PyErr_SetString(comp_HeaderError,
+                    "Payload was written in stream mode, use decompress_file");
+    return NULL;
+  }
+
+  uint64_t orig_size = header_orig_size(&header);
+  if (validate_size(orig_size, MAX_DECOMPRESSED_SIZE,
+                    "Original size in header") != 0) {
+    return NULL;
+  }
+
+  const unsigned char *payload = input + sizeof(header);
+  size_t comp_size = input_size - sizeof(header);
+  if (comp_size == 0) {
+    PyErr_SetString(PyExc_ValueError, "No compressed data found in input");
+    return NULL;
+  }
+
+  // Empty bytes objects are shared singletons, never decode into one
+  if (orig_size == 0) {
+    return PyBytes_FromStringAndSize(NULL, 0);
+  }
+
+  size_t output_capacity = (size_t)orig_size;
+  if (backend->id == ALGO_SNAPPY) {
+    output_capacity = snappy_decompressed_size(payload, comp_size);
+    if (output_capacity != (size_t)orig_size) {
+      PyErr_SetString(PyExc_RuntimeError,
+                      "Failed to determine decompressed size for Snappy");
+      return NULL;
+    }
+  }
+
+  PyObject *result =
+      PyBytes_FromStringAndSize(NULL, (Py_ssize_t)output_capacity);
+  if (!result) {
+    return NULL;
+  }
+
+  size_t output_size = 0;
+  if (backend->decompress_buffer(
+          payload, comp_size, (unsigned char *)PyBytes_AS_STRING(result),
+          &output_capacity, &output_size) != 0 ||
+      output_size != (size_t)orig_size) {
+    Py_DECREF(result);
+    set_backend_error(backend, "decompression", "buffer decompression");
+    return NULL;
+  }
+
+  return result;
+}
@@ -172,6 +172,8 @@ static int bzip2_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
 static const CBackend bzip2_backend = {
     .name = "bzip2",
     .id = ALGO_BZIP2,
+    .min_level = 1,
+    .max_level = 9,
     .is_available = bzip2_is_available,
     .max_compressed_size = bzip2_max_compressed_size,
     .compress_buffer = bzip2_compress_buffer,
@@ -22,37 +22,96 @@ static int LZ4_level_from_generic(int level) {
   return level;
 }
 
-// ---- Buffer Compression/Decompression ----
+// ---- Thread Contexts ----
+
+// Frame contexts are reused per thread: compressBegin restarts a compression
+// context and a decompression context is reset before each frame
+static COMPRESSO_THREAD_LOCAL LZ4F_compressionContext_t tls_cctx = NULL;
+static COMPRESSO_THREAD_LOCAL LZ4F_decompressionContext_t tls_dctx = NULL;
+
+static LZ4F_compressionContext_t lz4_thread_cctx(void) {
+  if (!tls_cctx) {
+    if (LZ4F_isError(LZ4F_createCompressionContext(&tls_cctx, LZ4F_VERSION))) {
+      tls_cctx = NULL;
+      return NULL;
+    }
+    track_thread_contexts();
+  }
+  return tls_cctx;
+}
+
+static LZ4F_decompressionContext_t lz4_thread_dctx(void) {
+  if (tls_dctx) {
+    LZ4F_resetDecompressionContext(tls_dctx);
+    return tls_dctx;
+  }
+
+  if (LZ4F_isError(LZ4F_createDecompressionContext(&tls_dctx, LZ4F_VERSION))) {
+    tls_dctx = NULL;
+    return NULL;
+  }
+  track_thread_contexts();
+  return tls_dctx;
+}
+
+static void lz4_release_thread_contexts(void) {
+  if (tls_cctx) {
+    LZ4F_freeCompressionContext(tls_cctx);
+    tls_cctx = NULL;
+  }
+  if (tls_dctx) {
+    LZ4F_freeDecompressionContext(tls_dctx);
+    tls_dctx = NULL;
+  }
+}
+
+// ---- Block Compression/Decompression ----
+
+static int lz4_compress_block(const unsigned char *input, size_t input_size,
+                              unsigned char *output, size_t *output_capacity,
+                              int level, size_t *output_size) {
+  LZ4F_compressionContext_t cctx = lz4_thread_cctx();
+  if (!cctx) {
+    return -1; // failed to create compression context
+  }
 
-static int lz4_compress_buffer(const unsigned char *input, size_t input_size,
-                               unsigned char *output, size_t *output_capacity,
-                               int level, size_t *output_size) {
   LZ4F_preferences_t prefs;
   memset(&prefs, 0, sizeof(prefs));
   prefs.compressionLevel = LZ4_level_from_generic(level);
+  prefs.frameInfo.contentSize = input_size;
 
-  size_t ret;
-  Py_BEGIN_ALLOW_THREADS ret =
-      LZ4F_compressFrame(output, *output_capacity, input, input_size, &prefs);
-  Py_END_ALLOW_THREADS
+  size_t capacity = *output_capacity;
+  size_t pos = LZ4F_compressBegin(cctx, output, capacity, &prefs);
+  if (LZ4F_isError(pos)) {
+    return -1; // compression failed
+  }
 
-      if (LZ4F_isError(ret)) {
+  size_t ret = LZ4F_compressUpdate(cctx, output + pos, capacity - pos, input,
+                                   input_size, NULL);
+  if (LZ4F_isError(ret)) {
     return -1; // compression failed
   }
+  pos += ret;
 
-  *output_size = ret;
+  ret = LZ4F_compressEnd(cctx, output + pos, capacity - pos, NULL);
+  if (LZ4F_isError(ret)) {
+    return -1; // compression failed
+  }
+
+  *output_size = pos + ret;
   return 0; // success
 }
 
-static int lz4_decompress_buffer(const unsigned char *input, size_t input_size,
-                                 unsigned char *output, size_t *output_capacity,
-                                 size_t *output_size) {
-  LZ4F_decompressionContext_t dctx;
-  size_t ret = LZ4F_createDecompressionContext(&dctx, LZ4F_VERSION);
-  if (LZ4F_isError(ret)) {
+static int lz4_decompress_block(const unsigned char *input, size_t input_size,
+                                unsigned char *output, size_t *output_capacity,
+                                size_t *output_size) {
+  LZ4F_decompressionContext_t dctx = lz4_thread_dctx();
+  if (!dctx) {
     return -1; // failed to create decompression context
   }
 
+  size_t ret;
+
   size_t src_size = input_size;
   size_t dst_size = *output_capacity;
 
@@ -60,14 +119,9 @@ static int lz4_decompress_buffer(const unsigned char *input, size_t input_size,
   size_t output_pos = 0;
   int err = 0;
 
-  Py_BEGIN_ALLOW_THREADS
-
-      while (input_pos < src_size && output_pos < dst_size) {
-    size_t input_chunk = src_size - input_pos;
-    size_t output_chunk = dst_size - output_pos;
-
-    size_t src_size_tmp = input_chunk;
-    size_t dst_size_tmp = output_chunk;
+  while (input_pos < src_size && output_pos < dst_size) {
+    size_t src_size_tmp = src_size - input_pos;
+    size_t dst_size_tmp = dst_size - output_pos;
 
     ret = LZ4F_decompress(dctx, output + output_pos, &dst_size_tmp,
                           input + input_pos, &src_size_tmp, NULL);
@@ -85,10 +139,6 @@ static int lz4_decompress_buffer(const unsigned char *input, size_t input_size,
     }
   }
 
-  Py_END_ALLOW_THREADS
-
-      LZ4F_freeDecompressionContext(dctx);
-
   if (err) {
     return -1; // decompression failed
   }
@@ -97,12 +147,35 @@ static int lz4_decompress_buffer(const unsigned char *input, size_t input_size,
   return 0; // success
 }
 
+// ---- Buffer Compression/Decompression ----
+
+static int lz4_compress_buffer(const unsigned char *input, size_t input_size,
+                               unsigned char *output, size_t *output_capacity,
+                               int level, size_t *output_size) {
+  int ret;
+  Py_BEGIN_ALLOW_THREADS ret = lz4_compress_block(
+      input, input_size, output, output_capacity, level, output_size);
+  Py_END_ALLOW_THREADS
+
+      return ret;
+}
+
+static int lz4_decompress_buffer(const unsigned char *input, size_t input_size,
+                                 unsigned char *output, size_t *output_capacity,
+                                 size_t *output_size) {
+  int ret;
+  Py_BEGIN_ALLOW_THREADS ret = lz4_decompress_block(
+      input, input_size, output, output_capacity, output_size);
+  Py_END_ALLOW_THREADS
+
+      return ret;
+}
+
 // ---- Stream Compression/Decompression ----
 
 static int lz4_compress_stream(FILE *src, FILE *dst, int level) {
-  LZ4F_compressionContext_t cctx;
-  size_t ret = LZ4F_createCompressionContext(&cctx, LZ4F_VERSION);
-  if (LZ4F_isError(ret)) {
+  LZ4F_compressionContext_t cctx = lz4_thread_cctx();
+  if (!cctx) {
     return -1; // failed to create compression context
   }
 
@@ -170,19 +243,19 @@ static int lz4_compress_stream(FILE *src, FILE *dst, int level) {
 done_stream:
   Py_END_ALLOW_THREADS
 
-      LZ4F_freeCompressionContext(cctx);
-  return return_code;
+      return return_code;
 }
 
 static int lz4_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
   (void)orig_size; // unused parameter
 
-  LZ4F_decompressionContext_t dctx;
-  size_t ret = LZ4F_createDecompressionContext(&dctx, LZ4F_VERSION);
-  if (LZ4F_isError(ret)) {
+  LZ4F_decompressionContext_t dctx = lz4_thread_dctx();
+  if (!dctx) {
     return -1; // failed to create decompression context
   }
 
+  size_t ret;
+
   unsigned char input[LZ4_CHUNK];
   unsigned char output[LZ4_OUT_CHUNK];
 
@@ -234,8 +307,7 @@ static int lz4_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
 
   Py_END_ALLOW_THREADS
 
-      LZ4F_freeDecompressionContext(dctx);
-  return return_code;
+      return return_code;
 }
 
 // ---- Backend Definition ----
@@ -243,12 +315,18 @@ static int lz4_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
 static const CBackend lz4_backend = {
     .name = "lz4",
     .id = ALGO_LZ4,
+    .min_level = 0,
+    .max_level = 12,
+    .map_io = 1,
     .is_available = lz4_is_available,
     .max_compressed_size = lz4_max_compressed_size,
     .compress_buffer = lz4_compress_buffer,
     .decompress_buffer = lz4_decompress_buffer,
     .compress_stream = lz4_compress_stream,
     .decompress_stream = lz4_decompress_stream,
+    .compress_block = lz4_compress_block,
+    .decompress_block = lz4_decompress_block,
+    .release_thread_contexts = lz4_release_thread_contexts,
 };
 
 const CBackend *get_lz4_backend(void) { return &lz4_backend; }
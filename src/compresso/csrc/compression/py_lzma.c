@@ -168,6 +168,7 @@ static int lzma_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
   unsigned char output[LZMA_CHUNK];
 
   int return_code = 0;
+  int memlimit_hit = 0;
 
   Py_BEGIN_ALLOW_THREADS
 
@@ -205,11 +206,7 @@ static int lzma_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
     }
 
     if (ret != LZMA_OK) {
-      if (ret == LZMA_MEMLIMIT_ERROR) {
-        PyErr_Format(comp_BackendError,
-                     "LZMA decompression exceeded memory limit: %llu",
-                     (unsigned long long)LZMA_DECOMPRESS_MEMLIMIT);
-      }
+      memlimit_hit = ret == LZMA_MEMLIMIT_ERROR;
       return_code = -1; // decompression error
       break;
     }
@@ -218,6 +215,13 @@ static int lzma_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
   Py_END_ALLOW_THREADS
 
       lzma_end(&strm);
+
+  // Raised only once the GIL is held again
+  if (memlimit_hit) {
+    PyErr_Format(comp_BackendError,
+                 "LZMA decompression exceeded memory limit: %llu",
+                 (unsigned long long)LZMA_DECOMPRESS_MEMLIMIT);
+  }
   return return_code;
 }
 
@@ -226,6 +230,8 @@ static int lzma_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
 static const CBackend lzma_backend = {
     .name = "lzma",
     .id = ALGO_LZMA,
+    .min_level = 0,
+    .max_level = 9,
     .is_available = lzma_is_available,
     .max_compressed_size = lzma_max_compressed_size,
     .compress_buffer = lzma_compress_buffer,
@@ -12,46 +12,61 @@ static size_t snappy_max_compressed_size(size_t input_size) {
   return snappy_max_compressed_length(input_size);
 }
 
-// ---- Buffer Compression/Decompression ----
+// ---- Block Compression/Decompression ----
 
-static int snappy_compress_buffer(const unsigned char *input, size_t input_size,
-                                  unsigned char *output,
-                                  size_t *output_capacity, int level,
-                                  size_t *output_size) {
+static int snappy_compress_block(const unsigned char *input, size_t input_size,
+                                 unsigned char *output, size_t *output_capacity,
+                                 int level, size_t *output_size) {
   (void)level; // snappy does not use compression level
 
   size_t dest_len = *output_capacity;
-  snappy_status status;
+  if (snappy_compress((const char *)input, input_size, (char *)output,
+                      &dest_len) != SNAPPY_OK) {
+    return -1; // compression failed
+  }
 
-  Py_BEGIN_ALLOW_THREADS status = snappy_compress(
-      (const char *)input, input_size, (char *)output, &dest_len);
-  Py_END_ALLOW_THREADS
+  *output_size = dest_len;
+  return 0; // success
+}
 
-      if (status != SNAPPY_OK) {
-    return -1; // compression failed
+static int snappy_decompress_block(const unsigned char *input,
+                                   size_t input_size, unsigned char *output,
+                                   size_t *output_capacity,
+                                   size_t *output_size) {
+  size_t dest_len = *output_capacity;
+  if (snappy_uncompress((const char *)input, input_size, (char *)output,
+                        &dest_len) != SNAPPY_OK) {
+    return -1; // decompression failed
   }
 
   *output_size = dest_len;
   return 0; // success
 }
 
+// ---- Buffer Compression/Decompression ----
+
+static int snappy_compress_buffer(const unsigned char *input, size_t input_size,
+                                  unsigned char *output,
+                                  size_t *output_capacity, int level,
+                                  size_t *output_size) {
+  int ret;
+  Py_BEGIN_ALLOW_THREADS ret = snappy_compress_block(
+      input, input_size, output, output_capacity, level, output_size);
+  Py_END_ALLOW_THREADS
+
+      return ret;
+}
+
 static int snappy_decompress_buffer(const unsigned char *input,
                                     size_t input_size, unsigned char *output,
                                     size_t *output_capacity,
                                     size_t *output_size) {
-  size_t dest_len = *output_capacity;
-  snappy_status status;
-
-  Py_BEGIN_ALLOW_THREADS status = snappy_uncompress(
-      (const char *)input, input_size, (char *)output, &dest_len);
+  int ret;
+  Py_BEGIN_ALLOW_THREADS ret = snappy_decompress_block(
+      input, input_size, output, output_capacity, output_size);
   Py_END_ALLOW_THREADS
 
-      if (status != SNAPPY_OK) {
-    return -1; // decompression failed
-  }
-
-  *output_size = dest_len;
-  return 0; // success
+      return ret;
 }
 
 // ---- Helpers ----
@@ -225,12 +240,18 @@ static int snappy_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
 static const CBackend snappy_backend = {
     .name = "snappy",
     .id = ALGO_SNAPPY,
+    .min_level = 0,
+    .max_level = 0,
+    .level_ignored = 1,
+    .map_io = 1,
     .is_available = snappy_is_available,
     .max_compressed_size = snappy_max_compressed_size,
     .compress_buffer = snappy_compress_buffer,
     .decompress_buffer = snappy_decompress_buffer,
     .compress_stream = snappy_compress_stream,
     .decompress_stream = snappy_decompress_stream,
+    .compress_block = snappy_compress_block,
+    .decompress_block = snappy_decompress_block,
 };
 
 const CBackend *get_snappy_backend(void) { return &snappy_backend; }
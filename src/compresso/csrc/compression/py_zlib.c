@@ -186,6 +186,8 @@ done:
 static const CBackend zlib_backend = {
     .name = "zlib",
     .id = ALGO_ZLIB,
+    .min_level = 0,
+    .max_level = 9,
     .is_available = zlib_is_available,
     .max_compressed_size = zlib_max_compressed_size,
     .compress_buffer = zlib_compress_buffer,
@@ -1,6 +1,8 @@
 #define PY_SSIZE_T_CLEAN
 #define ZSTD_CHUNK 65536 // 64KB
 #include "../common.h"
+#include "../fileio.h"
+#include "../parallel.h"
 #include <Python.h>
 #include <zstd.h>
 
@@ -20,6 +22,54 @@ static int zstd_level_from_generic(int level) {
   return level;
 }
 
+// ---- Thread Contexts ----
+
+// One compression and one decompression context per thread, created on first
+// use and reset between calls instead of being reallocated
+static COMPRESSO_THREAD_LOCAL ZSTD_CCtx *tls_cctx = NULL;
+static COMPRESSO_THREAD_LOCAL ZSTD_DCtx *tls_dctx = NULL;
+
+static ZSTD_CCtx *zstd_thread_cctx(void) {
+  if (tls_cctx) {
+    ZSTD_CCtx_reset(tls_cctx, ZSTD_reset_session_and_parameters);
+    return tls_cctx;
+  }
+
+  tls_cctx = ZSTD_createCCtx();
+  if (tls_cctx)
+    track_thread_contexts();
+  return tls_cctx;
+}
+
+static ZSTD_DCtx *zstd_thread_dctx(void) {
+  if (tls_dctx) {
+    ZSTD_DCtx_reset(tls_dctx, ZSTD_reset_session_and_parameters);
+    return tls_dctx;
+  }
+
+  tls_dctx = ZSTD_createDCtx();
+  if (tls_dctx)
+    track_thread_contexts();
+  return tls_dctx;
+}
+
+static void zstd_release_thread_contexts(void) {
+  ZSTD_freeCCtx(tls_cctx);
+  tls_cctx = NULL;
+  ZSTD_freeDCtx(tls_dctx);
+  tls_dctx = NULL;
+}
+
+// Hand large inputs to libzstd's own worker pool, within the process thread
+// cap; a no-op (the call fails and the context stays single-threaded) when
+// libzstd was built without ZSTD_MULTITHREAD
+static void zstd_enable_workers(ZSTD_CCtx *cctx, uint64_t input_size) {
+  int workers = parallel_workers();
+  if (workers > 1 && input_size >= PARALLEL_MIN_SIZE) {
+    ZSTD_CCtx_setParameter(cctx, ZSTD_c_nbWorkers, workers);
+  }
+}
+
 // ---- Buffer Compression/Decompression ----
 
 static int zstd_compress_buffer(const unsigned char *input, size_t input_size,
@@ -28,9 +78,16 @@ static int zstd_compress_buffer(const unsigned char *input, size_t input_size,
   int zlevel =
       (level >= 0) ? zstd_level_from_generic(level) : ZSTD_CLEVEL_DEFAULT;
 
-  int ret;
+  ZSTD_CCtx *cctx = zstd_thread_cctx();
+  if (!cctx)
+    return -1; // memory allocation failure
+
+  ZSTD_CCtx_setParameter(cctx, ZSTD_c_compressionLevel, zlevel);
+  zstd_enable_workers(cctx, input_size);
+
+  size_t ret;
   Py_BEGIN_ALLOW_THREADS ret =
-      ZSTD_compress(output, *output_capacity, input, input_size, zlevel);
+      ZSTD_compress2(cctx, output, *output_capacity, input, input_size);
   Py_END_ALLOW_THREADS
 
       if (ZSTD_isError(ret)) {
@@ -45,9 +102,13 @@ static int zstd_decompress_buffer(const unsigned char *input, size_t input_size,
                                   unsigned char *output,
                                   size_t *output_capacity,
                                   size_t *output_size) {
-  int ret;
-  Py_BEGIN_ALLOW_THREADS ret =
-      ZSTD_decompress(output, *output_capacity, input, input_size);
+  ZSTD_DCtx *dctx = zstd_thread_dctx();
+  if (!dctx)
+    return -1; // memory allocation failure
+
+  size_t ret;
+  Py_BEGIN_ALLOW_THREADS ret = ZSTD_decompressDCtx(dctx, output, *output_capacity,
+                                                   input, input_size);
   Py_END_ALLOW_THREADS
 
       if (ZSTD_isError(ret)) {
@@ -64,16 +125,22 @@ static int zstd_compress_stream(FILE *src, FILE *dst, int level) {
   int zlevel =
       (level >= 0) ? zstd_level_from_generic(level) : ZSTD_CLEVEL_DEFAULT;
 
-  ZSTD_CStream *cstream = ZSTD_createCStream();
+  ZSTD_CStream *cstream = zstd_thread_cctx();
   if (!cstream)
     return -1; // memory allocation failure
 
-  size_t ret = ZSTD_initCStream(cstream, zlevel);
+  size_t ret = ZSTD_CCtx_setParameter(cstream, ZSTD_c_compressionLevel, zlevel);
   if (ZSTD_isError(ret)) {
-    ZSTD_freeCStream(cstream);
     return -1; // initialisation failure
   }
 
+  // Same threshold as the buffer path; pipes and other unsized inputs stay
+  // single-threaded
+  int64_t src_size = fileio_size(fileno(src));
+  if (src_size > 0) {
+    zstd_enable_workers(cstream, (uint64_t)src_size);
+  }
+
   unsigned char input[ZSTD_CHUNK];
   unsigned char output[ZSTD_CHUNK];
 
@@ -124,24 +191,16 @@ static int zstd_compress_stream(FILE *src, FILE *dst, int level) {
 
   Py_END_ALLOW_THREADS
 
-      ZSTD_freeCStream(cstream);
-
-  return err ? -1 : 0; // success or failure
+      return err ? -1 : 0; // success or failure
 }
 
 static int zstd_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
   (void)orig_size; // unused
 
-  ZSTD_DStream *dstream = ZSTD_createDStream();
+  ZSTD_DStream *dstream = zstd_thread_dctx();
   if (!dstream)
     return -1; // memory allocation failure
 
-  size_t ret = ZSTD_initDStream(dstream);
-  if (ZSTD_isError(ret)) {
-    ZSTD_freeDStream(dstream);
-    return -1; // initialisation failure
-  }
-
   unsigned char input[ZSTD_CHUNK];
   unsigned char output[ZSTD_CHUNK];
 
@@ -188,9 +247,9 @@ static int zstd_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
     }
   }
 
-  Py_END_ALLOW_THREADS ZSTD_freeDStream(dstream);
+  Py_END_ALLOW_THREADS
 
-  return err ? -1 : 0; // success or failure
+      return err ? -1 : 0; // success or failure
 }
 
 // ---- Backend Definition ----
@@ -198,12 +257,16 @@ static int zstd_decompress_stream(FILE *src, FILE *dst, uint64_t orig_size) {
 static const CBackend zstd_backend = {
     .name = "zstd",
     .id = ALGO_ZSTD,
+    .min_level = 1,
+    .max_level = 22, // ZSTD_maxCLevel() in every release
+    .map_io = 1,
     .is_available = zstd_is_available,
     .max_compressed_size = zstd_max_compressed_size,
     .compress_buffer = zstd_compress_buffer,
     .decompress_buffer = zstd_decompress_buffer,
     .compress_stream = zstd_compress_stream,
     .decompress_stream = zstd_decompress_stream,
+    .release_thread_contexts = zstd_release_thread_contexts,
 };
 
 const CBackend *get_zstd_backend(void) { return &zstd_backend; }
@@ -0,0 +1,202 @@
+#include "crc32_hw.h"
+#include <limits.h>
+#include <zlib.h>
+
+// The SSE4.2 crc32 instruction implements CRC-32C (Castagnoli), not the
+// IEEE polynomial gzip uses, so x86 folds with PCLMULQDQ instead.
+
+#if defined(__x86_64__) && (defined(__GNUC__) || defined(__clang__))
+#define COMPRESSO_CRC32_PCLMUL 1
+#include <immintrin.h>
+#elif defined(__aarch64__) && defined(__ARM_FEATURE_CRC32)
+#define COMPRESSO_CRC32_ARM 1
+#include <arm_acle.h>
+#include <string.h>
+#endif
+
+// ---- Portable Fallback ----
+
+static uint32_t crc32_zlib(uint32_t crc, const unsigned char *buf,
+                           size_t len) {
+  while (len > 0) {
+    uInt n = len > UINT_MAX ? UINT_MAX : (uInt)len;
+    crc = (uint32_t)crc32((uLong)crc, buf, n);
+    buf += n;
+    len -= n;
+  }
+
+  return crc;
+}
+
+// ---- x86 PCLMULQDQ Folding ----
+
+#ifdef COMPRESSO_CRC32_PCLMUL
+
+// Four-way parallel folding as described in Intel's "Fast CRC Computation
+// for Generic Polynomials Using PCLMULQDQ Instruction", with the bit-reflected
+// constants for the IEEE polynomial. Operates on the raw (pre-inverted) CRC
+// state; requires len >= 64 and a multiple of 16.
+__attribute__((target("sse4.1,pclmul"))) static uint32_t
+crc32_fold_pclmul(const unsigned char *buf, size_t len, uint32_t crc) {
+  static const uint64_t k1k2[2] __attribute__((aligned(16))) = {0x0154442bd4,
+                                                                0x01c6e41596};
+  static const uint64_t k3k4[2] __attribute__((aligned(16))) = {0x01751997d0,
+                                                                0x00ccaa009e};
+  static const uint64_t k5k0[2] __attribute__((aligned(16))) = {0x0163cd6124,
+                                                                0x0000000000};
+  static const uint64_t poly[2] __attribute__((aligned(16))) = {0x01db710641,
+                                                                0x01f7011641};
+
+  __m128i x0, x1, x2, x3, x4, x5, x6, x7, x8, y5, y6, y7, y8;
+
+  x1 = _mm_loadu_si128((const __m128i *)(buf + 0x00));
+  x2 = _mm_loadu_si128((const __m128i *)(buf + 0x10));
+  x3 = _mm_loadu_si128((const __m128i *)(buf + 0x20));
+  x4 = _mm_loadu_si128((const __m128i *)(buf + 0x30));
+
+  x1 = _mm_xor_si128(x1, _mm_cvtsi32_si128((int)crc));
+  x0 = _mm_load_si128((const __m128i *)k1k2);
+
+  buf += 64;
+  len -= 64;
+
+  // Fold 64 bytes per iteration through four independent accumulators
+  while (len >= 64) {
+    x5 = _mm_clmulepi64_si128(x1, x0, 0x00);
+    x6 = _mm_clmulepi64_si128(x2, x0, 0x00);
+    x7 = _mm_clmulepi64_si128(x3, x0, 0x00);
+    x8 = _mm_clmulepi64_si128(x4, x0, 0x00);
+
+    x1 = _mm_clmulepi64_si128(x1, x0, 0x11);
+    x2 = _mm_clmulepi64_si128(x2, x0, 0x11);
+    x3 = _mm_clmulepi64_si128(x3, x0, 0x11);
+    x4 = _mm_clmulepi64_si128(x4, x0, 0x11);
+
+    y5 = _mm_loadu_si128((const __m128i *)(buf + 0x00));
+    y6 = _mm_loadu_si128((const __m128i *)(buf + 0x10));
+    y7 = _mm_loadu_si128((const __m128i *)(buf + 0x20));
+    y8 = _mm_loadu_si128((const __m128i *)(buf + 0x30));
+
+    x1 = _mm_xor_si128(_mm_xor_si128(x1, x5), y5);
+    x2 = _mm_xor_si128(_mm_xor_si128(x2, x6), y6);
+    x3 = _mm_xor_si128(_mm_xor_si128(x3, x7), y7);
+    x4 = _mm_xor_si128(_mm_xor_si128(x4, x8), y8);
+
+    buf += 64;
+    len -= 64;
+  }
+
+  // Fold the four accumulators into one
+  x0 = _mm_load_si128((const __m128i *)k3k4);
+
+  x5 = _mm_clmulepi64_si128(x1, x0, 0x00);
+  x1 = _mm_clmulepi64_si128(x1, x0, 0x11);
+  x1 = _mm_xor_si128(_mm_xor_si128(x1, x2), x5);
+
+  x5 = _mm_clmulepi64_si128(x1, x0, 0x00);
+  x1 = _mm_clmulepi64_si128(x1, x0, 0x11);
+  x1 = _mm_xor_si128(_mm_xor_si128(x1, x3), x5);
+
+  x5 = _mm_clmulepi64_si128(x1, x0, 0x00);
+  x1 = _mm_clmulepi64_si128(x1, x0, 0x11);
+  x1 = _mm_xor_si128(_mm_xor_si128(x1, x4), x5);
+
+  // Remaining 16-byte blocks
+  while (len >= 16) {
+    x2 = _mm_loadu_si128((const __m128i *)buf);
+
+    x5 = _mm_clmulepi64_si128(x1, x0, 0x00);
+    x1 = _mm_clmulepi64_si128(x1, x0, 0x11);
+    x1 = _mm_xor_si128(_mm_xor_si128(x1, x2), x5);
+
+    buf += 16;
+    len -= 16;
+  }
+
+  // Fold 128 bits down to 64
+  x2 = _mm_clmulepi64_si128(x1, x0, 0x10);
+  x3 = _mm_setr_epi32(~0, 0, ~0, 0);
+  x1 = _mm_srli_si128(x1, 8);
+  x1 = _mm_xor_si128(x1, x2);
+
+  x0 = _mm_loadl_epi64((const __m128i *)k5k0);
+
+  x2 = _mm_srli_si128(x1, 4);
+  x1 = _mm_and_si128(x1, x3);
+  x1 = _mm_clmulepi64_si128(x1, x0, 0x00);
+  x1 = _mm_xor_si128(x1, x2);
+
+  // Barrett reduction to 32 bits
+  x0 = _mm_load_si128((const __m128i *)poly);
+
+  x2 = _mm_and_si128(x1, x3);
+  x2 = _mm_clmulepi64_si128(x2, x0, 0x10);
+  x2 = _mm_and_si128(x2, x3);
+  x2 = _mm_clmulepi64_si128(x2, x0, 0x00);
+  x1 = _mm_xor_si128(x1, x2);
+
+  return (uint32_t)_mm_extract_epi32(x1, 1);
+}
+
+static int have_pclmul(void) {
+  static int cached = -1;
+
+  if (cached < 0) {
+    __builtin_cpu_init();
+    cached = __builtin_cpu_supports("pclmul") &&
+             __builtin_cpu_supports("sse4.1");
+  }
+
+  return cached;
+}
+
+#endif
+
+// ---- ARMv8 CRC32 Instructions ----
+
+#ifdef COMPRESSO_CRC32_ARM
+
+// __crc32d implements the IEEE polynomial (the CRC-32C variant is __crc32cd)
+static uint32_t crc32_arm(uint32_t crc, const unsigned char *buf, size_t len) {
+  crc = ~crc;
+
+  while (len >= 8) {
+    uint64_t word;
+    memcpy(&word, buf, sizeof(word));
+    crc = __crc32d(crc, word);
+    buf += 8;
+    len -= 8;
+  }
+
+  while (len > 0) {
+    crc = __crc32b(crc, *buf++);
+    len--;
+  }
+
+  return ~crc;
+}
+
+#endif
+
+// ---- Public API ----
+
+uint32_t compresso_crc32(uint32_t crc, const unsigned char *buf, size_t len) {
+  if (!buf) {
+    return 0; // matches zlib's crc32(x, Z_NULL, 0) seed
+  }
+
+#ifdef COMPRESSO_CRC32_PCLMUL
+  if (len >= 64 && have_pclmul()) {
+    size_t bulk = len & ~(size_t)15;
+    crc = ~crc32_fold_pclmul(buf, bulk, ~crc);
+    buf += bulk;
+    len -= bulk;
+  }
+#endif
+
+#ifdef COMPRESSO_CRC32_ARM
+  return crc32_arm(crc, buf, len);
+#else
+  return len ? crc32_zlib(crc, buf, len) : crc;
+#endif
+}
@@ -0,0 +1,11 @@
+#ifndef CRC32_HW_H
+#define CRC32_HW_H
+
+#include <stddef.h>
+#include <stdint.h>
+
+// Drop-in for zlib's crc32(): same polynomial, seed and chaining, but uses
+// carry-less multiply (x86) or the CRC32 instructions (ARMv8) when present
+uint32_t compresso_crc32(uint32_t crc, const unsigned char *buf, size_t len);
+
+#endif // CRC32_HW_H
@@ -0,0 +1,369 @@
+#define _GNU_SOURCE
+#include "fileio.h"
+#include <errno.h>
+#include <limits.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+#include <sys/stat.h>
+
+#if defined(_WIN32) || defined(_WIN64)
+#include <io.h>
+#else
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/utsname.h>
+#include <unistd.h>
+#endif
+
+#ifdef COMPRESSO_HAVE_LIBURING
+#include <liburing.h>
+
+#define URING_QUEUE_DEPTH 8
+#define URING_CHUNK_SIZE (256u * 1024u)
+#endif
+
+// ---- Feature Detection ----
+
+#ifdef COMPRESSO_HAVE_LIBURING
+
+// IORING_OP_READ and friends landed in Linux 5.6
+static int kernel_supports_uring(void) {
+  struct utsname uts;
+  int major = 0;
+  int minor = 0;
+
+  if (uname(&uts) != 0 || sscanf(uts.release, "%d.%d", &major, &minor) != 2) {
+    return 0;
+  }
+
+  return major > 5 || (major == 5 && minor >= 6);
+}
+
+#endif
+
+static int uring_enabled(void) {
+#ifdef COMPRESSO_HAVE_LIBURING
+  static int cached = -1;
+
+  if (cached < 0) {
+    const char *env = getenv("COMPRESSO_URING");
+    cached = (env && strcmp(env, "1") == 0 && kernel_supports_uring()) ? 1 : 0;
+  }
+
+  return cached;
+#else
+  return 0;
+#endif
+}
+
+int fileio_use_uring(size_t len) {
+  return len >= FILEIO_URING_MIN_SIZE && uring_enabled();
+}
+
+// ---- pread Reader ----
+
+static int pread_fully(int fd, uint64_t offset, unsigned char *buf,
+                       size_t len) {
+  size_t done = 0;
+
+#if defined(_WIN32) || defined(_WIN64)
+  if (_lseeki64(fd, (__int64)offset, SEEK_SET) < 0) {
+    return -1;
+  }
+
+  while (done < len) {
+    size_t want = len - done;
+    int n = _read(fd, buf + done, want > INT_MAX ? INT_MAX : (unsigned)want);
+    if (n < 0) {
+      return -1;
+    }
+    if (n == 0) {
+      errno = 0; // premature EOF
+      return -1;
+    }
+    done += (size_t)n;
+  }
+
+  return 0;
+#else
+
+  while (done < len) {
+    ssize_t n = pread(fd, buf + done, len - done, (off_t)(offset + done));
+    if (n < 0) {
+      if (errno == EINTR) {
+        continue;
+      }
+      return -1;
+    }
+    if (n == 0) {
+      errno = 0; // premature EOF
+      return -1;
+    }
+    done += (size_t)n;
+  }
+
+  return 0;
+#endif
+}
+
+// ---- io_uring Reader ----
+
+#ifdef COMPRESSO_HAVE_LIBURING
+
+typedef struct {
+  size_t off; // offset into buf of the pending read
+  size_t len; // bytes still expected for this slot
+} UringSlot;
+
+static void uring_prep(struct io_uring_sqe *sqe, int fd, uint64_t offset,
+                       unsigned char *buf, UringSlot *slot, int fixed) {
+  if (fixed) {
+    io_uring_prep_read_fixed(sqe, fd, buf + slot->off, (unsigned)slot->len,
+                             offset + slot->off, 0);
+  } else {
+    io_uring_prep_read(sqe, fd, buf + slot->off, (unsigned)slot->len,
+                       offset + slot->off);
+  }
+  io_uring_sqe_set_data(sqe, slot);
+}
+
+// Returns 0 on success, -1 on a read error, 1 if the ring is unusable and the
+// caller should fall back to pread
+static int uring_read(int fd, uint64_t offset, unsigned char *buf,
+                      size_t len) {
+  struct io_uring ring;
+  if (io_uring_queue_init(URING_QUEUE_DEPTH, &ring, 0) < 0) {
+    return 1;
+  }
+
+  // Pinning the destination lets the kernel skip per-read page mapping;
+  // RLIMIT_MEMLOCK may refuse large buffers, in which case plain reads are used
+  struct iovec iov = {.iov_base = buf, .iov_len = len};
+  int fixed = io_uring_register_buffers(&ring, &iov, 1) == 0;
+
+  UringSlot slots[URING_QUEUE_DEPTH];
+  UringSlot *free_slots[URING_QUEUE_DEPTH];
+  unsigned n_free = URING_QUEUE_DEPTH;
+  for (unsigned i = 0; i < URING_QUEUE_DEPTH; i++) {
+    free_slots[i] = &slots[URING_QUEUE_DEPTH - 1 - i];
+  }
+
+  size_t submitted = 0;
+  size_t completed = 0;
+  int rc = 0;
+
+  while (completed < len) {
+    // Keep the queue full so the device always has reads outstanding
+    while (n_free > 0 && submitted < len) {
+      struct io_uring_sqe *sqe = io_uring_get_sqe(&ring);
+      if (!sqe) {
+        break;
+      }
+
+      UringSlot *slot = free_slots[--n_free];
+      slot->off = submitted;
+      slot->len = len - submitted < URING_CHUNK_SIZE ? len - submitted
+                                                     : URING_CHUNK_SIZE;
+      uring_prep(sqe, fd, offset, buf, slot, fixed);
+      submitted += slot->len;
+    }
+
+    int ret = io_uring_submit_and_wait(&ring, 1);
+    if (ret < 0 && ret != -EINTR) {
+      errno = -ret;
+      rc = -1;
+      break;
+    }
+
+    struct io_uring_cqe *cqe;
+    unsigned head;
+    unsigned seen = 0;
+    io_uring_for_each_cqe(&ring, head, cqe) {
+      UringSlot *slot = (UringSlot *)io_uring_cqe_get_data(cqe);
+      int res = cqe->res;
+      seen++;
+
+      if (res == -EINTR || res == -EAGAIN) {
+        res = 0; // resubmit the whole slot
+      } else if (res <= 0) {
+        errno = -res; // 0 on premature EOF
+        rc = -1;
+        free_slots[n_free++] = slot;
+        continue;
+      }
+
+      completed += (size_t)res;
+      slot->off += (size_t)res;
+      slot->len -= (size_t)res;
+
+      if (slot->len == 0) {
+        free_slots[n_free++] = slot;
+        continue;
+      }
+
+      // Short read: queue the remainder of this slot
+      struct io_uring_sqe *sqe = io_uring_get_sqe(&ring);
+      if (!sqe) {
+        io_uring_submit(&ring);
+        sqe = io_uring_get_sqe(&ring);
+      }
+      if (!sqe) {
+        errno = EBUSY;
+        rc = -1;
+        free_slots[n_free++] = slot;
+        continue;
+      }
+      uring_prep(sqe, fd, offset, buf, slot, fixed);
+    }
+    io_uring_cq_advance(&ring, seen);
+
+    if (rc != 0) {
+      break;
+    }
+  }
+
+  if (rc != 0) {
+    // Reads still in flight target buf, wait for them before handing it back
+    int saved_errno = errno;
+    unsigned pending = URING_QUEUE_DEPTH - n_free;
+    struct io_uring_cqe *cqe;
+
+    io_uring_submit(&ring);
+    while (pending > 0 && io_uring_wait_cqe(&ring, &cqe) == 0) {
+      io_uring_cqe_seen(&ring, cqe);
+      pending--;
+    }
+    errno = saved_errno;
+  }
+
+  if (fixed) {
+    io_uring_unregister_buffers(&ring);
+  }
+  io_uring_queue_exit(&ring);
+  return rc;
+}
+
+#endif
+
+// ---- Public API ----
+
+int fileio_read_at(int fd, uint64_t offset, unsigned char *buf, size_t len) {
+#ifdef COMPRESSO_HAVE_LIBURING
+  if (fileio_use_uring(len)) {
+    int rc = uring_read(fd, offset, buf, len);
+    if (rc <= 0) {
+      return rc;
+    }
+  }
+#endif
+
+  return pread_fully(fd, offset, buf, len);
+}
+
+// ---- Memory Mapping ----
+
+const unsigned char *fileio_map_input(int fd, size_t len) {
+#if defined(_WIN32) || defined(_WIN64)
+  (void)fd;
+  (void)len;
+  errno = ENOSYS;
+  return NULL;
+#else
+  if (len == 0) {
+    errno = EINVAL;
+    return NULL;
+  }
+
+  int flags = MAP_PRIVATE;
+#ifdef MAP_POPULATE
+  flags |= MAP_POPULATE; // fault the page cache in up front
+#endif
+
+  void *addr = mmap(NULL, len, PROT_READ, flags, fd, 0);
+  if (addr == MAP_FAILED) {
+    return NULL;
+  }
+
+#ifdef MADV_SEQUENTIAL
+  madvise(addr, len, MADV_SEQUENTIAL);
+#endif
+
+  return (const unsigned char *)addr;
+#endif
+}
+
+unsigned char *fileio_map_output(int fd, size_t len) {
+#if defined(_WIN32) || defined(_WIN64) || defined(__APPLE__)
+  // No posix_fallocate, so blocks cannot be reserved before mapping
+  (void)fd;
+  (void)len;
+  errno = ENOSYS;
+  return NULL;
+#else
+  if (len == 0) {
+    errno = EINVAL;
+    return NULL;
+  }
+
+  if (ftruncate(fd, (off_t)len) != 0) {
+    return NULL;
+  }
+
+  // ftruncate leaves the file sparse, and a page store into a hole on a full
+  // disk or exhausted quota raises SIGBUS; reserve every block up front so
+  // running out of space fails here and the caller can fall back to fwrite
+  int rc = posix_fallocate(fd, 0, (off_t)len);
+  if (rc != 0) {
+    fileio_discard(fd);
+    errno = rc;
+    return NULL;
+  }
+
+  void *addr = mmap(NULL, len, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+  if (addr == MAP_FAILED) {
+    int saved = errno;
+    fileio_discard(fd); // the caller falls back to writing from offset 0
+    errno = saved;
+    return NULL;
+  }
+
+  return (unsigned char *)addr;
+#endif
+}
+
+int fileio_discard(int fd) {
+#if defined(_WIN32) || defined(_WIN64)
+  return _chsize_s(fd, 0) == 0 ? 0 : -1;
+#else
+  return ftruncate(fd, 0);
+#endif
+}
+
+int64_t fileio_size(int fd) {
+#if defined(_WIN32) || defined(_WIN64)
+  struct _stat64 st;
+  if (_fstat64(fd, &st) != 0 || !(st.st_mode & _S_IFREG)) {
+    return -1;
+  }
+#else
+  struct stat st;
+  if (fstat(fd, &st) != 0 || !S_ISREG(st.st_mode)) {
+    return -1;
+  }
+#endif
+
+  return (int64_t)st.st_size;
+}
+
+void fileio_unmap(const void *addr, size_t len) {
+#if defined(_WIN32) || defined(_WIN64)
+  (void)addr;
+  (void)len;
+#else
+  if (addr) {
+    munmap((void *)addr, len);
+  }
+#endif
+}
@@ -0,0 +1,45 @@
+#ifndef FILEIO_H
+#define FILEIO_H
+
+#include <stddef.h>
+#include <stdint.h>
+
+// Inputs at or above this size are worth the cost of setting up a ring
+#define FILEIO_URING_MIN_SIZE (1u << 20)
+
+// Returns 1 if reads of len bytes will go through io_uring
+int fileio_use_uring(size_t len);
+
+// Inputs above this size are memory-mapped rather than read; the upper bound
+// keeps the one-shot codec's worst-case output allocation reasonable
+#define FILEIO_MMAP_MIN_SIZE (2u << 20)
+#define FILEIO_MMAP_MAX_SIZE ((uint64_t)1 << 30)
+
+// Read exactly len bytes from fd starting at offset, without moving the file
+// position. Returns 0 on success, -1 on failure with errno set (0 on a
+// premature EOF). Does not touch the Python error state.
+int fileio_read_at(int fd, uint64_t offset, unsigned char *buf, size_t len);
+
+// Map len bytes of fd read-only for a single sequential pass. Returns NULL
+// with errno set if the file cannot be mapped (e.g. pipes, or no mmap).
+const unsigned char *fileio_map_input(int fd, size_t len);
+
+// Size fd to exactly len bytes, reserve its blocks and map it writable, so
+// output can be produced in place. Returns NULL with errno set on failure
+// (including ENOSPC/EDQUOT when the blocks cannot be reserved), leaving fd
+// truncated to zero bytes.
+unsigned char *fileio_map_output(int fd, size_t len);
+
+// Truncate fd to zero bytes, e.g. to discard a mapped output after a failed
+// decode. Returns 0 on success, -1 on failure with errno set.
+int fileio_discard(int fd);
+
+// Size in bytes of the regular file open on fd, or -1 if fd is not a regular
+// file or cannot be queried
+int64_t fileio_size(int fd);
+
+// Release a mapping from fileio_map_input/fileio_map_output. Output mappings
+// are flushed to the file by the kernel.
+void fileio_unmap(const void *addr, size_t len);
+
+#endif // FILEIO_H
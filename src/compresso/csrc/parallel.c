@@ -0,0 +1,408 @@
+#include "parallel.h"
+#include <stdlib.h>
+#include <string.h>
+
+#if defined(_WIN32) || defined(_WIN64)
+#include <windows.h>
+#else
+#include <pthread.h>
+#include <unistd.h>
+#define PARALLEL_HAVE_THREADS 1
+#endif
+
+// ---- Helpers ----
+
+static void put_u32_le(uint32_t value, unsigned char buffer[4]) {
+  buffer[0] = (unsigned char)(value & 0xFF);
+  buffer[1] = (unsigned char)((value >> 8) & 0xFF);
+  buffer[2] = (unsigned char)((value >> 16) & 0xFF);
+  buffer[3] = (unsigned char)((value >> 24) & 0xFF);
+}
+
+static uint32_t get_u32_le(const unsigned char buffer[4]) {
+  return (uint32_t)buffer[0] | ((uint32_t)buffer[1] << 8) |
+         ((uint32_t)buffer[2] << 16) | ((uint32_t)buffer[3] << 24);
+}
+
+static int online_cpus(void) {
+  static int cached = 0;
+
+  if (cached == 0) {
+    long n;
+#if defined(_WIN32) || defined(_WIN64)
+    SYSTEM_INFO info;
+    GetSystemInfo(&info);
+    n = (long)info.dwNumberOfProcessors;
+#else
+    n = sysconf(_SC_NPROCESSORS_ONLN);
+#endif
+    if (n < 1)
+      n = 1;
+    if (n > PARALLEL_MAX_WORKERS)
+      n = PARALLEL_MAX_WORKERS;
+    cached = (int)n;
+  }
+
+  return cached;
+}
+
+// Process-wide cap on codec threads; 0 until first use, when it is taken from
+// COMPRESSO_THREADS or the CPU count
+static int thread_limit = 0;
+
+void parallel_set_max_threads(int n) {
+  int cpus = online_cpus();
+  thread_limit = (n < 1 || n > cpus) ? cpus : n;
+}
+
+int parallel_workers(void) {
+  if (thread_limit == 0) {
+    const char *env = getenv("COMPRESSO_THREADS");
+    parallel_set_max_threads(env ? atoi(env) : 0);
+  }
+
+  return thread_limit;
+}
+
+int parallel_use_blocks(const CBackend *backend, uint64_t len) {
+#ifdef PARALLEL_HAVE_THREADS
+  return backend->compress_block && backend->decompress_block &&
+         len >= PARALLEL_MIN_SIZE && parallel_workers() > 1;
+#else
+  (void)backend;
+  (void)len;
+  return 0;
+#endif
+}
+
+// ---- Blocks ----
+
+typedef struct {
+  const unsigned char *input;
+  size_t input_size;
+  unsigned char *output; // compress: preamble + frame, owned until written
+  size_t output_size;
+  int status;
+  int done;
+} Block;
+
+static int compress_one(const CBackend *backend, int level, Block *block) {
+  size_t capacity = backend->max_compressed_size(block->input_size);
+  if (capacity == SIZE_MAX || capacity > UINT32_MAX) {
+    return -1;
+  }
+
+  block->output = (unsigned char *)malloc(PARALLEL_BLOCK_PREAMBLE + capacity);
+  if (!block->output) {
+    return -1;
+  }
+
+  size_t comp_size = 0;
+  if (backend->compress_block(block->input, block->input_size,
+                              block->output + PARALLEL_BLOCK_PREAMBLE,
+                              &capacity, level, &comp_size) != 0) {
+    return -1;
+  }
+
+  put_u32_le((uint32_t)block->input_size, block->output);
+  put_u32_le((uint32_t)comp_size, block->output + 4);
+  block->output_size = PARALLEL_BLOCK_PREAMBLE + comp_size;
+  return 0;
+}
+
+static int decompress_one(const CBackend *backend, Block *block) {
+  size_t capacity = block->output_size;
+  size_t produced = 0;
+
+  if (backend->decompress_block(block->input, block->input_size, block->output,
+                                &capacity, &produced) != 0 ||
+      produced != block->output_size) {
+    return -1;
+  }
+
+  return 0;
+}
+
+#ifdef PARALLEL_HAVE_THREADS
+
+// ---- Worker Pool ----
+
+typedef struct {
+  const CBackend *backend;
+  int level;
+  Block *blocks;
+  size_t count;
+  size_t next;    // next block to be claimed by a worker
+  size_t written; // blocks already flushed (compression only)
+  size_t window;  // blocks allowed in flight ahead of the writer
+  int failed;
+  pthread_mutex_t lock;
+  pthread_cond_t cond;
+} Job;
+
+static void *compress_worker(void *arg) {
+  Job *job = (Job *)arg;
+
+  for (;;) {
+    pthread_mutex_lock(&job->lock);
+    while (!job->failed && job->next < job->count &&
+           job->next >= job->written + job->window) {
+      pthread_cond_wait(&job->cond, &job->lock);
+    }
+    if (job->failed || job->next >= job->count) {
+      pthread_mutex_unlock(&job->lock);
+      return NULL;
+    }
+    Block *block = &job->blocks[job->next++];
+    pthread_mutex_unlock(&job->lock);
+
+    int status = compress_one(job->backend, job->level, block);
+
+    pthread_mutex_lock(&job->lock);
+    block->status = status;
+    block->done = 1;
+    pthread_cond_broadcast(&job->cond);
+    pthread_mutex_unlock(&job->lock);
+  }
+}
+
+static void *decompress_worker(void *arg) {
+  Job *job = (Job *)arg;
+
+  for (;;) {
+    pthread_mutex_lock(&job->lock);
+    if (job->failed || job->next >= job->count) {
+      pthread_mutex_unlock(&job->lock);
+      return NULL;
+    }
+    Block *block = &job->blocks[job->next++];
+    pthread_mutex_unlock(&job->lock);
+
+    if (decompress_one(job->backend, block) != 0) {
+      pthread_mutex_lock(&job->lock);
+      job->failed = 1;
+      pthread_mutex_unlock(&job->lock);
+    }
+  }
+}
+
+// Start up to n workers; returns how many actually started
+static int start_workers(pthread_t *threads, int n, void *(*fn)(void *),
+                         Job *job) {
+  int started = 0;
+  while (started < n &&
+         pthread_create(&threads[started], NULL, fn, job) == 0) {
+    started++;
+  }
+  return started;
+}
+
+static void join_workers(pthread_t *threads, int n) {
+  for (int i = 0; i < n; i++) {
+    pthread_join(threads[i], NULL);
+  }
+}
+
+#endif
+
+// ---- Compression ----
+
+int parallel_compress(const CBackend *backend, const unsigned char *input,
+                      size_t input_size, int level, FILE *dst) {
+  size_t count = (input_size + PARALLEL_BLOCK_SIZE - 1) / PARALLEL_BLOCK_SIZE;
+  Block *blocks = (Block *)calloc(count ? count : 1, sizeof(Block));
+  if (!blocks) {
+    return -1;
+  }
+
+  for (size_t i = 0; i < count; i++) {
+    size_t offset = i * PARALLEL_BLOCK_SIZE;
+    blocks[i].input = input + offset;
+    blocks[i].input_size = input_size - offset < PARALLEL_BLOCK_SIZE
+                               ? input_size - offset
+                               : PARALLEL_BLOCK_SIZE;
+  }
+
+  int return_code = 0;
+  int started = 0;
+
+#ifdef PARALLEL_HAVE_THREADS
+  pthread_t threads[PARALLEL_MAX_WORKERS];
+  int workers = parallel_workers();
+  if ((size_t)workers > count)
+    workers = (int)count;
+
+  // The window bounds how many compressed blocks wait in memory for the
+  // writer, so a slow destination cannot pin the whole output
+  Job job = {
+      .backend = backend,
+      .level = level,
+      .blocks = blocks,
+      .count = count,
+      .window = (size_t)workers * 2,
+  };
+  pthread_mutex_init(&job.lock, NULL);
+  pthread_cond_init(&job.cond, NULL);
+
+  started = start_workers(threads, workers, compress_worker, &job);
+#endif
+
+  // This thread is the writer: blocks are appended strictly in input order
+  // as soon as each one is ready
+  for (size_t i = 0; i < count; i++) {
+    Block *block = &blocks[i];
+
+    if (started == 0) {
+      block->status = compress_one(backend, level, block);
+      block->done = 1;
+    }
+#ifdef PARALLEL_HAVE_THREADS
+    else {
+      pthread_mutex_lock(&job.lock);
+      while (!block->done) {
+        pthread_cond_wait(&job.cond, &job.lock);
+      }
+      pthread_mutex_unlock(&job.lock);
+    }
+#endif
+
+    if (block->status != 0 ||
+        fwrite(block->output, 1, block->output_size, dst) !=
+            block->output_size ||
+        ferror(dst)) {
+      return_code = -1;
+      break;
+    }
+
+    free(block->output);
+    block->output = NULL;
+
+#ifdef PARALLEL_HAVE_THREADS
+    if (started > 0) {
+      pthread_mutex_lock(&job.lock);
+      job.written = i + 1;
+      pthread_cond_broadcast(&job.cond);
+      pthread_mutex_unlock(&job.lock);
+    }
+#endif
+  }
+
+#ifdef PARALLEL_HAVE_THREADS
+  if (started > 0) {
+    pthread_mutex_lock(&job.lock);
+    if (return_code != 0)
+      job.failed = 1;
+    pthread_cond_broadcast(&job.cond);
+    pthread_mutex_unlock(&job.lock);
+    join_workers(threads, started);
+  }
+  pthread_cond_destroy(&job.cond);
+  pthread_mutex_destroy(&job.lock);
+#endif
+
+  for (size_t i = 0; i < count; i++) {
+    free(blocks[i].output);
+  }
+  free(blocks);
+  return return_code;
+}
+
+// ---- Decompression ----
+
+// Walk the block records, filling blocks (if given) with the input frame and
+// output slot of each. Returns the number of records, or SIZE_MAX if the
+// payload is malformed or does not add up to output_size.
+static size_t scan_blocks(const unsigned char *payload, size_t payload_size,
+                          unsigned char *output, size_t output_size,
+                          Block *blocks) {
+  size_t count = 0;
+  size_t pos = 0;
+  size_t offset = 0;
+
+  while (pos < payload_size) {
+    if (payload_size - pos < PARALLEL_BLOCK_PREAMBLE) {
+      return SIZE_MAX;
+    }
+
+    size_t orig_len = get_u32_le(payload + pos);
+    size_t comp_len = get_u32_le(payload + pos + 4);
+    pos += PARALLEL_BLOCK_PREAMBLE;
+
+    if (orig_len == 0 || orig_len > PARALLEL_BLOCK_SIZE ||
+        comp_len > payload_size - pos || orig_len > output_size - offset) {
+      return SIZE_MAX;
+    }
+
+    if (blocks) {
+      blocks[count].input = payload + pos;
+      blocks[count].input_size = comp_len;
+      blocks[count].output = output + offset;
+      blocks[count].output_size = orig_len;
+    }
+
+    pos += comp_len;
+    offset += orig_len;
+    count++;
+  }
+
+  return offset == output_size ? count : SIZE_MAX;
+}
+
+int parallel_decompress(const CBackend *backend, const unsigned char *payload,
+                        size_t payload_size, unsigned char *output,
+                        size_t output_size) {
+  if (!backend->decompress_block) {
+    return -1;
+  }
+
+  size_t count = scan_blocks(payload, payload_size, output, output_size, NULL);
+  if (count == SIZE_MAX) {
+    return -1;
+  }
+  if (count == 0) {
+    return 0;
+  }
+
+  Block *blocks = (Block *)calloc(count, sizeof(Block));
+  if (!blocks) {
+    return -1;
+  }
+  scan_blocks(payload, payload_size, output, output_size, blocks);
+
+  int return_code = 0;
+
+#ifdef PARALLEL_HAVE_THREADS
+  pthread_t threads[PARALLEL_MAX_WORKERS];
+  int workers = parallel_workers();
+  if ((size_t)workers > count)
+    workers = (int)count;
+
+  Job job = {
+      .backend = backend,
+      .blocks = blocks,
+      .count = count,
+  };
+  pthread_mutex_init(&job.lock, NULL);
+  pthread_cond_init(&job.cond, NULL);
+
+  // The calling thread works the queue too, which also covers the case
+  // where no extra thread could be started
+  int started = start_workers(threads, workers - 1, decompress_worker, &job);
+  decompress_worker(&job);
+  join_workers(threads, started);
+
+  return_code = job.failed ? -1 : 0;
+  pthread_cond_destroy(&job.cond);
+  pthread_mutex_destroy(&job.lock);
+#else
+  for (size_t i = 0; i < count; i++) {
+    if (decompress_one(backend, &blocks[i]) != 0) {
+      return_code = -1;
+      break;
+    }
+  }
+#endif
+
+  free(blocks);
+  return return_code;
+}
@@ -0,0 +1,45 @@
+#ifndef PARALLEL_H
+#define PARALLEL_H
+
+#include "common.h"
+#include <stddef.h>
+#include <stdint.h>
+#include <stdio.h>
+
+// Inputs are split into independent blocks of this size; each block is
+// written as an 8-byte (orig_len, comp_len) little-endian preamble followed by
+// the block's own one-shot frame
+#define PARALLEL_BLOCK_SIZE (4u << 20)
+#define PARALLEL_BLOCK_PREAMBLE 8
+
+// Below two blocks there is nothing to spread across workers
+#define PARALLEL_MIN_SIZE ((uint64_t)2 * PARALLEL_BLOCK_SIZE)
+
+#define PARALLEL_MAX_WORKERS 16
+
+// Threads a codec may use for one input: the online CPU count clamped to
+// [1, PARALLEL_MAX_WORKERS], lowered by COMPRESSO_THREADS or
+// parallel_set_max_threads
+int parallel_workers(void);
+
+// Cap codec threads for this process; n < 1 restores the CPU count. Call
+// with no compression in flight, e.g. at startup or in a pool initializer
+void parallel_set_max_threads(int n);
+
+// Returns 1 if input of len bytes should be compressed as parallel blocks
+int parallel_use_blocks(const CBackend *backend, uint64_t len);
+
+// Compress input into block records written to dst, in input order. Must be
+// called without the GIL held. Returns 0 on success, -1 on failure; does not
+// touch the Python error state.
+int parallel_compress(const CBackend *backend, const unsigned char *input,
+                      size_t input_size, int level, FILE *dst);
+
+// Decode a payload of block records into output, which must hold exactly
+// output_size bytes. Must be called without the GIL held. Returns 0 on
+// success, -1 on a malformed payload or codec failure.
+int parallel_decompress(const CBackend *backend, const unsigned char *payload,
+                        size_t payload_size, unsigned char *output,
+                        size_t output_size);
+
+#endif // PARALLEL_H
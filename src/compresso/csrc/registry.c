@@ -3,6 +3,10 @@
 #include <Python.h>
 #include <string.h>
 
+#if !defined(_WIN32) && !defined(_WIN64)
+#include <pthread.h>
+#endif
+
 #define BACKEND_ID_MAX 32
 
 static const CBackend *backend_by_id[BACKEND_ID_MAX] = {NULL};
@@ -46,6 +50,45 @@ void init_backends(void) {
   register_backend(get_snappy_backend());
 }
 
+// ---- Thread Contexts ----
+
+void release_thread_contexts(void) {
+  for (size_t i = 0; i < num_registered_backends; i++) {
+    if (registered_backends[i]->release_thread_contexts) {
+      registered_backends[i]->release_thread_contexts();
+    }
+  }
+}
+
+#if !defined(_WIN32) && !defined(_WIN64)
+
+// The key's value is never read; setting it just makes the destructor run
+// when a thread that cached contexts exits
+static pthread_key_t contexts_key;
+static pthread_once_t contexts_key_once = PTHREAD_ONCE_INIT;
+static int contexts_key_ok = 0;
+
+static void release_at_thread_exit(void *unused) {
+  (void)unused;
+  release_thread_contexts();
+}
+
+static void create_contexts_key(void) {
+  contexts_key_ok =
+      pthread_key_create(&contexts_key, release_at_thread_exit) == 0;
+}
+
+#endif
+
+void track_thread_contexts(void) {
+#if !defined(_WIN32) && !defined(_WIN64)
+  pthread_once(&contexts_key_once, create_contexts_key);
+  if (contexts_key_ok) {
+    pthread_setspecific(contexts_key, (void *)1);
+  }
+#endif
+}
+
 // ---- Backend Lookup ----
 
 const CBackend *find_backend_by_name(const char *name) {
@@ -72,119 +115,148 @@ const CBackend *find_backend_by_id(uint8_t id) {
 
 // ---- Strategy Selection ----
 
-const CBackend *choose_backend(Strategy strat) {
-  init_backends();
+// Preference order per strategy; the first compiled-in backend wins
+#define PRIORITY_LEN 6
 
-  const CBackend *zlib = NULL, *bzip2 = NULL, *lzma = NULL;
-  const CBackend *zstd = NULL, *lz4 = NULL, *snappy = NULL;
+static const AlgoID priority_fast[PRIORITY_LEN] = {
+    ALGO_LZ4, ALGO_SNAPPY, ALGO_ZSTD, ALGO_ZLIB, ALGO_LZMA, ALGO_BZIP2};
+static const AlgoID priority_max_ratio[PRIORITY_LEN] = {
+    ALGO_LZMA, ALGO_ZSTD, ALGO_BZIP2, ALGO_ZLIB, ALGO_LZ4, ALGO_SNAPPY};
+static const AlgoID priority_balanced[PRIORITY_LEN] = {
+    ALGO_ZSTD, ALGO_ZLIB, ALGO_LZMA, ALGO_BZIP2, ALGO_LZ4, ALGO_SNAPPY};
 
-  for (size_t i = 0; i < num_registered_backends; i++) {
-    const CBackend *b = registered_backends[i];
-    switch (b->id) {
-    case ALGO_ZLIB:   zlib   = b; break;
-    case ALGO_BZIP2:  bzip2  = b; break;
-    case ALGO_LZMA:   lzma   = b; break;
-    case ALGO_ZSTD:   zstd   = b; break;
-    case ALGO_LZ4:    lz4    = b; break;
-    case ALGO_SNAPPY: snappy = b; break;
-    default: break;
-    }
-  }
+const CBackend *choose_backend(Strategy strat) {
+  init_backends();
 
+  const AlgoID *order;
   switch (strat) {
   case STRAT_FAST:
-    if (lz4) return lz4;
-    if (snappy) return snappy;
-    if (zstd) return zstd;
-    if (zlib) return zlib;
-    if (lzma) return lzma;
-    if (bzip2) return bzip2;
+    order = priority_fast;
     break;
   case STRAT_MAX_RATIO:
-    if (lzma) return lzma;
-    if (zstd) return zstd;
-    if (bzip2) return bzip2;
-    if (zlib) return zlib;
-    if (lz4) return lz4;
-    if (snappy) return snappy;
+    order = priority_max_ratio;
     break;
   case STRAT_BALANCED:
   default:
-    if (zstd) return zstd;
-    if (zlib) return zlib;
-    if (lzma) return lzma;
-    if (bzip2) return bzip2;
-    if (lz4) return lz4;
-    if (snappy) return snappy;
+    order = priority_balanced;
     break;
   }
 
+  for (size_t i = 0; i < PRIORITY_LEN; i++) {
+    const CBackend *b = backend_by_id[order[i]];
+    if (b) {
+      return b;
+    }
+  }
+
   return NULL;
 }
 
 // ---- Capability Check ----
 
+static PyStructSequence_Field capability_fields[] = {
+    {"name", "Name of the compression algorithm"},
+    {"id", "Algorithm ID"},
+    {"has_buffer", "Whether one-shot buffer compression is supported"},
+    {"has_stream", "Whether streaming compression is supported"},
+    {"min_level", "Lowest accepted compression level"},
+    {"max_level", "Highest accepted compression level"},
+    {"level_ignored", "Whether the codec ignores the compression level"},
+    {NULL, NULL}};
+
+static PyStructSequence_Desc capability_desc = {
+    "compresso._core.BackendCapabilities",
+    "Capability information for a compiled compression backend",
+    capability_fields, 7};
+
+static PyTypeObject *capability_type = NULL;
+
+// Backends are fixed once registered, so the tuple is built on first use
+static PyObject *capability_tuple = NULL;
+
+PyTypeObject *get_capabilities_type(void) {
+  if (!capability_type) {
+    capability_type = PyStructSequence_NewType(&capability_desc);
+  }
+
+  return capability_type;
+}
+
+static PyObject *make_capability(const CBackend *b) {
+  PyObject *cap = PyStructSequence_New(get_capabilities_type());
+  if (!cap) {
+    return NULL;
+  }
+
+  int has_buffer = (b->compress_buffer && b->decompress_buffer) ? 1 : 0;
+  int has_stream = (b->compress_stream && b->decompress_stream) ? 1 : 0;
+
+  PyObject *name = PyUnicode_FromString(b->name ? b->name : "");
+  PyObject *id = PyLong_FromLong((long)b->id);
+  PyObject *min_level = PyLong_FromLong((long)b->min_level);
+  PyObject *max_level = PyLong_FromLong((long)b->max_level);
+  if (!name || !id || !min_level || !max_level) {
+    Py_XDECREF(name);
+    Py_XDECREF(id);
+    Py_XDECREF(min_level);
+    Py_XDECREF(max_level);
+    Py_DECREF(cap);
+    return NULL;
+  }
+
+  // SetItem steals the references
+  PyStructSequence_SetItem(cap, 0, name);
+  PyStructSequence_SetItem(cap, 1, id);
+  PyStructSequence_SetItem(cap, 2, PyBool_FromLong(has_buffer));
+  PyStructSequence_SetItem(cap, 3, PyBool_FromLong(has_stream));
+  PyStructSequence_SetItem(cap, 4, min_level);
+  PyStructSequence_SetItem(cap, 5, max_level);
+  PyStructSequence_SetItem(cap, 6, PyBool_FromLong(b->level_ignored));
+
+  return cap;
+}
+
 PyObject *get_capabilities(void) {
   init_backends();
 
-  PyObject *list = PyList_New((Py_ssize_t)num_registered_backends);
-  if (!list) {
+  if (capability_tuple) {
+    Py_INCREF(capability_tuple);
+    return capability_tuple;
+  }
+
+  if (!get_capabilities_type()) {
     return NULL;
   }
 
+  Py_ssize_t count = 0;
   for (size_t i = 0; i < num_registered_backends; i++) {
-    const CBackend *b = registered_backends[i];
-    if (!b) {
-      Py_INCREF(Py_None);
-      PyList_SetItem(list, (Py_ssize_t)i, Py_None);
-      continue;
-    }
-
-    int has_buffer = (b->compress_buffer && b->decompress_buffer) ? 1 : 0;
-    int has_stream = (b->compress_stream && b->decompress_stream) ? 1 : 0;
-
-    PyObject *dict = PyDict_New();
-    if (!dict) {
-      Py_DECREF(list);
-      return NULL;
+    if (registered_backends[i]) {
+      count++;
     }
+  }
 
-    PyObject *name = PyUnicode_FromString(b->name ? b->name : "");
-    PyObject *id = PyLong_FromLong((long)b->id);
-    PyObject *buffer = has_buffer ? Py_True : Py_False;
-    PyObject *stream = has_stream ? Py_True : Py_False;
+  PyObject *tuple = PyTuple_New(count);
+  if (!tuple) {
+    return NULL;
+  }
 
-    if (!name || !id) {
-      Py_XDECREF(name);
-      Py_XDECREF(id);
-      Py_DECREF(dict);
-      Py_DECREF(list);
-      return NULL;
+  Py_ssize_t pos = 0;
+  for (size_t i = 0; i < num_registered_backends; i++) {
+    const CBackend *b = registered_backends[i];
+    if (!b) {
+      continue;
     }
 
-    Py_INCREF(buffer);
-    Py_INCREF(stream);
-
-    if (PyDict_SetItemString(dict, "name", name) < 0 ||
-        PyDict_SetItemString(dict, "id", id) < 0 ||
-        PyDict_SetItemString(dict, "has_buffer", buffer) < 0 ||
-        PyDict_SetItemString(dict, "has_stream", stream) < 0) {
-      Py_DECREF(name);
-      Py_DECREF(id);
-      Py_DECREF(buffer);
-      Py_DECREF(stream);
-      Py_DECREF(dict);
-      Py_DECREF(list);
+    PyObject *cap = make_capability(b);
+    if (!cap) {
+      Py_DECREF(tuple);
       return NULL;
     }
 
-    Py_DECREF(name);
-    Py_DECREF(id);
-    Py_DECREF(buffer);
-    Py_DECREF(stream);
-
-    PyList_SetItem(list, (Py_ssize_t)i, dict);
+    PyTuple_SET_ITEM(tuple, pos++, cap);
   }
 
-  return list;
+  capability_tuple = tuple;
+  Py_INCREF(capability_tuple);
+  return capability_tuple;
 }
@@ -1,5 +1,6 @@
 #define PY_SSIZE_T_CLEAN
 #include "../common.h"
+#include "../crc32_hw.h"
 #include "../standalone.h"
 #include <Python.h>
 #include <stdio.h>
@@ -89,7 +90,7 @@ static int gzip_compress_file(const char *input_path, const char *output_path,
 
   unsigned char in_buf[GZIP_CHUNK];
   unsigned char out_buf[GZIP_CHUNK];
-  uint32_t crc = crc32(0L, Z_NULL, 0);
+  uint32_t crc = compresso_crc32(0, NULL, 0);
   uint32_t total_in = 0;
   int flush;
 
@@ -106,7 +107,7 @@ static int gzip_compress_file(const char *input_path, const char *output_path,
     }
 
     total_in += strm.avail_in;
-    crc = crc32(crc, in_buf, strm.avail_in);
+    crc = compresso_crc32(crc, in_buf, strm.avail_in);
 
     flush = feof(input) ? Z_FINISH : Z_NO_FLUSH;
     strm.next_in = in_buf;
@@ -237,7 +238,7 @@ static int gzip_decompress_file(const char *input_path,
 
   unsigned char in_buf[GZIP_CHUNK];
   unsigned char out_buf[GZIP_CHUNK];
-  uint32_t crc = crc32(0L, Z_NULL, 0);
+  uint32_t crc = compresso_crc32(0, NULL, 0);
   uint32_t total_out = 0;
 
   Py_BEGIN_ALLOW_THREADS
@@ -272,7 +273,7 @@ static int gzip_decompress_file(const char *input_path,
 
       size_t have = GZIP_CHUNK - strm.avail_out;
       total_out += have;
-      crc = crc32(crc, out_buf, have);
+      crc = compresso_crc32(crc, out_buf, have);
 
       if (fwrite(out_buf, 1, have, output) != have || ferror(output)) {
         Py_BLOCK_THREADS inflateEnd(&strm);
@@ -0,0 +1,40 @@
+#define PY_SSIZE_T_CLEAN
+#include "common.h"
+#include "standalone.h"
+#include <stddef.h>
+
+// Stand-ins for optional codecs left out of the build. setup.py defines
+// COMPRESSO_NO_<CODEC> when a library is not found and drops that codec's
+// sources; returning NULL here means the backend is never registered and the
+// standalone format is reported as unavailable.
+
+#ifdef COMPRESSO_NO_BZIP2
+const CBackend *get_bzip2_backend(void) { return NULL; }
+const StandaloneFormat *get_bzip2_format(void) { return NULL; }
+#endif
+
+#ifdef COMPRESSO_NO_LZMA
+const CBackend *get_lzma_backend(void) { return NULL; }
+const StandaloneFormat *get_xz_format(void) { return NULL; }
+#endif
+
+#ifdef COMPRESSO_NO_ZSTD
+const CBackend *get_zstd_backend(void) { return NULL; }
+const StandaloneFormat *get_zstd_format(void) { return NULL; }
+#endif
+
+#ifdef COMPRESSO_NO_LZ4
+const CBackend *get_lz4_backend(void) { return NULL; }
+const StandaloneFormat *get_lz4_format(void) { return NULL; }
+#endif
+
+#ifdef COMPRESSO_NO_SNAPPY
+const CBackend *get_snappy_backend(void) { return NULL; }
+
+size_t snappy_decompressed_size(const unsigned char *input,
+                                size_t input_size) {
+  (void)input;
+  (void)input_size;
+  return 0;
+}
+#endif
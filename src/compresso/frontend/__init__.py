@@ -1,25 +1,6 @@
 """Frontend API for Compresso library."""
 
-from ._job import JobResult, ProgressCallback
-from .api import (
-    CompressionJob,
-    CompressionOptions,
-    CompressionPlan,
-    DecompressionJob,
-    DecompressionPlan,
-    plan_compression,
-    plan_decompression,
-)
-from .archive_api import (
-    ArchiveEntry,
-    ArchiveJob,
-    ArchiveOptions,
-    ArchivePlan,
-    ExtractJob,
-    ExtractPlan,
-    plan_archive,
-    plan_extraction,
-)
+from typing import TYPE_CHECKING
 
 __all__ = [
     "CompressionOptions",
@@ -40,3 +21,75 @@ __all__ = [
     "plan_archive",
     "plan_extraction",
 ]
+
+# Submodule providing each export; resolved on first access (PEP 562) so that
+# importing the package does not load the APIs or the C extension behind them
+_EXPORTS: dict[str, str] = {
+    "JobResult": "_job",
+    "ProgressCallback": "_job",
+    "CompressionOptions": "api",
+    "CompressionPlan": "api",
+    "DecompressionPlan": "api",
+    "CompressionJob": "api",
+    "DecompressionJob": "api",
+    "plan_compression": "api",
+    "plan_decompression": "api",
+    "ArchiveOptions": "archive_api",
+    "ArchivePlan": "archive_api",
+    "ExtractPlan": "archive_api",
+    "ArchiveEntry": "archive_api",
+    "ArchiveJob": "archive_api",
+    "ExtractJob": "archive_api",
+    "plan_archive": "archive_api",
+    "plan_extraction": "archive_api",
+}
+
+if TYPE_CHECKING:
+    from ._job import JobResult, ProgressCallback
+    from .api import (
+        CompressionJob,
+        CompressionOptions,
+        CompressionPlan,
+        DecompressionJob,
+        DecompressionPlan,
+        plan_compression,
+        plan_decompression,
+    )
+    from .archive_api import (
+        ArchiveEntry,
+        ArchiveJob,
+        ArchiveOptions,
+        ArchivePlan,
+        ExtractJob,
+        ExtractPlan,
+        plan_archive,
+        plan_extraction,
+    )
+
+
+def __getattr__(name: str) -> object:
+    """Import an exported name from its submodule on first use
+
+    Args:
+        name: Attribute being looked up on the package.
+
+    Returns:
+        The exported object, cached on the package for later lookups.
+
+    Raises:
+        AttributeError: If the name is not exported by the package.
+    """
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    from importlib import import_module
+
+    value = getattr(import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the package attributes, including exports not yet imported"""
+    return sorted(set(globals()) | set(__all__))
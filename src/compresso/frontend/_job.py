@@ -3,21 +3,22 @@
 Both :mod:`compresso.frontend.api` (single-file compress/decompress) and
 :mod:`compresso.frontend.archive_api` (multi-file archive/extract) build on the
 same contract: a *plan* describes the work and whether it can proceed, a *job*
-executes it, and a :class:`JobResult` reports the outcome without ever raising.
-These primitives live here so the two APIs share one definition instead of
-drifting apart.
+executes it, and a :class:`JobResult` reports the outcome instead of raising
+(only KeyboardInterrupt and SystemExit propagate). These primitives live here
+so the two APIs share one definition instead of drifting apart.
 """
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Callable, Protocol, runtime_checkable
+from typing import Protocol, runtime_checkable
 
 # Progress callback signature: (fraction, done_bytes, total_bytes).
 ProgressCallback = Callable[[float, int, int], None]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JobResult:
     """Holds the result of a compression, decompression, or archive job.
 
@@ -38,7 +39,8 @@ class Job(Protocol):
     """Structural contract shared by every frontend job.
 
     A job exposes the ``plan`` it will execute and a ``run`` method that
-    performs the work and returns a :class:`JobResult` (never raising).
+    performs the work and returns a :class:`JobResult` rather than raising;
+    interrupts and SystemExit still propagate.
     """
 
     plan: object
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
+from stat import S_ISREG
+from typing import NamedTuple
 
 from .._core import compress_file, decompress_file
 from .._core import get_default_backend_for_strategy as default_backend
+from ..backend.capabilities import list_capabilities
 from ..backend.file_inspect import InspectResult
 from ..backend.file_inspect import inspect as inspect_file
 from ..backend.speeds import get_estimated_speeds
@@ -15,8 +20,7 @@ from ._job import JobResult, ProgressCallback
 MB = 1024 * 1024
 
 
-@dataclass(frozen=True)
-class CompressionOptions:
+class CompressionOptions(NamedTuple):
     """User-facing compression options.
 
     Attributes:
@@ -30,7 +34,7 @@ class CompressionOptions:
     level: int | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompressionPlan:
     """Holds a compression plan based on user options and file characteristics.
 
@@ -56,7 +60,7 @@ class CompressionPlan:
     reason_if_unavailable: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DecompressionPlan:
     """Holds a decompression plan based on file inspection.
 
@@ -74,6 +78,32 @@ class DecompressionPlan:
     estimated_seconds: float | None
 
 
+@lru_cache(maxsize=1)
+def _caps_by_name() -> frozenset[str]:
+    """Get the names of the compiled backends, cached per process.
+
+    Returns:
+        Names of every backend available in this build.
+    """
+    return frozenset(cap.name for cap in list_capabilities())
+
+
+@lru_cache(maxsize=8)
+def _choose_backend_for_strategy(strategy: str) -> str | None:
+    """Get the default backend for a strategy, cached per process.
+
+    The compiled backends cannot change while the process runs, so the
+    answer for each strategy is fixed after the first lookup.
+
+    Args:
+        strategy: Lowercased strategy name.
+
+    Returns:
+        Backend name, or None if no backend suits the strategy.
+    """
+    return default_backend(strategy)
+
+
 def plan_compression(
     src: str | Path,
     dest: str | Path | None = None,
@@ -91,7 +121,7 @@ def plan_compression(
     """
     src_path = Path(src)
     if dest is None:
-        dest_path: Path = src_path.with_suffix(suffix=src_path.suffix + ".comp")
+        dest_path: Path = src_path.with_name(src_path.name + ".comp")
 
     else:
         dest_path = Path(dest)
@@ -99,7 +129,20 @@ def plan_compression(
     if options is None:
         options = CompressionOptions()
 
-    if not src_path.is_file():
+    # Normalise once so the backend chosen here and the strategy that
+    # CompressionJob.run passes to the case-sensitive C side always agree
+    strategy: str = (options.strategy or "balanced").lower()
+    if strategy != options.strategy:
+        options = options._replace(strategy=strategy)
+
+    # One stat answers both "is it a regular file" and "how big is it"
+    try:
+        st: os.stat_result | None = os.stat(src_path)
+
+    except OSError:
+        st = None
+
+    if st is None or not S_ISREG(st.st_mode):
         return CompressionPlan(
             src=src_path,
             dest=dest_path,
@@ -111,13 +154,13 @@ def plan_compression(
             reason_if_unavailable="Source file does not exist or is not a file",
         )
 
-    input_size: int = src_path.stat().st_size
+    input_size: int = st.st_size
 
     if options.algo:
         backend_name: str = options.algo.lower()
 
     else:
-        backend_name: str | None = default_backend(options.strategy or "balanced")
+        backend_name: str | None = _choose_backend_for_strategy(strategy)
 
     if backend_name is None:
         return CompressionPlan(
@@ -131,6 +174,18 @@ def plan_compression(
             reason_if_unavailable="No suitable backend found for the selected strategy",
         )
 
+    if options.algo and backend_name not in _caps_by_name():
+        return CompressionPlan(
+            src=src_path,
+            dest=dest_path,
+            options=options,
+            input_size=input_size,
+            backend_name=None,
+            estimated_seconds=None,
+            can_compress=False,
+            reason_if_unavailable=f"Backend {backend_name!r} not available on this system",
+        )
+
     mb_s: int | float = get_estimated_speeds(algo=backend_name, operation="compress")
     estimated_seconds: int | float = (input_size / MB) / mb_s if input_size > 0 else 0.0
 
@@ -162,10 +217,10 @@ def plan_decompression(
     src_path = Path(src)
     if dest is None:
         if src_path.suffix:
-            dest_path: Path = src_path.with_suffix(suffix="")
+            dest_path: Path = src_path.with_name(src_path.stem)
 
         else:
-            dest_path: Path = src_path.with_suffix(suffix=".out")
+            dest_path: Path = src_path.with_name(src_path.name + ".out")
 
     else:
         dest_path = Path(dest)
@@ -184,6 +239,8 @@ def plan_decompression(
 class CompressionJob:
     """Compression job high-level wrapper."""
 
+    __slots__ = ("plan",)
+
     def __init__(self, plan: CompressionPlan) -> None:
         """Initialise the compression job.
 
@@ -231,7 +288,7 @@ class CompressionJob:
 
         total: int = self.plan.input_size
         try:
-            if progress:
+            if progress is not None:
                 progress(0.0, 0, total)
 
             lvl: int = (
@@ -246,7 +303,7 @@ class CompressionJob:
                 level=lvl,
             )
 
-            if progress:
+            if progress is not None:
                 progress(1.0, total, total)
 
             return JobResult(
@@ -255,7 +312,7 @@ class CompressionJob:
                 plan=self.plan,
             )
 
-        except BaseException as e:
+        except Exception as e:
             return JobResult(
                 ok=False,
                 error=e,
@@ -266,6 +323,8 @@ class CompressionJob:
 class DecompressionJob:
     """Decompression job high-level wrapper."""
 
+    __slots__ = ("plan",)
+
     def __init__(self, plan: DecompressionPlan) -> None:
         """Initialise the decompression job.
 
@@ -323,7 +382,7 @@ class DecompressionJob:
 
         total = insp.orig_size or 0
         try:
-            if progress:
+            if progress is not None:
                 progress(0.0, 0, total)
 
             decompress_file(
@@ -332,7 +391,7 @@ class DecompressionJob:
                 algo="",
             )
 
-            if progress:
+            if progress is not None:
                 progress(1.0, total, total)
 
             return JobResult(
@@ -341,7 +400,7 @@ class DecompressionJob:
                 plan=self.plan,
             )
 
-        except BaseException as e:
+        except Exception as e:
             return JobResult(
                 ok=False,
                 error=e,
@@ -37,7 +37,7 @@ class ArchiveOptions:
     exclude_patterns: list[str] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ArchivePlan:
     """Holds a plan for creating an archive.
 
@@ -61,7 +61,7 @@ class ArchivePlan:
     reason_if_unavailable: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ExtractPlan:
     """Holds a plan for extracting an archive.
 
@@ -237,6 +237,8 @@ def plan_extraction(
 class ArchiveJob:
     """Job for creating an archive."""
 
+    __slots__ = ("plan",)
+
     def __init__(self, plan: ArchivePlan) -> None:
         """Initialise archive job.
 
@@ -284,7 +286,7 @@ class ArchiveJob:
 
         total: int = self.plan.total_input_size
         try:
-            if progress:
+            if progress is not None:
                 progress(0.0, 0, total)
 
             create_archive(
@@ -294,18 +296,20 @@ class ArchiveJob:
                 self.plan.options.compression_level or -1,
             )
 
-            if progress:
+            if progress is not None:
                 progress(1.0, total, total)
 
             return JobResult(ok=True, error=None, plan=self.plan)
 
-        except BaseException as e:
+        except Exception as e:
             return JobResult(ok=False, error=e, plan=self.plan)
 
 
 class ExtractJob:
     """Job for extracting an archive."""
 
+    __slots__ = ("plan",)
+
     def __init__(self, plan: ExtractPlan) -> None:
         """Initialise extract job.
 
@@ -361,7 +365,7 @@ class ExtractJob:
 
         total: int = len(self.plan.entries)
         try:
-            if progress:
+            if progress is not None:
                 progress(0.0, 0, total)
 
             self.plan.output_dir.mkdir(parents=True, exist_ok=True)
@@ -371,10 +375,10 @@ class ExtractJob:
                 self.plan.files or [],
             )
 
-            if progress:
+            if progress is not None:
                 progress(1.0, total, total)
 
             return JobResult(ok=True, error=None, plan=self.plan)
 
-        except BaseException as e:
+        except Exception as e:
             return JobResult(ok=False, error=e, plan=self.plan)
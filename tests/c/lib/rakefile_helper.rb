@@ -36,7 +36,8 @@ LDFLAGS = [
   '-llzma',
   '-lzstd',
   '-llz4',
-  '-lsnappy'
+  '-lsnappy',
+  '-lpthread'
 ]
 
 LDFLAGS << "-L#{py_libpl}" if py_libpl && !py_libpl.empty?
@@ -59,6 +60,10 @@ SOURCE_FILES = [
   File.join(SRC_DIR, 'format.c'),
   File.join(SRC_DIR, 'registry.c'),
   File.join(SRC_DIR, 'strategy.c'),
+  File.join(SRC_DIR, 'fileio.c'),
+  File.join(SRC_DIR, 'crc32_hw.c'),
+  File.join(SRC_DIR, 'parallel.c'),
+  File.join(SRC_DIR, 'unavailable.c'),
   File.join(SRC_DIR, 'compression', 'py_zlib.c'),
   File.join(SRC_DIR, 'compression', 'py_bzip2.c'),
   File.join(SRC_DIR, 'compression', 'py_lzma.c'),
@@ -0,0 +1,59 @@
+#include "unity.h"
+#include "../../src/compresso/csrc/crc32_hw.h"
+#include <stdlib.h>
+#include <zlib.h>
+
+#define TEST_BUF_SIZE 4096
+
+static unsigned char *buf = NULL;
+
+void setUp(void) {
+    buf = (unsigned char *)malloc(TEST_BUF_SIZE);
+    TEST_ASSERT_NOT_NULL(buf);
+    for (size_t i = 0; i < TEST_BUF_SIZE; i++) {
+        buf[i] = (unsigned char)((i * 2654435761u) >> 13);
+    }
+}
+
+void tearDown(void) {
+    free(buf);
+    buf = NULL;
+}
+
+void test_seed_matches_zlib(void) {
+    TEST_ASSERT_EQUAL_HEX32(crc32(0L, Z_NULL, 0), compresso_crc32(0, NULL, 0));
+}
+
+void test_known_vector(void) {
+    const unsigned char check[] = "123456789";
+    TEST_ASSERT_EQUAL_HEX32(0xCBF43926u, compresso_crc32(0, check, 9));
+}
+
+void test_matches_zlib_all_lengths_and_offsets(void) {
+    // Covers the short-input path, the 64-byte fold minimum and 16-byte tails
+    for (size_t len = 0; len <= 300; len++) {
+        for (size_t off = 0; off < 16; off++) {
+            uint32_t expected = (uint32_t)crc32(0L, buf + off, (uInt)len);
+            TEST_ASSERT_EQUAL_HEX32(expected, compresso_crc32(0, buf + off, len));
+        }
+    }
+}
+
+void test_chaining_matches_zlib(void) {
+    uint32_t expected = (uint32_t)crc32(0L, Z_NULL, 0);
+    uint32_t actual = compresso_crc32(0, NULL, 0);
+    size_t pos = 0;
+    size_t step = 1;
+
+    while (pos < TEST_BUF_SIZE) {
+        size_t n = step < TEST_BUF_SIZE - pos ? step : TEST_BUF_SIZE - pos;
+        expected = (uint32_t)crc32(expected, buf + pos, (uInt)n);
+        actual = compresso_crc32(actual, buf + pos, n);
+        pos += n;
+        step = step * 3 + 1;
+    }
+
+    TEST_ASSERT_EQUAL_HEX32(expected, actual);
+    TEST_ASSERT_EQUAL_HEX32((uint32_t)crc32(0L, buf, TEST_BUF_SIZE),
+                            compresso_crc32(0, buf, TEST_BUF_SIZE));
+}
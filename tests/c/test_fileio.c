@@ -0,0 +1,142 @@
+#define _POSIX_C_SOURCE 200809L
+#include "unity.h"
+#include "../../src/compresso/csrc/fileio.h"
+#include <errno.h>
+#include <fcntl.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <unistd.h>
+
+#define TEST_FILE_SIZE ((3u << 20) + 123u) // spans several 256 KiB chunks
+
+#define TEST_PATH "tmp_fileio.bin"
+
+static unsigned char *expected = NULL;
+static int fd = -1;
+
+void setUp(void) {
+    expected = (unsigned char *)malloc(TEST_FILE_SIZE);
+    TEST_ASSERT_NOT_NULL(expected);
+    for (size_t i = 0; i < TEST_FILE_SIZE; i++) {
+        expected[i] = (unsigned char)((i * 31u) ^ (i >> 11));
+    }
+
+    FILE *f = fopen(TEST_PATH, "wb");
+    TEST_ASSERT_NOT_NULL(f);
+    TEST_ASSERT_EQUAL(TEST_FILE_SIZE, fwrite(expected, 1, TEST_FILE_SIZE, f));
+    fclose(f);
+
+    fd = open(TEST_PATH, O_RDONLY);
+    TEST_ASSERT_TRUE(fd >= 0);
+}
+
+void tearDown(void) {
+    if (fd >= 0) {
+        close(fd);
+        fd = -1;
+    }
+    remove(TEST_PATH);
+    free(expected);
+    expected = NULL;
+}
+
+void test_read_whole_file(void) {
+    unsigned char *buf = (unsigned char *)malloc(TEST_FILE_SIZE);
+    TEST_ASSERT_NOT_NULL(buf);
+
+    TEST_ASSERT_EQUAL(0, fileio_read_at(fd, 0, buf, TEST_FILE_SIZE));
+    TEST_ASSERT_EQUAL_MEMORY(expected, buf, TEST_FILE_SIZE);
+
+    free(buf);
+}
+
+void test_read_at_offset(void) {
+    size_t offset = 16;
+    size_t len = TEST_FILE_SIZE - offset;
+    unsigned char *buf = (unsigned char *)malloc(len);
+    TEST_ASSERT_NOT_NULL(buf);
+
+    TEST_ASSERT_EQUAL(0, fileio_read_at(fd, offset, buf, len));
+    TEST_ASSERT_EQUAL_MEMORY(expected + offset, buf, len);
+
+    free(buf);
+}
+
+void test_read_does_not_move_file_position(void) {
+    unsigned char buf[64];
+
+    TEST_ASSERT_EQUAL(0, lseek(fd, 0, SEEK_SET));
+    TEST_ASSERT_EQUAL(0, fileio_read_at(fd, 100, buf, sizeof(buf)));
+    TEST_ASSERT_EQUAL(0, lseek(fd, 0, SEEK_CUR));
+}
+
+void test_read_past_eof_fails(void) {
+    unsigned char *buf = (unsigned char *)malloc(TEST_FILE_SIZE);
+    TEST_ASSERT_NOT_NULL(buf);
+
+    TEST_ASSERT_EQUAL(-1, fileio_read_at(fd, 1, buf, TEST_FILE_SIZE));
+    TEST_ASSERT_EQUAL(0, errno);
+
+    free(buf);
+}
+
+void test_read_bad_fd_sets_errno(void) {
+    unsigned char buf[16];
+
+    TEST_ASSERT_EQUAL(-1, fileio_read_at(-1, 0, buf, sizeof(buf)));
+    TEST_ASSERT_EQUAL(EBADF, errno);
+}
+
+void test_small_reads_skip_uring(void) {
+    TEST_ASSERT_FALSE(fileio_use_uring(FILEIO_URING_MIN_SIZE - 1));
+}
+
+void test_map_input_matches_file(void) {
+    const unsigned char *map = fileio_map_input(fd, TEST_FILE_SIZE);
+    TEST_ASSERT_NOT_NULL(map);
+    TEST_ASSERT_EQUAL_MEMORY(expected, map, TEST_FILE_SIZE);
+
+    fileio_unmap(map, TEST_FILE_SIZE);
+}
+
+void test_map_output_sizes_and_writes_file(void) {
+    const char *out_path = "tmp_fileio_out.bin";
+    int out_fd = open(out_path, O_RDWR | O_CREAT | O_TRUNC, 0600);
+    TEST_ASSERT_TRUE(out_fd >= 0);
+
+    unsigned char *map = fileio_map_output(out_fd, TEST_FILE_SIZE);
+    TEST_ASSERT_NOT_NULL(map);
+    memcpy(map, expected, TEST_FILE_SIZE);
+    fileio_unmap(map, TEST_FILE_SIZE);
+
+    unsigned char *buf = (unsigned char *)malloc(TEST_FILE_SIZE);
+    TEST_ASSERT_NOT_NULL(buf);
+    TEST_ASSERT_EQUAL(TEST_FILE_SIZE, lseek(out_fd, 0, SEEK_END));
+    TEST_ASSERT_EQUAL(0, fileio_read_at(out_fd, 0, buf, TEST_FILE_SIZE));
+    TEST_ASSERT_EQUAL_MEMORY(expected, buf, TEST_FILE_SIZE);
+
+    free(buf);
+    close(out_fd);
+    remove(out_path);
+}
+
+void test_discard_truncates_mapped_output(void) {
+    const char *out_path = "tmp_fileio_discard.bin";
+    int out_fd = open(out_path, O_RDWR | O_CREAT | O_TRUNC, 0600);
+    TEST_ASSERT_TRUE(out_fd >= 0);
+
+    unsigned char *map = fileio_map_output(out_fd, TEST_FILE_SIZE);
+    TEST_ASSERT_NOT_NULL(map);
+    fileio_unmap(map, TEST_FILE_SIZE);
+
+    TEST_ASSERT_EQUAL(0, fileio_discard(out_fd));
+    TEST_ASSERT_EQUAL(0, lseek(out_fd, 0, SEEK_END));
+
+    close(out_fd);
+    remove(out_path);
+}
+
+void test_map_bad_fd_returns_null(void) {
+    TEST_ASSERT_NULL(fileio_map_input(-1, TEST_FILE_SIZE));
+}
@@ -0,0 +1,154 @@
+#include "unity.h"
+#include "../../src/compresso/csrc/parallel.h"
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+// Three full blocks plus a short tail
+#define TEST_INPUT_SIZE ((size_t)3 * PARALLEL_BLOCK_SIZE + 4321u)
+
+#define TEST_PATH "tmp_parallel.bin"
+
+// Trivial GIL-free codec: a byte-wise XOR, so block framing and ordering can
+// be checked without linking a real compression library
+static size_t xor_max_compressed_size(size_t input_size) { return input_size; }
+
+static int xor_block(const unsigned char *input, size_t input_size,
+                     unsigned char *output, size_t *output_capacity,
+                     size_t *output_size) {
+    if (input_size > *output_capacity) {
+        return -1;
+    }
+    for (size_t i = 0; i < input_size; i++) {
+        output[i] = input[i] ^ 0x5A;
+    }
+    *output_size = input_size;
+    return 0;
+}
+
+static int xor_compress_block(const unsigned char *input, size_t input_size,
+                              unsigned char *output, size_t *output_capacity,
+                              int level, size_t *output_size) {
+    (void)level;
+    return xor_block(input, input_size, output, output_capacity, output_size);
+}
+
+static const CBackend xor_backend = {
+    .name = "xor",
+    .id = ALGO_NONE,
+    .max_compressed_size = xor_max_compressed_size,
+    .compress_block = xor_compress_block,
+    .decompress_block = xor_block,
+};
+
+static unsigned char *input = NULL;
+
+static unsigned char *compress_to_memory(size_t *out_size) {
+    FILE *f = fopen(TEST_PATH, "w+b");
+    TEST_ASSERT_NOT_NULL(f);
+    TEST_ASSERT_EQUAL(0, parallel_compress(&xor_backend, input,
+                                           TEST_INPUT_SIZE, 0, f));
+
+    long size = ftell(f);
+    TEST_ASSERT_TRUE(size > 0);
+    unsigned char *payload = (unsigned char *)malloc((size_t)size);
+    TEST_ASSERT_NOT_NULL(payload);
+
+    rewind(f);
+    TEST_ASSERT_EQUAL((size_t)size, fread(payload, 1, (size_t)size, f));
+    fclose(f);
+
+    *out_size = (size_t)size;
+    return payload;
+}
+
+void setUp(void) {
+    input = (unsigned char *)malloc(TEST_INPUT_SIZE);
+    TEST_ASSERT_NOT_NULL(input);
+    for (size_t i = 0; i < TEST_INPUT_SIZE; i++) {
+        input[i] = (unsigned char)((i * 2654435761u) >> 17);
+    }
+}
+
+void tearDown(void) {
+    remove(TEST_PATH);
+    free(input);
+    input = NULL;
+}
+
+void test_workers_are_clamped(void) {
+    int workers = parallel_workers();
+    TEST_ASSERT_TRUE(workers >= 1);
+    TEST_ASSERT_TRUE(workers <= PARALLEL_MAX_WORKERS);
+}
+
+void test_small_inputs_skip_blocks(void) {
+    TEST_ASSERT_FALSE(parallel_use_blocks(&xor_backend, PARALLEL_MIN_SIZE - 1));
+}
+
+void test_blocks_are_written_in_order(void) {
+    size_t payload_size = 0;
+    unsigned char *payload = compress_to_memory(&payload_size);
+
+    size_t blocks = (TEST_INPUT_SIZE + PARALLEL_BLOCK_SIZE - 1) /
+                    PARALLEL_BLOCK_SIZE;
+    TEST_ASSERT_EQUAL(TEST_INPUT_SIZE + blocks * PARALLEL_BLOCK_PREAMBLE,
+                      payload_size);
+
+    // First record: full block, then the XORed bytes of the first block
+    TEST_ASSERT_EQUAL_HEX8(0x00, payload[0]);
+    TEST_ASSERT_EQUAL_HEX8(0x00, payload[1]);
+    TEST_ASSERT_EQUAL_HEX8(0x40, payload[2]);
+    TEST_ASSERT_EQUAL_HEX8(0x00, payload[3]);
+    TEST_ASSERT_EQUAL_HEX8(input[0] ^ 0x5A, payload[PARALLEL_BLOCK_PREAMBLE]);
+
+    // Last record holds the short tail
+    size_t last = (blocks - 1) * (PARALLEL_BLOCK_SIZE + PARALLEL_BLOCK_PREAMBLE);
+    TEST_ASSERT_EQUAL_HEX8(4321u & 0xFF, payload[last]);
+    TEST_ASSERT_EQUAL_HEX8(4321u >> 8, payload[last + 1]);
+
+    free(payload);
+}
+
+void test_round_trip(void) {
+    size_t payload_size = 0;
+    unsigned char *payload = compress_to_memory(&payload_size);
+
+    unsigned char *output = (unsigned char *)malloc(TEST_INPUT_SIZE);
+    TEST_ASSERT_NOT_NULL(output);
+    TEST_ASSERT_EQUAL(0, parallel_decompress(&xor_backend, payload,
+                                             payload_size, output,
+                                             TEST_INPUT_SIZE));
+    TEST_ASSERT_EQUAL_MEMORY(input, output, TEST_INPUT_SIZE);
+
+    free(output);
+    free(payload);
+}
+
+void test_size_mismatch_fails(void) {
+    size_t payload_size = 0;
+    unsigned char *payload = compress_to_memory(&payload_size);
+
+    unsigned char *output = (unsigned char *)malloc(TEST_INPUT_SIZE + 1);
+    TEST_ASSERT_NOT_NULL(output);
+    TEST_ASSERT_EQUAL(-1, parallel_decompress(&xor_backend, payload,
+                                              payload_size, output,
+                                              TEST_INPUT_SIZE + 1));
+
+    free(output);
+    free(payload);
+}
+
+void test_truncated_payload_fails(void) {
+    size_t payload_size = 0;
+    unsigned char *payload = compress_to_memory(&payload_size);
+
+    unsigned char *output = (unsigned char *)malloc(TEST_INPUT_SIZE);
+    TEST_ASSERT_NOT_NULL(output);
+    TEST_ASSERT_EQUAL(-1, parallel_decompress(&xor_backend, payload,
+                                              payload_size - 1, output,
+                                              TEST_INPUT_SIZE));
+
+    free(output);
+    free(payload);
+}
@@ -146,6 +146,164 @@ class TestBenchmarkFile:
         sig = inspect.signature(benchmark_file)
         # Should have parameters for file path and options
         assert len(sig.parameters) > 0
+        assert "max_workers" in sig.parameters
+
+    def test_benchmark_file_defaults_to_serial(self):
+        """Test that the parallel sweep is opt-in."""
+        import inspect
+
+        sig = inspect.signature(benchmark_file)
+        assert sig.parameters["max_workers"].default == 1
+
+    def test_benchmark_file_serial(self, sample_text_file, temp_dir):
+        """Test running the sweep serially in-process."""
+        results = benchmark_file(
+            sample_text_file,
+            algos=["zlib"],
+            strategies=["balanced"],
+            levels=[1, 6],
+            temp_dir=temp_dir,
+            max_workers=1,
+        )
+
+        assert [r.level for r in results] == [1, 6]
+        assert all(r.input_size == sample_text_file.stat().st_size for r in results)
+
+    def test_benchmark_file_serial_reads_source_once(
+        self, sample_text_file, temp_dir, monkeypatch
+    ):
+        """Test that a serial memory sweep reads the source a single time."""
+        from pathlib import Path
+
+        reads = []
+        read_bytes = Path.read_bytes
+
+        def counting_read_bytes(path):
+            reads.append(path)
+            return read_bytes(path)
+
+        monkeypatch.setattr(Path, "read_bytes", counting_read_bytes)
+        results = benchmark_file(
+            sample_text_file,
+            algos=["zlib", "zstd"],
+            strategies=["balanced"],
+            levels=[1, 6],
+            temp_dir=temp_dir,
+        )
+
+        assert len(results) == 4
+        assert reads == [sample_text_file]
+
+    def test_benchmark_file_parallel_preserves_order(self, sample_text_file, temp_dir):
+        """Test that parallel results come back in sweep order."""
+        results = benchmark_file(
+            sample_text_file,
+            algos=["zlib", "bzip2"],
+            strategies=["fast", "balanced"],
+            levels=[1],
+            temp_dir=temp_dir,
+            max_workers=2,
+        )
+
+        assert [(r.algo, r.strategy) for r in results] == [
+            ("zlib", "fast"),
+            ("zlib", "balanced"),
+            ("bzip2", "fast"),
+            ("bzip2", "balanced"),
+        ]
+
+    def test_benchmark_file_invalid_workers(self, sample_text_file):
+        """Test that a non-positive worker count is rejected."""
+        with pytest.raises(ValueError):
+            benchmark_file(sample_text_file, max_workers=0)
+
+    @pytest.mark.parametrize("mode", ["memory", "file"])
+    def test_benchmark_file_modes(self, sample_text_file, temp_dir, mode):
+        """Test benchmarking in both memory and file mode."""
+        results = benchmark_file(
+            sample_text_file,
+            algos=["zlib"],
+            strategies=["balanced"],
+            levels=[6],
+            temp_dir=temp_dir,
+            max_workers=1,
+            mode=mode,
+        )
+
+        assert len(results) == 1
+        assert results[0].compressed_size > 0
+        assert results[0].input_size == sample_text_file.stat().st_size
+
+    def test_benchmark_file_invalid_mode(self, sample_text_file):
+        """Test that an unknown mode is rejected."""
+        with pytest.raises(ValueError):
+            benchmark_file(sample_text_file, mode="disk")
+
+    def test_benchmark_file_skips_unsupported_levels(self, sample_text_file, temp_dir):
+        """Test that levels outside a backend's range are not run."""
+        results = benchmark_file(
+            sample_text_file,
+            algos=["zlib"],
+            strategies=["balanced"],
+            levels=[6, 42],
+            temp_dir=temp_dir,
+            max_workers=1,
+        )
+
+        assert [r.level for r in results] == [6]
+
+    def test_benchmark_file_level_ignored(self, sample_text_file, temp_dir):
+        """Test that codecs without levels only run at the default."""
+        results = benchmark_file(
+            sample_text_file,
+            algos=["snappy"],
+            strategies=["balanced"],
+            levels=[1, 6, 9],
+            temp_dir=temp_dir,
+            max_workers=1,
+        )
+
+        assert [r.level for r in results] == [None]
+
+    def test_benchmark_file_shares_aliased_strategies(self, sample_text_file, temp_dir):
+        """Test that strategies for the same algo and level share one run."""
+        results = benchmark_file(
+            sample_text_file,
+            algos=["zlib"],
+            strategies=["fast", "balanced", "max_ratio"],
+            levels=[1],
+            temp_dir=temp_dir,
+            max_workers=1,
+        )
+
+        assert [r.strategy for r in results] == ["fast", "balanced", "max_ratio"]
+        assert len({(r.compress_time, r.compressed_size) for r in results}) == 1
+
+
+class TestPlanRuns:
+    """Test pruning and de-duplication of the benchmark sweep."""
+
+    def test_plan_runs_maps_strategies_to_shared_runs(self):
+        """Test that each (algo, level) pair is measured once."""
+        from compresso.backend.benchmark import _plan_runs
+
+        combos, run_index = _plan_runs(["zlib"], ["fast", "balanced"], [1, 6])
+
+        assert combos == [
+            ("zlib", "fast", 1),
+            ("zlib", "fast", 6),
+            ("zlib", "balanced", 1),
+            ("zlib", "balanced", 6),
+        ]
+        assert run_index == [0, 1, 0, 1]
+
+    def test_plan_runs_keeps_unknown_algos(self):
+        """Test that unknown algorithms are not silently dropped."""
+        from compresso.backend.benchmark import _plan_runs
+
+        combos, _ = _plan_runs(["nope"], ["balanced"], [None, 99])
+
+        assert combos == [("nope", "balanced", None), ("nope", "balanced", 99)]
 
 
 class TestPrintResults:
@@ -209,3 +367,52 @@ class TestPrintResults:
         # Should contain both algo names
         assert "zlib" in captured.out.lower()
         assert "zstd" in captured.out.lower()
+
+    def test_print_results_fixed_width_rows(self, capsys):
+        """Test that every table line has the same width."""
+        results = [
+            BenchmarkResult(
+                algo="snappy",
+                strategy="max_ratio",
+                level=None,
+                compress_time=0.01,
+                decompress_time=0.005,
+                input_size=1000000,
+                compressed_size=600000,
+            ),
+            BenchmarkResult(
+                algo="lz4",
+                strategy="fast",
+                level=9,
+                compress_time=0.02,
+                decompress_time=0.004,
+                input_size=1000000,
+                compressed_size=550000,
+            ),
+        ]
+
+        print_results(results)
+        lines = capsys.readouterr().out.splitlines()
+
+        assert len(lines) == 6
+        assert len({len(line) for line in lines}) == 1
+        assert "auto" in lines[3]
+        assert "0.600" in lines[3]
+
+    def test_print_results_pretty(self, capsys):
+        """Test the tabulate rendering behind the pretty flag."""
+        result = BenchmarkResult(
+            algo="zlib",
+            strategy="balanced",
+            level=6,
+            compress_time=1.0,
+            decompress_time=0.5,
+            input_size=1000000,
+            compressed_size=500000,
+        )
+
+        print_results([result], pretty=True)
+        captured = capsys.readouterr()
+
+        assert "zlib" in captured.out
+        assert "Ratio (comp/orig)" in captured.out
@@ -22,6 +22,24 @@ class TestBackendCapabilities:
         assert cap.has_buffer is True
         assert cap.has_stream is True
 
+    def test_capabilities_level_defaults(self):
+        """Test that level fields default to a 0-9 range."""
+        cap = BackendCapabilities(name="zlib", id=1, has_buffer=True, has_stream=True)
+
+        assert (cap.min_level, cap.max_level, cap.level_ignored) == (0, 9, False)
+
+    def test_capabilities_accepts_level(self):
+        """Test level range checks."""
+        cap = BackendCapabilities(
+            name="lz4", id=5, has_buffer=True, has_stream=True, max_level=12
+        )
+
+        assert cap.accepts_level(None)
+        assert cap.accepts_level(0)
+        assert cap.accepts_level(12)
+        assert not cap.accepts_level(13)
+        assert not cap.accepts_level(-1)
+
     def test_capabilities_is_available(self):
         """Test is_available method."""
         cap = BackendCapabilities(name="test", id=99, has_buffer=True, has_stream=False)
@@ -87,6 +105,15 @@ class TestListCapabilities:
         # Should return the same list instance (cached)
         assert caps1 is caps2
 
+    def test_fields_match_core_struct(self):
+        """Test that the dataclass fields mirror the C struct sequence."""
+        from dataclasses import fields
+
+        from compresso import _core
+
+        names = tuple(f.name for f in fields(BackendCapabilities))
+        assert names == _core.BackendCapabilities.__match_args__
+
 
 class TestGetByName:
     """Test the get_by_name function."""
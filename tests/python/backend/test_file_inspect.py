@@ -6,6 +6,7 @@ from pathlib import Path
 from compresso.backend.file_inspect import (
     InspectResult,
     inspect,
+    inspect_many,
     COMP_HEADER_STRUCT,
 )
 from compresso import compress_file
@@ -161,6 +162,32 @@ class TestInspect:
         assert result.is_compresso is False
         assert result.header_ok is False
 
+    def test_inspect_parses_header_fields(self, temp_dir: Path):
+        """Test that each header field is read from the right offset."""
+        header_file = temp_dir / "header.comp"
+        header_file.write_bytes(
+            COMP_HEADER_STRUCT.pack(b"COMP", 1, 1, 255, 1, 123456789)
+        )
+
+        result = inspect(header_file)
+
+        assert result.is_compresso is True
+        assert result.version == 1
+        assert result.algo_id == 1
+        assert result.level is None
+        assert result.flags == 1
+        assert result.orig_size == 123456789
+
+    def test_inspect_unsupported_version(self, temp_dir: Path):
+        """Test inspecting a file with an unknown header version."""
+        header_file = temp_dir / "future.comp"
+        header_file.write_bytes(COMP_HEADER_STRUCT.pack(b"COMP", 2, 1, 6, 0, 10))
+
+        result = inspect(header_file)
+
+        assert result.header_ok is False
+        assert "version" in result.reason
+
     def test_inspect_result_fields_when_invalid(self, sample_text_file: Path):
         """Test that inspect result has None fields when file is invalid."""
         result = inspect(sample_text_file)
@@ -171,3 +198,89 @@ class TestInspect:
         assert result.level is None
         assert result.orig_size is None
         assert result.estimated_decomp_s is None
+
+
+class TestInspectMany:
+    """Test the inspect_many function."""
+
+    def test_inspect_many_directory(self, temp_dir: Path, sample_text_file: Path):
+        """Test that a directory scan inspects regular files only, sorted."""
+        (temp_dir / "a.comp").write_bytes(
+            COMP_HEADER_STRUCT.pack(b"COMP", 1, 1, 6, 0, 10)
+        )
+        (temp_dir / "subdir").mkdir()
+
+        results = inspect_many(temp_dir)
+
+        names = [r.path.name for r in results]
+        assert names == sorted(names)
+        assert "subdir" not in names
+        assert sample_text_file.name in names
+
+        by_name = {r.path.name: r for r in results}
+        assert by_name["a.comp"].is_compresso is True
+        assert by_name[sample_text_file.name].is_compresso is False
+
+    def test_inspect_many_iterable(self, temp_dir: Path, sample_text_file: Path):
+        """Test that an iterable is inspected in order, matching inspect()."""
+        missing = temp_dir / "missing.comp"
+        paths = [sample_text_file, str(missing), temp_dir]
+
+        results = inspect_many(paths)
+
+        assert [r.path for r in results] == [Path(p) for p in paths]
+        for result, path in zip(results, paths):
+            expected = inspect(path)
+            assert result.is_compresso == expected.is_compresso
+            assert result.reason == expected.reason
+
+    def test_inspect_many_empty_directory(self, temp_dir: Path):
+        """Test scanning an empty directory."""
+        empty = temp_dir / "empty"
+        empty.mkdir()
+
+        assert inspect_many(empty) == []
+
+    def test_inspect_many_skips_symlinks(self, temp_dir: Path, sample_text_file: Path):
+        """Test that a directory scan does not follow symlinks."""
+        link = temp_dir / "link.txt"
+        try:
+            link.symlink_to(sample_text_file)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        names = [r.path.name for r in inspect_many(temp_dir)]
+
+        assert sample_text_file.name in names
+        assert "link.txt" not in names
+
+    def test_inspect_many_single_file(self, temp_dir: Path, sample_text_file: Path):
+        """Test that a non-directory path is inspected as a single target."""
+        missing = temp_dir / "missing.comp"
+
+        [result] = inspect_many(sample_text_file)
+        assert result.path == sample_text_file
+        assert result.reason == inspect(sample_text_file).reason
+
+        [result] = inspect_many(str(missing))
+        assert result.path == missing
+        assert result.reason == "Not a file"
+
+    def test_inspect_many_unreadable_directory(self, temp_dir: Path):
+        """Test that a directory that cannot be listed is reported, not raised."""
+        import os
+
+        locked = temp_dir / "locked"
+        locked.mkdir()
+        locked.chmod(0)
+        try:
+            if os.access(locked, os.R_OK):
+                pytest.skip("permissions are not enforced for this user")
+
+            [result] = inspect_many(locked)
+        finally:
+            locked.chmod(0o700)
+
+        assert result.path == locked
+        assert result.is_compresso is False
+        assert result.reason.startswith("Failed to read directory")
@@ -132,6 +132,33 @@ class TestUpdateFromBenchmarks:
         config_dir = temp_dir / ".compresso"
         assert config_dir.exists()
 
+    def test_update_from_benchmarks_averages_and_merges(self, mock_speeds_file: Path):
+        """Test that new samples are averaged and weighted into old ones."""
+        from types import SimpleNamespace
+
+        from compresso.backend import speeds
+
+        speeds._SPEEDS_FILE.write_text(
+            json.dumps(
+                {"lz4": {"comp_mb_s": 100.0, "decomp_mb_s": 200.0, "samples": 2}}
+            ),
+            "utf-8",
+        )
+
+        update_from_benchmarks(
+            [
+                SimpleNamespace(algo="lz4", comp_mb_s=400.0, decomp_mb_s=500.0),
+                SimpleNamespace(algo="lz4", comp_mb_s=200.0, decomp_mb_s=300.0),
+                SimpleNamespace(algo="zstd", comp_mb_s=0.0, decomp_mb_s=300.0),
+            ]
+        )
+
+        data = json.loads(speeds._SPEEDS_FILE.read_text("utf-8"))
+        assert data["lz4"]["samples"] == 4
+        assert data["lz4"]["comp_mb_s"] == pytest.approx(200.0)
+        assert data["lz4"]["decomp_mb_s"] == pytest.approx(300.0)
+        assert "zstd" not in data
+
 
 class TestSpeedsFilePersistence:
     """Test speeds file reading and writing."""
@@ -170,3 +197,124 @@ class TestSpeedsFilePersistence:
             assert isinstance(algo_data["comp_mb_s"], (int, float))
             assert isinstance(algo_data["decomp_mb_s"], (int, float))
             assert isinstance(algo_data["samples"], int)
+
+
+class TestSpeedsCache:
+    """Test in-process caching of the speeds file."""
+
+    def test_cache_skips_reparse(self, mock_speeds_file: Path, monkeypatch):
+        """Test that an unchanged file is parsed only once."""
+        from compresso.backend import speeds
+
+        speeds._SPEEDS_FILE.write_text(
+            json.dumps(
+                {"zlib": {"comp_mb_s": 123.0, "decomp_mb_s": 456.0, "samples": 1}}
+            ),
+            "utf-8",
+        )
+
+        calls = []
+        original_parse = speeds._parse
+
+        def counting_parse(raw):
+            calls.append(raw)
+            return original_parse(raw)
+
+        monkeypatch.setattr(speeds, "_parse", counting_parse)
+
+        assert speeds.get_estimated_speeds("zlib", operation="compress") == 123.0
+        assert speeds.get_estimated_speeds("zlib", operation="decompress") == 456.0
+        assert len(calls) == 1
+
+    def test_cache_invalidated_on_change(self, mock_speeds_file: Path):
+        """Test that rewriting the file is picked up on the next lookup."""
+        from compresso.backend import speeds
+
+        speeds._SPEEDS_FILE.write_text(
+            json.dumps({"zlib": {"comp_mb_s": 1.0, "decomp_mb_s": 2.0, "samples": 1}}),
+            "utf-8",
+        )
+        assert speeds.get_estimated_speeds("zlib") == 2.0
+
+        speeds._SPEEDS_FILE.write_text(
+            json.dumps(
+                {"zlib": {"comp_mb_s": 10.0, "decomp_mb_s": 20.0, "samples": 1}}
+            ),
+            "utf-8",
+        )
+        assert speeds.get_estimated_speeds("zlib") == 20.0
+
+    def test_invalid_file_uses_defaults(self, mock_speeds_file: Path):
+        """Test that a corrupt speeds file falls back to defaults."""
+        from compresso.backend import speeds
+
+        speeds._SPEEDS_FILE.write_text("{not json", "utf-8")
+
+        assert (
+            speeds.get_estimated_speeds("zlib") == speeds._DEFAULT_DECOMP_MB_S["zlib"]
+        )
+
+    def test_learned_speeds_override_defaults(self, mock_speeds_file: Path):
+        """Test that learned speeds replace defaults only where positive."""
+        from compresso.backend import speeds
+
+        speeds._SPEEDS_FILE.write_text(
+            json.dumps({"lz4": {"comp_mb_s": 0.0, "decomp_mb_s": 42.0, "samples": 1}}),
+            "utf-8",
+        )
+
+        assert speeds.get_estimated_speeds("LZ4") == 42.0
+        assert (
+            speeds.get_estimated_speeds("lz4", operation="compress")
+            == speeds._DEFAULT_COMP_MB_S["lz4"]
+        )
+
+    def test_unknown_algo_and_operation(self, mock_speeds_file: Path):
+        """Test fallbacks for unknown algorithms and operations."""
+        from compresso.backend import speeds
+
+        assert speeds.get_estimated_speeds("nope") == 200.0
+        assert speeds.get_estimated_speeds(
+            "zstd", operation="other"
+        ) == speeds.get_estimated_speeds("zstd", operation="decompress")
+
+    def test_update_writes_through_cache(self, mock_speeds_file: Path, monkeypatch):
+        """Test that lookups after an update do not re-parse the file."""
+        from types import SimpleNamespace
+
+        from compresso.backend import speeds
+
+        update_from_benchmarks(
+            [SimpleNamespace(algo="zlib", comp_mb_s=11.0, decomp_mb_s=22.0)]
+        )
+
+        def failing_parse(raw):
+            raise AssertionError("speeds file should not be re-parsed")
+
+        monkeypatch.setattr(speeds, "_parse", failing_parse)
+
+        assert speeds.get_estimated_speeds("zlib", operation="compress") == 11.0
+        assert speeds.get_estimated_speeds("zlib") == 22.0
+
+    def test_refresh_forces_reparse(self, mock_speeds_file: Path, monkeypatch):
+        """Test that _refresh() drops the cached data."""
+        from compresso.backend import speeds
+
+        speeds._SPEEDS_FILE.write_text(
+            json.dumps({"zlib": {"comp_mb_s": 1.0, "decomp_mb_s": 2.0, "samples": 1}}),
+            "utf-8",
+        )
+        assert speeds.get_estimated_speeds("zlib") == 2.0
+
+        calls = []
+        original_parse = speeds._parse
+
+        def counting_parse(raw):
+            calls.append(raw)
+            return original_parse(raw)
+
+        monkeypatch.setattr(speeds, "_parse", counting_parse)
+
+        speeds._refresh()
+        assert speeds.get_estimated_speeds("zlib") == 2.0
+        assert len(calls) == 1
@@ -99,6 +99,106 @@ class TestCompressionPlan:
         assert plan.reason_if_unavailable is not None
 
 
+class TestPlanCompression:
+    """Test automatic backend selection in plan_compression."""
+
+    def test_strategy_lookup_is_cached(self, sample_text_file: Path):
+        """Test that repeated plans reuse the cached strategy lookup."""
+        from compresso.frontend.api import (
+            _choose_backend_for_strategy,
+            plan_compression,
+        )
+
+        _choose_backend_for_strategy.cache_clear()
+        opts = CompressionOptions(strategy="fast")
+
+        first = plan_compression(sample_text_file, options=opts)
+        second = plan_compression(sample_text_file, options=opts)
+
+        assert first.backend_name == second.backend_name
+        info = _choose_backend_for_strategy.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_strategy_is_case_insensitive(self, sample_text_file: Path):
+        """Test that strategy names are matched regardless of case."""
+        from compresso.frontend.api import plan_compression
+
+        upper = plan_compression(
+            sample_text_file, options=CompressionOptions(strategy="MAX_RATIO")
+        )
+        lower = plan_compression(
+            sample_text_file, options=CompressionOptions(strategy="max_ratio")
+        )
+
+        assert upper.backend_name == lower.backend_name
+
+    def test_job_runs_the_planned_strategy(
+        self, sample_text_file: Path, temp_dir: Path
+    ):
+        """Test that the plan carries the normalised strategy into run()."""
+        from compresso.frontend.api import plan_compression
+
+        plan = plan_compression(
+            sample_text_file,
+            temp_dir / "out.comp",
+            CompressionOptions(strategy="FAST"),
+        )
+
+        assert plan.options.strategy == "fast"
+        assert plan.backend_name == (
+            plan_compression(
+                sample_text_file, options=CompressionOptions(strategy="fast")
+            ).backend_name
+        )
+        result = CompressionJob(plan).run()
+        assert result.ok, result.error
+
+    @pytest.mark.parametrize("name", ["missing.txt", "subdir"])
+    def test_non_regular_source(self, temp_dir: Path, name: str):
+        """Test that missing files and directories cannot be compressed."""
+        from compresso.frontend.api import plan_compression
+
+        (temp_dir / "subdir").mkdir()
+        plan = plan_compression(temp_dir / name)
+
+        assert plan.can_compress is False
+        assert plan.input_size == 0
+        assert "does not exist" in (plan.reason_if_unavailable or "")
+
+    def test_default_dest_appends_comp(self, sample_text_file: Path):
+        """Test that the default destination keeps the full source name."""
+        from compresso.frontend.api import plan_compression
+
+        plan = plan_compression(sample_text_file)
+
+        assert plan.dest == sample_text_file.parent / (sample_text_file.name + ".comp")
+
+    def test_unknown_algo_is_unavailable(self, sample_text_file: Path):
+        """Test that an algorithm missing from this build is rejected early."""
+        from compresso.frontend.api import plan_compression
+
+        plan = plan_compression(
+            sample_text_file, options=CompressionOptions(algo="NoSuchCodec")
+        )
+
+        assert plan.can_compress is False
+        assert plan.backend_name is None
+        assert plan.estimated_seconds is None
+        assert "nosuchcodec" in (plan.reason_if_unavailable or "")
+
+    def test_known_algo_is_planned(self, sample_text_file: Path):
+        """Test that a compiled-in algorithm passes validation."""
+        from compresso.frontend.api import plan_compression
+
+        plan = plan_compression(
+            sample_text_file, options=CompressionOptions(algo="ZLIB")
+        )
+
+        assert plan.can_compress is True
+        assert plan.backend_name == "zlib"
+
+
 class TestDecompressionPlan:
     """Test the DecompressionPlan dataclass."""
 
@@ -149,6 +249,18 @@ class TestCompressionJob:
         # Check the class exists and is callable
         assert callable(CompressionJob)
 
+    def test_job_and_result_are_slotted(self):
+        """Test that jobs and results carry no per-instance __dict__."""
+        from compresso.frontend._job import JobResult
+
+        result = JobResult(ok=True, error=None, plan=None)
+
+        assert CompressionJob.__slots__ == ("plan",)
+        assert DecompressionJob.__slots__ == ("plan",)
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            result.ok = False  # type: ignore[misc]
+
 
 class TestDecompressionJob:
     """Test the DecompressionJob class."""
@@ -166,6 +278,36 @@ class TestDecompressionJob:
 class TestAPIIntegration:
     """Integration tests for the API module."""
 
+    def test_package_exports_resolve_lazily(self):
+        """Test that frontend package exports resolve to the api objects."""
+        from compresso import frontend
+
+        assert frontend.CompressionJob is CompressionJob
+        assert "plan_archive" in dir(frontend)
+        with pytest.raises(AttributeError):
+            frontend.not_an_export  # noqa: B018
+
+    def test_frontend_import_is_lazy(self):
+        """Test that importing the frontend package loads no API module or _core."""
+        import os
+        import subprocess
+        import sys
+
+        src_dir = Path(__file__).resolve().parents[3] / "src"
+        code = (
+            "import sys; import compresso.frontend; "
+            "loaded = [m for m in ('compresso._core', 'compresso.frontend.api', "
+            "'compresso.frontend.archive_api') if m in sys.modules]; "
+            "assert not loaded, loaded; "
+            "from compresso.frontend import JobResult; "
+            "assert 'compresso.frontend.api' not in sys.modules"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            env={**os.environ, "PYTHONPATH": str(src_dir)},
+        )
+
     def test_all_exports_exist(self):
         """Test that all expected exports exist."""
         from compresso.frontend import api
@@ -196,3 +338,39 @@ class TestAPIIntegration:
         assert plan.options.algo == "zlib"
         assert plan.options.strategy == "balanced"
         assert plan.options.level == 6
+
+
+class TestJobRun:
+    """Test error handling in job run() methods."""
+
+    def test_progress_interrupt_propagates(
+        self, sample_text_file: Path, temp_dir: Path
+    ):
+        """Test that KeyboardInterrupt from a callback is not swallowed."""
+        job = CompressionJob.from_file(
+            sample_text_file,
+            temp_dir / "out.comp",
+            CompressionOptions(algo="zlib"),
+        )
+
+        def interrupt(fraction: float, done: int, total: int) -> None:
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            job.run(progress=interrupt)
+
+    def test_progress_error_is_reported(self, sample_text_file: Path, temp_dir: Path):
+        """Test that an ordinary exception becomes a failed JobResult."""
+        job = CompressionJob.from_file(
+            sample_text_file,
+            temp_dir / "out.comp",
+            CompressionOptions(algo="zlib"),
+        )
+
+        def fail(fraction: float, done: int, total: int) -> None:
+            raise ValueError("boom")
+
+        result = job.run(progress=fail)
+
+        assert result.ok is False
+        assert isinstance(result.error, ValueError)
@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from compresso.frontend._job import JobResult
 from compresso.frontend.archive_api import (
     ArchiveEntry,
@@ -92,6 +94,16 @@ class TestArchiveJob:
         assert result.ok is False
         assert result.error is not None
 
+    def test_job_and_plan_are_slotted(self, sample_text_file: Path, temp_dir: Path):
+        """Jobs and plans carry no per-instance __dict__."""
+        job = ArchiveJob.from_paths([sample_text_file], temp_dir / "out.tar.zst")
+
+        assert ArchiveJob.__slots__ == ("plan",)
+        assert ExtractJob.__slots__ == ("plan",)
+        assert not hasattr(job, "__dict__")
+        assert not hasattr(job.plan, "__dict__")
+        assert not hasattr(ExtractJob.from_archive(temp_dir / "x.tar").plan, "__dict__")
+
 
 class TestExtractJob:
     """Test the ExtractJob class."""
@@ -167,3 +179,80 @@ class TestArchiveRoundTrip:
         assert (
             temp_dir / "out" / "tree" / "deep" / "leaf.txt"
         ).read_bytes() == b"leaf content"
+
+
+class TestArchiveJobRun:
+    """Test error handling and progress reporting in archive job run()."""
+
+    @staticmethod
+    def _archive(temp_dir: Path, monkeypatch) -> Path:
+        """Create a small archive from a relative source and return its path."""
+        monkeypatch.chdir(temp_dir)
+        src = Path("data.txt")
+        src.write_bytes(b"hello compresso" * 100)
+        archive_path = Path("bundle.tar.zst")
+        assert ArchiveJob.from_paths([src], archive_path).run().ok
+        return archive_path
+
+    def test_archive_interrupt_propagates(self, temp_dir: Path, monkeypatch):
+        """KeyboardInterrupt from a callback escapes ArchiveJob.run()."""
+        monkeypatch.chdir(temp_dir)
+        src = Path("data.txt")
+        src.write_bytes(b"data")
+        job = ArchiveJob.from_paths([src], Path("out.tar.zst"))
+
+        def interrupt(fraction: float, done: int, total: int) -> None:
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            job.run(progress=interrupt)
+
+    def test_extract_interrupt_propagates(self, temp_dir: Path, monkeypatch):
+        """KeyboardInterrupt from a callback escapes ExtractJob.run()."""
+        job = ExtractJob.from_archive(
+            self._archive(temp_dir, monkeypatch), temp_dir / "restore"
+        )
+
+        def interrupt(fraction: float, done: int, total: int) -> None:
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            job.run(progress=interrupt)
+
+    def test_extract_progress_error_is_reported(self, temp_dir: Path, monkeypatch):
+        """An ordinary exception from a callback becomes a failed JobResult."""
+        job = ExtractJob.from_archive(
+            self._archive(temp_dir, monkeypatch), temp_dir / "restore"
+        )
+
+        def fail(fraction: float, done: int, total: int) -> None:
+            raise ValueError("boom")
+
+        result = job.run(progress=fail)
+
+        assert result.ok is False
+        assert isinstance(result.error, ValueError)
+
+    def test_falsy_progress_callback_is_called(self, temp_dir: Path, monkeypatch):
+        """A callback is used whenever it is not None, even if it is falsy."""
+        archive_path = self._archive(temp_dir, monkeypatch)
+
+        class Recorder(list):
+            def __call__(self, fraction: float, done: int, total: int) -> None:
+                self.append(fraction)
+
+        archive_calls = Recorder()
+        assert not archive_calls
+        assert (
+            ArchiveJob.from_paths([Path("data.txt")], Path("again.tar.zst"))
+            .run(progress=archive_calls)
+            .ok
+        )
+        assert archive_calls == [0.0, 1.0]
+
+        extract_calls = Recorder()
+        result = ExtractJob.from_archive(archive_path, temp_dir / "restore").run(
+            progress=extract_calls
+        )
+        assert result.ok, result.error
+        assert extract_calls == [0.0, 1.0]
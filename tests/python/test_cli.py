@@ -2,7 +2,7 @@
 
 import pytest
 
-from compresso.cli import format_size, format_time
+from compresso.cli import format_size, format_time, parse_csv, parse_levels
 
 
 class TestFormatters:
@@ -44,6 +44,44 @@ class TestFormatters:
         assert expected_pattern in result
 
 
+class TestOptionParsers:
+    """Test the comma-separated option parsers."""
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (None, []),
+            ("all", []),
+            ("ALL", []),
+            ("zstd", ["zstd"]),
+            (" zstd , lz4,,", ["zstd", "lz4"]),
+        ],
+    )
+    def test_parse_csv(self, value: str | None, expected: list[str]):
+        """Test splitting of list options."""
+        assert parse_csv(value) == expected
+
+    def test_parse_levels(self):
+        """Test that integers and auto/default entries are parsed."""
+        assert parse_levels("1, auto,9,,default") == [1, None, 9, None]
+        assert parse_levels(None) == []
+
+    def test_parse_levels_invalid(self):
+        """Test that a bad entry raises ValueError naming it."""
+        with pytest.raises(ValueError, match="fast"):
+            parse_levels("1,fast")
+        with pytest.raises(ValueError, match="--3"):
+            parse_levels("--3")
+
+    def test_parse_levels_negative(self):
+        """Test that a leading minus sign is accepted on numeric levels."""
+        assert parse_levels("-1,AUTO") == [-1, None]
+
+    def test_parse_levels_explicit_plus(self):
+        """Test that a leading plus sign is accepted on numeric levels."""
+        assert parse_levels("+3, 5") == [3, 5]
+
+
 class TestCLIModule:
     """Test the CLI module structure."""
 
@@ -67,3 +105,36 @@ class TestCLIModule:
 
         assert hasattr(cli, "decompress")
         assert callable(cli.decompress)
+
+    def test_benchmark_module_is_lazy(self):
+        """Test that importing the CLI does not import the benchmark module."""
+        import os
+        import subprocess
+        import sys
+        from pathlib import Path
+
+        src_dir = Path(__file__).resolve().parents[2] / "src"
+        code = (
+            "import sys, compresso.cli, compresso; "
+            "assert 'compresso.backend.benchmark' not in sys.modules; "
+            "assert callable(compresso.benchmark_file)"
+        )
+        subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            env={**os.environ, "PYTHONPATH": str(src_dir)},
+        )
+
+    def test_benchmark_skips_unavailable_algorithms(self, sample_text_file):
+        """Test that unknown algorithms are dropped before the sweep runs."""
+        from typer.testing import CliRunner
+
+        from compresso.cli import app
+
+        result = CliRunner().invoke(
+            app, ["benchmark", str(sample_text_file), "--algos", "nosuchcodec"]
+        )
+
+        assert result.exit_code == 1
+        assert "nosuchcodec" in result.output
+        assert "No available algorithms" in result.output
@@ -1,16 +1,24 @@
 """Tests for the core compression/decompression functionality."""
 
-import pytest
 from pathlib import Path
 
+import pytest
+
 from compresso import (
-    compress_file,
-    decompress_file,
+    BackendError,
     Error,
     HeaderError,
-    BackendError,
+    compress_bytes,
+    compress_file,
+    decompress_bytes,
+    decompress_file,
+)
+from compresso._core import (
+    get_capabilities,
+    get_max_threads,
+    release_thread_contexts,
+    set_max_threads,
 )
-from compresso._core import get_capabilities
 
 
 class TestCoreExceptions:
@@ -43,10 +51,10 @@ class TestCoreExceptions:
 class TestCapabilities:
     """Test the get_capabilities function."""
 
-    def test_get_capabilities_returns_list(self):
-        """Test that get_capabilities returns a list."""
+    def test_get_capabilities_returns_tuple(self):
+        """Test that get_capabilities returns a tuple."""
         caps = get_capabilities()
-        assert isinstance(caps, list)
+        assert isinstance(caps, tuple)
 
     def test_get_capabilities_not_empty(self):
         """Test that capabilities list is not empty."""
@@ -59,6 +67,23 @@ class TestCapabilities:
         for cap in caps:
             # Each capability should be iterable
             assert hasattr(cap, "__iter__")
+            assert isinstance(cap.name, str)
+            assert isinstance(cap.id, int)
+            assert isinstance(cap.has_buffer, bool)
+            assert isinstance(cap.has_stream, bool)
+            assert isinstance(cap.min_level, int)
+            assert isinstance(cap.max_level, int)
+            assert isinstance(cap.level_ignored, bool)
+            assert cap.min_level <= cap.max_level
+            assert tuple(cap) == (
+                cap.name,
+                cap.id,
+                cap.has_buffer,
+                cap.has_stream,
+                cap.min_level,
+                cap.max_level,
+                cap.level_ignored,
+            )
 
     def test_capabilities_have_known_algos(self):
         """Test that common algorithms are present."""
@@ -208,6 +233,40 @@ class TestDecompressFile:
         with pytest.raises((Error, HeaderError)):
             decompress_file(str(sample_text_file), str(output_file), "")
 
+    def test_decompress_corrupted_large_file(self, temp_dir: Path):
+        """Test that a failed decode into a mapped output leaves it empty."""
+        source = temp_dir / "large.bin"
+        compressed_file = temp_dir / "large.comp"
+        output_file = temp_dir / "large.out"
+
+        # Above the size where the output is decoded into a file mapping
+        source.write_bytes(bytes(range(256)) * (16 * 1024))
+        compress_file(str(source), str(compressed_file), "zstd", "balanced", 3)
+
+        frame = compressed_file.read_bytes()
+        compressed_file.write_bytes(frame[: len(frame) // 2])
+
+        with pytest.raises(Error):
+            decompress_file(str(compressed_file), str(output_file), "")
+
+        assert output_file.stat().st_size == 0
+
+    @pytest.mark.parametrize("algo", ["zlib", "bzip2", "lzma"])
+    def test_large_file_streams_for_staging_codecs(self, temp_dir: Path, algo: str):
+        """Test that codecs without map_io keep streaming large files."""
+        source = temp_dir / "large.bin"
+        compressed_file = temp_dir / "large.comp"
+        output_file = temp_dir / "large.out"
+
+        source.write_bytes(bytes(range(256)) * (16 * 1024))
+        compress_file(str(source), str(compressed_file), algo, "balanced", 1)
+
+        flags = compressed_file.read_bytes()[7]
+        assert flags == 0  # neither the one-shot nor the block format
+
+        decompress_file(str(compressed_file), str(output_file), "")
+        assert output_file.read_bytes() == source.read_bytes()
+
     def test_round_trip_binary_file(self, sample_binary_file: Path, temp_dir: Path):
         """Test compression and decompression of binary data."""
         compressed_file = temp_dir / "compressed.comp"
@@ -238,3 +297,122 @@ class TestDecompressFile:
         decompress_file(str(compressed_file), str(decompressed_file), "")
 
         assert decompressed_file.read_text() == original_content
+
+
+class TestBufferRoundTrip:
+    """Test the in-memory compress_bytes/decompress_bytes functions."""
+
+    @pytest.mark.parametrize("algo", ["zlib", "bzip2", "lzma", "zstd", "lz4", "snappy"])
+    def test_round_trip_bytes(self, sample_binary_file: Path, algo: str):
+        """Test that a buffer survives an in-memory round trip."""
+        data = sample_binary_file.read_bytes()
+
+        compressed = compress_bytes(data, algo=algo, strategy="balanced", level=6)
+
+        assert compressed[:4] == b"COMP"
+        assert decompress_bytes(compressed) == data
+
+    def test_round_trip_empty_bytes(self):
+        """Test that an empty buffer round trips."""
+        assert decompress_bytes(compress_bytes(b"", algo="zlib")) == b""
+
+    def test_decompress_bytes_invalid(self):
+        """Test that data without a Compresso header is rejected."""
+        with pytest.raises((Error, HeaderError)):
+            decompress_bytes(b"not a compresso frame")
+
+    def test_decompress_bytes_rejects_stream_frame(
+        self, sample_text_file: Path, temp_dir: Path
+    ):
+        """Test that a frame written by compress_file is not buffer-decodable."""
+        compressed_file = temp_dir / "compressed.comp"
+        compress_file(
+            str(sample_text_file), str(compressed_file), "zlib", "balanced", 6
+        )
+
+        with pytest.raises(HeaderError):
+            decompress_bytes(compressed_file.read_bytes())
+
+    def test_compress_bytes_unknown_algo(self):
+        """Test that an unknown algorithm is rejected."""
+        with pytest.raises(ValueError):
+            compress_bytes(b"data", algo="nope")
+
+
+class TestThreadContexts:
+    """Test reuse and release of per-thread codec contexts."""
+
+    @pytest.mark.parametrize("algo", ["zstd", "lz4"])
+    def test_round_trip_after_release(self, sample_binary_file: Path, algo: str):
+        """Test that contexts are recreated after being released."""
+        data = sample_binary_file.read_bytes()
+
+        first = compress_bytes(data, algo=algo, level=3)
+        assert decompress_bytes(first) == data
+
+        release_thread_contexts()
+        release_thread_contexts()  # releasing twice is harmless
+
+        second = compress_bytes(data, algo=algo, level=3)
+        assert second == first
+        assert decompress_bytes(second) == data
+
+    def test_reused_context_does_not_leak_level(self, sample_text_file: Path):
+        """Test that a reused context starts each call from fresh parameters."""
+        data = sample_text_file.read_bytes()
+
+        low = compress_bytes(data, algo="zstd", level=1)
+        compress_bytes(data, algo="zstd", level=19)
+
+        assert compress_bytes(data, algo="zstd", level=1) == low
+
+
+class TestThreadLimit:
+    """Test the process-wide cap on codec threads."""
+
+    def test_set_and_restore(self):
+        """Test that the cap can be lowered and restored to the CPU count."""
+        default = get_max_threads()
+        try:
+            set_max_threads(1)
+            assert get_max_threads() == 1
+
+            set_max_threads(0)
+            assert get_max_threads() >= 1
+        finally:
+            set_max_threads(default)
+
+    @pytest.mark.parametrize("algo", ["zstd", "lz4"])
+    def test_single_thread_round_trip(self, algo: str):
+        """Test that large inputs still round-trip with codecs held to one thread."""
+        data = bytes(range(256)) * (40 * 1024)  # ~10 MiB, past the parallel cutoff
+        default = get_max_threads()
+        try:
+            set_max_threads(1)
+            assert decompress_bytes(compress_bytes(data, algo=algo)) == data
+        finally:
+            set_max_threads(default)
+
+
+class TestConcurrentCalls:
+    """Test that the file API can be driven from several Python threads."""
+
+    @pytest.mark.parametrize("algo", ["zlib", "bzip2", "lzma", "zstd", "lz4", "snappy"])
+    def test_threaded_round_trips(
+        self, sample_binary_file: Path, temp_dir: Path, algo: str
+    ):
+        """Test that concurrent compress/decompress calls stay independent."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        def round_trip(i: int) -> bytes:
+            comp = temp_dir / f"{algo}_{i}.comp"
+            out = temp_dir / f"{algo}_{i}.out"
+            compress_file(str(sample_binary_file), str(comp), algo, "balanced", 6)
+            decompress_file(str(comp), str(out), algo)
+            return out.read_bytes()
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outputs = list(executor.map(round_trip, range(8)))
+
+        expected = sample_binary_file.read_bytes()
+        assert all(output == expected for output in outputs)